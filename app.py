@@ -9,10 +9,14 @@ Description:
 
 """
 
+from logging import Logger
+
+import click
 from flask import Flask
 from flask_cors import CORS
 from flask_migrate import Migrate
 from flask_restx import Api, Resource
+from redis.exceptions import RedisError
 
 from flask_boilerplate.apis.role import ns_role
 from flask_boilerplate.apis.user import ns_user
@@ -33,6 +37,8 @@ from flask_boilerplate.core.config import (
     SWAGGER_SECURITY,
     SWAGGER_UI_DOC_EXPANSION,
 )
+from flask_boilerplate.core.hashing import password_hasher
+from flask_boilerplate.core.logger import AppLogger
 from flask_boilerplate.core.middlewares import ExceptionHandler
 from flask_boilerplate.database.base import db
 from flask_boilerplate.database.initialize_database import (
@@ -40,6 +46,11 @@ from flask_boilerplate.database.initialize_database import (
     add_roles,
     add_admin_permissions,
 )
+from flask_boilerplate.services.entity_cache import entity_cache
+from flask_boilerplate.services.redis import redis
+from scripts.update_redis import warm_permission_cache
+
+logger: Logger = AppLogger().get_logger()
 
 # Initialize Flask application instance
 app = Flask(__name__)
@@ -113,15 +124,105 @@ class Home(Resource):
         return {"success": True, "data": f"Welcome to {PROJECT_TITLE}"}
 
 
+# Health Resource
+@api.route("/health")
+class Health(Resource):
+    """
+    Health Resource
+
+    Description:
+        - This class is used to create health resource.
+
+    """
+
+    def get(self) -> dict[str, bool | dict]:
+        """
+        Health Resource
+
+        Description:
+            - This function is used to report Redis circuit state and
+            connection pool usage of the worker serving the request.
+
+        Args:
+            - `None`
+
+        Returns:
+            - `health (dict)`: Redis circuit state and pool usage.
+
+        """
+
+        return {
+            "success": True,
+            "data": {
+                "redis_circuit": redis.breaker.state,
+                "redis_pool": redis.pool_stats(),
+            },
+        }
+
+
+# Warm permission cache command
+@app.cli.command("warm-permission-cache")
+def warm_permission_cache_command() -> None:
+    """
+    Warm Permission Cache Command
+
+    Description:
+        - This command writes permissions of every role to Redis, it can be
+        run with `flask --app app warm-permission-cache`.
+
+    Returns:
+        - `None`
+
+    """
+
+    roles: int = warm_permission_cache()
+    click.echo(f"Permission cache warmed with {roles} roles")
+
+
+# Entity cache statistics command
+@app.cli.command("entity-cache-stats")
+def entity_cache_stats_command() -> None:
+    """
+    Entity Cache Statistics Command
+
+    Description:
+        - This command prints lookups, hits, misses and hit ratio of entity
+        cache by table, it can be run with
+        `flask --app app entity-cache-stats`.
+
+    Returns:
+        - `None`
+
+    """
+
+    for table, stats in entity_cache.stats().items():
+        click.echo(
+            f"{table}: {stats['lookups']} lookups, {stats['hits']} hits, "
+            f"{stats['misses']} misses, {stats['hit_ratio']:.1%} hit ratio"
+        )
+
+
 # Register namespaces
 api.add_namespace(ns_role)
 api.add_namespace(ns_user)
 api.add_namespace(ns_permission)
 api.add_namespace(ns_role_permission)
 
+# Calibrate password hash cost and fork hashing workers while the process
+# runs no other threads
+password_hasher.calibrate()
+password_hasher.start()
+
 add_permissions()
 add_roles()
 add_admin_permissions()
+
+# Roles are rebuilt lazily from database when Redis can't be warmed
+try:
+    warm_permission_cache()
+except RedisError as ex:
+    logger.warning(f"Permission cache not warmed: {ex}")
+
 # Main function to run application
 if __name__ == "__main__":
     app.run(debug=True, host="0.0.0.0", port=5000)
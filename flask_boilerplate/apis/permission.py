@@ -6,13 +6,29 @@ Description:
 
 """
 
+from http import HTTPStatus
+
 from flask_restx import Resource
 
+from flask_boilerplate.constants.base import IF_MATCH_DESCRIPTION
+from flask_boilerplate.core.etag import if_match_versions
+from flask_boilerplate.database.unit_of_work import UnitOfWork, after_commit
 from flask_boilerplate.decorator.authorization import auth
+from flask_boilerplate.decorator.fields import marshal_with_fields
 from flask_boilerplate.namespaces.permission import ns_permission
 from flask_boilerplate.responses.permission import PermissionResponse
+from flask_boilerplate.schemas.pagination import (
+    fields_parser,
+    pagination_parser,
+)
 from flask_boilerplate.schemas.permission import (
+    permission_bulk_create_read_schema,
+    permission_bulk_delete_read_schema,
+    permission_bulk_read_schema,
+    permission_bulk_selection_schema,
+    permission_bulk_update_schema,
     permission_create_schema,
+    permission_read_all_schema,
     permission_read_schema,
     permission_update_schema,
 )
@@ -57,21 +73,29 @@ class PermissionListResource(Resource):
 
         """
 
-        permission = PermissionService().create(entity=ns_permission.payload)
+        permission = PermissionService().create_row(
+            entity=ns_permission.payload
+        )
 
         return PermissionResponse.create_response(data=permission)
 
     @auth(PermissionPermissions.GET_ALL_PERMISSION.value)
-    @ns_permission.marshal_with(permission_read_schema, skip_none=True)
+    @ns_permission.expect(pagination_parser)
+    @marshal_with_fields(
+        ns_permission, permission_read_all_schema, skip_none=True
+    )
     def get(self):
         """
         Get all Permissions
 
         Description:
-            - This function is used to get all permissions.
+            - This function is used to get a page of permissions ordered by
+            ID.
 
         Args:
-            - `None`
+            - `limit (int)`: Number of permissions. **(Optional)**
+            - `after (str)`: Cursor of previous page. **(Optional)**
+            - `fields (str)`: Comma separated fields to return. **(Optional)**
 
         Returns:
         Get all permissions with following information:
@@ -80,13 +104,138 @@ class PermissionListResource(Resource):
             - `permission_description (str)`: Description of permission.
             - `created_at (str)`: Datetime of permission creation.
             - `updated_at (str)`: Datetime of permission update.
+            - `next_cursor (str)`: Cursor of next page, `null` on last page.
 
         """
 
-        permissions = PermissionService().read_all()
-        return PermissionResponse.success(
-            data=permissions, total_rows=len(permissions)
+        args = pagination_parser.parse_args()
+
+        permissions, next_cursor = PermissionService().read_rows_page(
+            limit=args["limit"], after=args["after"], fields=args["fields"]
         )
+        return PermissionResponse.read_all_response(
+            data=permissions, next_cursor=next_cursor
+        )
+
+
+# Resource to handle adding, updating and deleting permissions in bulk
+@ns_permission.route("/bulk")
+class PermissionBulkResource(Resource):
+    """
+    Permission Bulk Resource
+
+    Description:
+        - This class is used to handle adding, updating and deleting
+        permissions in bulk.
+
+    """
+
+    @auth(PermissionPermissions.CREATE_PERMISSION.value)
+    @ns_permission.expect([permission_create_schema], validate=True)
+    @ns_permission.marshal_with(
+        permission_bulk_create_read_schema, code=HTTPStatus.CREATED
+    )
+    def post(self):
+        """
+        Add Permissions
+
+        Description:
+            - This function is used to add a list of permissions in one
+            request.
+            - Permissions that can't be created are reported by their
+            position in the list while the others are created, in that case
+            response status is multi-status.
+
+        Args:
+        List of permission details, each with the fields of
+        `Add Permission`.
+
+        Returns:
+        Created permissions and errors with following information:
+            - `data (list)`: Created permissions, as returned by
+            `Add Permission`.
+            - `errors (list)`: `index` and `message` of rejected permissions.
+
+        """
+
+        permissions, errors = PermissionService().create_multiple(
+            entities=ns_permission.payload
+        )
+
+        return PermissionResponse.bulk_create_response(
+            data=permissions, errors=errors
+        )
+
+    @auth(PermissionPermissions.UPDATE_PERMISSION.value)
+    @ns_permission.expect(permission_bulk_update_schema, validate=True)
+    @ns_permission.marshal_with(
+        fields=permission_bulk_read_schema, code=HTTPStatus.ACCEPTED
+    )
+    def patch(self):
+        """
+        Update Permissions
+
+        Description:
+            - This function is used to update every permission selected by IDs
+            and filter with a single statement.
+
+        Args:
+            - `ids (list[int])`: IDs of permissions. **(Optional)**
+            - `filter (dict)`: Field values to match, a list matches any of
+            its values. **(Optional)**
+            - `data (dict)`: Fields to update, unique fields can't be
+            updated in bulk. **(Required)**
+
+        Returns:
+            - `data (list)`: Updated permissions.
+
+        """
+
+        payload = ns_permission.payload
+
+        permissions = PermissionService().update_multiple(
+            entity=payload["data"],
+            entity_ids=payload.get("ids"),
+            filters=payload.get("filter"),
+        )
+
+        return PermissionResponse.bulk_update_response(data=permissions)
+
+    @auth(PermissionPermissions.DELETE_PERMISSION.value)
+    @UnitOfWork()
+    @ns_permission.expect(permission_bulk_selection_schema, validate=True)
+    @ns_permission.marshal_with(fields=permission_bulk_delete_read_schema)
+    def delete(self):
+        """
+        Delete Permissions
+
+        Description:
+            - This function is used to delete every permission selected by IDs
+            and filter with a single statement.
+
+        Args:
+            - `ids (list[int])`: IDs of permissions. **(Optional)**
+            - `filter (dict)`: Field values to match, a list matches any of
+            its values. **(Optional)**
+
+        Returns:
+            - `data (list[int])`: IDs of deleted permissions.
+
+        """
+
+        payload = ns_permission.payload
+
+        permissions = PermissionService().delete_multiple(
+            entity_ids=payload.get("ids"), filters=payload.get("filter")
+        )
+
+        if permissions:
+            after_commit(
+                remove_permission_from_roles,
+                *(permission["permission_name"] for permission in permissions),
+            )
+
+        return PermissionResponse.bulk_delete_response(data=permissions)
 
 
 # Resource to handle get, update, delete single permission
@@ -101,7 +250,8 @@ class PermissionResource(Resource):
     """
 
     @auth(PermissionPermissions.GET_PERMISSION.value)
-    @ns_permission.marshal_with(permission_read_schema)
+    @ns_permission.expect(fields_parser)
+    @marshal_with_fields(ns_permission, permission_read_schema)
     def get(self, id):
         """
         Get Permission
@@ -111,6 +261,7 @@ class PermissionResource(Resource):
 
         Args:
             - `id (int)`: ID of permission. **(Required)**
+            - `fields (str)`: Comma separated fields to return. **(Optional)**
 
         Returns:
         Single Permission details along with following information:
@@ -122,14 +273,17 @@ class PermissionResource(Resource):
 
         """
 
-        permission = PermissionService().read_by_id(entity_id=id)
+        permission = PermissionService().read_row_by_id(
+            entity_id=id, fields=fields_parser.parse_args()["fields"]
+        )
 
         if not permission:
             return PermissionResponse.not_found_response(data=PERMISSION)
 
-        return PermissionResponse.success(data=permission)
+        return PermissionResponse.read_response(data=permission)
 
     @auth(PermissionPermissions.UPDATE_PERMISSION.value)
+    @ns_permission.header("If-Match", IF_MATCH_DESCRIPTION)
     @ns_permission.expect(permission_update_schema, validate=True)
     @ns_permission.marshal_with(permission_read_schema)
     def patch(self, id):
@@ -142,6 +296,8 @@ class PermissionResource(Resource):
 
         Args:
             - `id (int)`: ID of permission. **(Required)**
+            - `If-Match (str)`: ETags of permission versions the update may apply
+            to, any other version fails with 412. **(Optional)**
             Permission details to be updated with following fields:
             - `permission_name (str)`: Name of permission. **(Required)**
             - `permission_description (str)`: Description of permission. **(Optional)**
@@ -156,8 +312,10 @@ class PermissionResource(Resource):
 
         """
 
-        permission = PermissionService().update(
-            entity_id=id, entity=ns_permission.payload
+        permission = PermissionService().update_row(
+            entity_id=id,
+            entity=ns_permission.payload,
+            versions=if_match_versions(),
         )
 
         if not permission:
@@ -166,6 +324,7 @@ class PermissionResource(Resource):
         return PermissionResponse.update_response(data=permission)
 
     @auth(PermissionPermissions.DELETE_PERMISSION.value)
+    @UnitOfWork()
     def delete(self, id):
         """
         Delete Permission
@@ -186,5 +345,7 @@ class PermissionResource(Resource):
         if not permission:
             return PermissionResponse.not_found_response(data=PERMISSION)
 
-        remove_permission_from_roles(permission_name.permission_name)
+        after_commit(
+            remove_permission_from_roles, permission_name.permission_name
+        )
         return PermissionResponse.delete_response()
@@ -11,10 +11,22 @@ from http import HTTPStatus
 from flask import request
 from flask_restx import Resource
 
+from flask_boilerplate.constants.base import IF_MATCH_DESCRIPTION
+from flask_boilerplate.core.etag import if_match_versions
+from flask_boilerplate.database.unit_of_work import UnitOfWork, after_commit
 from flask_boilerplate.constants.role import ROLE, ROLE_DELETE_SUCCESS
 from flask_boilerplate.namespaces.role import ns_role
 from flask_boilerplate.responses.role import RoleResponse
+from flask_boilerplate.schemas.pagination import (
+    fields_parser,
+    pagination_parser,
+)
 from flask_boilerplate.schemas.role import (
+    role_bulk_create_read_schema,
+    role_bulk_delete_read_schema,
+    role_bulk_read_schema,
+    role_bulk_selection_schema,
+    role_bulk_update_schema,
     role_create_schema,
     role_read_all_schema,
     role_read_schema,
@@ -23,7 +35,8 @@ from flask_boilerplate.schemas.role import (
 from flask_boilerplate.services.role import RoleService
 from flask_boilerplate.constants.enum import RolePermissions
 from flask_boilerplate.decorator.authorization import auth
-from flask_boilerplate.services.redis import redis
+from flask_boilerplate.decorator.fields import marshal_with_fields
+from flask_boilerplate.services.permission_cache import permission_cache
 
 
 # Resource to handle listing and adding roles
@@ -62,36 +75,159 @@ class RoleListResource(Resource):
 
         """
 
-        role = RoleService().create(entity=request.get_json())
+        role = RoleService().create_row(entity=request.get_json())
 
         return RoleResponse.create_response(data=role)
 
     @auth(RolePermissions.GET_ALL_ROLE.value)
-    @ns_role.marshal_with(fields=role_read_all_schema, code=HTTPStatus.OK)
+    @ns_role.expect(pagination_parser)
+    @marshal_with_fields(ns_role, role_read_all_schema)
     def get(self):
         """
         Get all Roles
 
         Description:
-            - This function is used to get all roles.
+            - This function is used to get a page of roles ordered by ID.
 
         Args:
-            - `None`
+            - `limit (int)`: Number of roles. **(Optional)**
+            - `after (str)`: Cursor of previous page. **(Optional)**
+            - `fields (str)`: Comma separated fields to return. **(Optional)**
 
         Returns:
-        Get all roles with following information:
+        Get roles with following information:
             - `id (int)`: ID of role.
             - `role_name (str)`: Name of role.
             - `role_description (str)`: Description of role.
             - `created_at (str)`: Datetime of role creation.
             - `updated_at (str)`: Datetime of role updation.
+            - `next_cursor (str)`: Cursor of next page, `null` on last page.
+
+        """
+
+        args = pagination_parser.parse_args()
+
+        # Get a page of roles
+        roles, next_cursor = RoleService().read_rows_page(
+            limit=args["limit"], after=args["after"], fields=args["fields"]
+        )
+
+        return RoleResponse.read_all_response(
+            data=roles, next_cursor=next_cursor
+        )
+
+
+# Resource to handle adding, updating and deleting roles in bulk
+@ns_role.route("/bulk")
+class RoleBulkResource(Resource):
+    """
+    Role Bulk Resource
+
+    Description:
+        - This class is used to handle adding, updating and deleting
+        roles in bulk.
+
+    """
+
+    @auth(RolePermissions.Create_Role.value)
+    @ns_role.expect([role_create_schema], validate=True)
+    @ns_role.marshal_with(
+        fields=role_bulk_create_read_schema, code=HTTPStatus.CREATED
+    )
+    def post(self):
+        """
+        Add Roles
+
+        Description:
+            - This function is used to add a list of roles in one request.
+            - Roles that can't be created are reported by their position in
+            the list while the others are created, in that case response
+            status is multi-status.
+
+        Args:
+        List of role details, each with the fields of `Add Role`.
+
+        Returns:
+        Created roles and errors with following information:
+            - `data (list)`: Created roles, as returned by `Add Role`.
+            - `errors (list)`: `index` and `message` of rejected roles.
+
+        """
+
+        roles, errors = RoleService().create_multiple(
+            entities=request.get_json()
+        )
+
+        return RoleResponse.bulk_create_response(data=roles, errors=errors)
+
+    @auth(RolePermissions.UPDATE_ROLE.value)
+    @ns_role.expect(role_bulk_update_schema, validate=True)
+    @ns_role.marshal_with(
+        fields=role_bulk_read_schema, code=HTTPStatus.ACCEPTED
+    )
+    def patch(self):
+        """
+        Update Roles
+
+        Description:
+            - This function is used to update every role selected by IDs
+            and filter with a single statement.
+
+        Args:
+            - `ids (list[int])`: IDs of roles. **(Optional)**
+            - `filter (dict)`: Field values to match, a list matches any of
+            its values. **(Optional)**
+            - `data (dict)`: Fields to update, unique fields can't be
+            updated in bulk. **(Required)**
+
+        Returns:
+            - `data (list)`: Updated roles.
+
+        """
+
+        payload = request.get_json()
+
+        roles = RoleService().update_multiple(
+            entity=payload["data"],
+            entity_ids=payload.get("ids"),
+            filters=payload.get("filter"),
+        )
+
+        return RoleResponse.bulk_update_response(data=roles)
+
+    @auth(RolePermissions.DELETE_ROLE.value)
+    @UnitOfWork()
+    @ns_role.expect(role_bulk_selection_schema, validate=True)
+    @ns_role.marshal_with(fields=role_bulk_delete_read_schema)
+    def delete(self):
+        """
+        Delete Roles
+
+        Description:
+            - This function is used to delete every role selected by IDs
+            and filter with a single statement.
+
+        Args:
+            - `ids (list[int])`: IDs of roles. **(Optional)**
+            - `filter (dict)`: Field values to match, a list matches any of
+            its values. **(Optional)**
+
+        Returns:
+            - `data (list[int])`: IDs of deleted roles.
 
         """
 
-        # Get all roles
-        roles = RoleService().read_all()
+        payload = request.get_json()
+
+        roles = RoleService().delete_multiple(
+            entity_ids=payload.get("ids"), filters=payload.get("filter")
+        )
+
+        after_commit(
+            permission_cache.delete_many, [role["role_name"] for role in roles]
+        )
 
-        return RoleResponse.read_all_response(data=roles)
+        return RoleResponse.bulk_delete_response(data=roles)
 
 
 # Resource to handle get, update, delete single role
@@ -106,7 +242,8 @@ class RoleResource(Resource):
     """
 
     @auth(RolePermissions.GET_ROLE.value)
-    @ns_role.marshal_with(fields=role_read_schema, code=HTTPStatus.OK)
+    @ns_role.expect(fields_parser)
+    @marshal_with_fields(ns_role, role_read_schema)
     def get(self, role_id):
         """
         Get Role
@@ -116,6 +253,7 @@ class RoleResource(Resource):
 
         Args:
             - `role_id (int)`: ID of role. **(Required)**
+            - `fields (str)`: Comma separated fields to return. **(Optional)**
 
         Returns:
         Single Role details along with following information:
@@ -127,7 +265,9 @@ class RoleResource(Resource):
 
         """
 
-        role = RoleService().read_by_id(entity_id=role_id)
+        role = RoleService().read_row_by_id(
+            entity_id=role_id, fields=fields_parser.parse_args()["fields"]
+        )
 
         if not role:
             return RoleResponse.not_found_response(data=ROLE)
@@ -135,6 +275,7 @@ class RoleResource(Resource):
         return RoleResponse.read_response(data=role)
 
     @auth(RolePermissions.UPDATE_ROLE.value)
+    @ns_role.header("If-Match", IF_MATCH_DESCRIPTION)
     @ns_role.expect(role_update_schema, validate=True)
     @ns_role.marshal_with(fields=role_read_schema, code=HTTPStatus.ACCEPTED)
     def put(self, role_id):
@@ -147,6 +288,8 @@ class RoleResource(Resource):
 
         Args:
             - `role_id (int)`: ID of role. **(Required)**
+            - `If-Match (str)`: ETags of role versions the update may apply
+            to, any other version fails with 412. **(Optional)**
             Role details to be updated with following fields:
             - `role_name (str)`: Name of role. **(Required)**
             - `role_description (str)`: Description of role. **(Optional)**
@@ -161,16 +304,27 @@ class RoleResource(Resource):
 
         """
 
-        role = RoleService().update(
-            entity_id=role_id, entity=request.get_json()
+        role = RoleService().update_row(
+            entity_id=role_id,
+            entity=request.get_json(),
+            versions=if_match_versions(),
+            previous=["role_name"],
         )
 
         if not role:
             return RoleResponse.not_found_response(data=ROLE)
 
+        # Permissions are cached by role name, both names are rebuilt
+        if role["previous_role_name"] != role["role_name"]:
+            after_commit(
+                permission_cache.delete_many,
+                [role["previous_role_name"], role["role_name"]],
+            )
+
         return RoleResponse.update_response(data=role)
 
     @auth(RolePermissions.DELETE_ROLE.value)
+    @UnitOfWork()
     @ns_role.response(
         code=HTTPStatus.NO_CONTENT, description=ROLE_DELETE_SUCCESS
     )
@@ -188,11 +342,13 @@ class RoleResource(Resource):
             - `None`
 
         """
-        role_name = RoleService().read_by_id(role_id).role_name
-        role = RoleService().delete(entity_id=role_id)
+        role = RoleService().read_by_id(role_id)
 
         if not role:
             return RoleResponse.not_found_response(data=ROLE)
 
-        redis.delete(role_name)
+        role_name = role.role_name
+        RoleService().delete(entity_id=role_id)
+
+        after_commit(permission_cache.delete, role_name)
         return RoleResponse.delete_response()
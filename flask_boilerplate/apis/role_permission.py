@@ -8,6 +8,7 @@ Description:
 
 from flask_restx import Resource
 
+from flask_boilerplate.database.unit_of_work import UnitOfWork
 from flask_boilerplate.namespaces.role_permission import ns_role_permission
 from flask_boilerplate.decorator.authorization import auth
 from flask_boilerplate.schemas.role_permission import (
@@ -30,6 +31,7 @@ class RolePermissionPatchResource(Resource):
     """
 
     @auth(RolePermissions.UPDATE_ROLE.value)
+    @UnitOfWork()
     @ns_role_permission.expect(role_permission_patch_expect, validate=True)
     @ns_role_permission.marshal_with(role_permission_patch_response)
     def post(self):
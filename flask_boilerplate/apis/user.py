@@ -9,22 +9,34 @@ Description:
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 
-import jwt
 from flask import request
 from flask_restx import Resource
 
+from flask_boilerplate.constants.base import IF_MATCH_DESCRIPTION
+from flask_boilerplate.core.etag import if_match_versions
 from flask_boilerplate.core.config import (
     ACCESS_TOKEN_EXPIRY_TIME,
+    JWT_ROLE_CLAIM_AUTH,
     REFRESH_TOKEN_EXPIRY_TIME,
 )
 from flask_boilerplate.constants.user import USER, USER_DELETE_SUCCESS
-from flask_boilerplate.core.config import PRIVATE_KEY
+from flask_boilerplate.core.key_ring import key_ring
 from flask_boilerplate.decorator.authorization import auth
+from flask_boilerplate.decorator.fields import marshal_with_fields
 from flask_boilerplate.namespaces.user import ns_user
 from flask_boilerplate.responses.user import UserResponse
+from flask_boilerplate.schemas.pagination import (
+    fields_parser,
+    pagination_parser,
+)
 from flask_boilerplate.schemas.user import (
     login_read_schema,
     login_schema,
+    user_bulk_create_read_schema,
+    user_bulk_delete_read_schema,
+    user_bulk_read_schema,
+    user_bulk_selection_schema,
+    user_bulk_update_schema,
     user_create_schema,
     user_read_all_schema,
     user_read_schema,
@@ -85,21 +97,24 @@ class UserListResource(Resource):
 
         """
 
-        user = UserService().create(entity=request.get_json())
+        user = UserService().create_row(entity=request.get_json())
 
         return UserResponse.create_response(data=user)
 
     @auth(UserPermissions.GET_ALL_USERS.value)
-    @ns_user.marshal_with(fields=user_read_all_schema, code=HTTPStatus.OK)
+    @ns_user.expect(pagination_parser)
+    @marshal_with_fields(ns_user, user_read_all_schema)
     def get(self):
         """
         Get all Users
 
         Description:
-            - This function is used to get all users.
+            - This function is used to get a page of users ordered by ID.
 
         Args:
-            - `None`
+            - `limit (int)`: Number of users. **(Optional)**
+            - `after (str)`: Cursor of previous page. **(Optional)**
+            - `fields (str)`: Comma separated fields to return. **(Optional)**
 
         Returns:
         Get all users with following information:
@@ -116,13 +131,128 @@ class UserListResource(Resource):
             - `postal_code (str)`: Postal code of user.
             - `created_at (str)`: Datetime of user creation.
             - `updated_at (str)`: Datetime of user updation.
+            - `next_cursor (str)`: Cursor of next page, `null` on last page.
+
+        """
+
+        args = pagination_parser.parse_args()
+
+        # Get a page of users
+        users, next_cursor = UserService().read_rows_page(
+            limit=args["limit"], after=args["after"], fields=args["fields"]
+        )
+
+        return UserResponse.read_all_response(
+            data=users, next_cursor=next_cursor
+        )
+
+
+# Resource to handle adding, updating and deleting users in bulk
+@ns_user.route("/bulk")
+class UserBulkResource(Resource):
+    """
+    User Bulk Resource
+
+    Description:
+        - This class is used to handle adding, updating and deleting
+        users in bulk.
+
+    """
+
+    @auth(UserPermissions.CREATE_USERS.value)
+    @ns_user.expect([user_create_schema], validate=True)
+    @ns_user.marshal_with(
+        fields=user_bulk_create_read_schema, code=HTTPStatus.CREATED
+    )
+    def post(self):
+        """
+        Add Users
+
+        Description:
+            - This function is used to add a list of users in one request.
+            - Users that can't be created are reported by their position in
+            the list while the others are created, in that case response
+            status is multi-status.
+
+        Args:
+        List of user details, each with the fields of `Add User`.
+
+        Returns:
+        Created users and errors with following information:
+            - `data (list)`: Created users, as returned by `Add User`.
+            - `errors (list)`: `index` and `message` of rejected users.
+
+        """
+
+        users, errors = UserService().create_multiple(
+            entities=request.get_json()
+        )
 
+        return UserResponse.bulk_create_response(data=users, errors=errors)
+
+    @auth(UserPermissions.UPDATE_USER.value)
+    @ns_user.expect(user_bulk_update_schema, validate=True)
+    @ns_user.marshal_with(
+        fields=user_bulk_read_schema, code=HTTPStatus.ACCEPTED
+    )
+    def patch(self):
+        """
+        Update Users
+
+        Description:
+            - This function is used to update every user selected by IDs
+            and filter with a single statement.
+
+        Args:
+            - `ids (list[int])`: IDs of users. **(Optional)**
+            - `filter (dict)`: Field values to match, a list matches any of
+            its values. **(Optional)**
+            - `data (dict)`: Fields to update, unique fields can't be
+            updated in bulk. **(Required)**
+
+        Returns:
+            - `data (list)`: Updated users.
+
+        """
+
+        payload = request.get_json()
+
+        users = UserService().update_multiple(
+            entity=payload["data"],
+            entity_ids=payload.get("ids"),
+            filters=payload.get("filter"),
+        )
+
+        return UserResponse.bulk_update_response(data=users)
+
+    @auth(UserPermissions.DELETE_USER.value)
+    @ns_user.expect(user_bulk_selection_schema, validate=True)
+    @ns_user.marshal_with(fields=user_bulk_delete_read_schema)
+    def delete(self):
         """
+        Delete Users
+
+        Description:
+            - This function is used to delete every user selected by IDs
+            and filter with a single statement.
 
-        # Get all users
-        users = UserService().read_all()
+        Args:
+            - `ids (list[int])`: IDs of users. **(Optional)**
+            - `filter (dict)`: Field values to match, a list matches any of
+            its values. **(Optional)**
 
-        return UserResponse.read_all_response(data=users)
+        Returns:
+            - `data (list[int])`: IDs of deleted users.
+
+        """
+
+        payload = request.get_json()
+
+        users = UserService().delete_multiple(
+            entity_ids=payload.get("ids"), filters=payload.get("filter")
+        )
+
+        return UserResponse.bulk_delete_response(data=users)
 
 
 # Resource to handle get, update, delete single user
@@ -137,7 +267,8 @@ class UserResource(Resource):
     """
 
     @auth(UserPermissions.GET_USER.value)
-    @ns_user.marshal_with(fields=user_read_schema, code=HTTPStatus.OK)
+    @ns_user.expect(fields_parser)
+    @marshal_with_fields(ns_user, user_read_schema)
     def get(self, user_id):
         """
         Get User
@@ -147,6 +278,7 @@ class UserResource(Resource):
 
         Args:
             - `user_id (int)`: ID of user. **(Required)**
+            - `fields (str)`: Comma separated fields to return. **(Optional)**
 
         Returns:
         Single User details along with following information:
@@ -166,7 +298,9 @@ class UserResource(Resource):
 
         """
 
-        user = UserService().read_by_id(entity_id=user_id)
+        user = UserService().read_row_by_id(
+            entity_id=user_id, fields=fields_parser.parse_args()["fields"]
+        )
 
         if not user:
             return UserResponse.not_found_response(data=USER)
@@ -174,6 +308,7 @@ class UserResource(Resource):
         return UserResponse.read_response(data=user)
 
     @auth(UserPermissions.UPDATE_USER.value)
+    @ns_user.header("If-Match", IF_MATCH_DESCRIPTION)
     @ns_user.expect(user_update_schema, validate=True)
     @ns_user.marshal_with(fields=user_read_schema, code=HTTPStatus.ACCEPTED)
     def put(self, user_id):
@@ -186,6 +321,8 @@ class UserResource(Resource):
 
         Args:
             - `user_id (int)`: ID of user. **(Required)**
+            - `If-Match (str)`: ETags of user versions the update may apply
+            to, any other version fails with 412. **(Optional)**
             User details to be updated with following fields:
             - `first_name (str)`: First name of user. **(Required)**
             - `last_name (str)`: Last name of user. **(Required)**
@@ -216,8 +353,10 @@ class UserResource(Resource):
 
         """
 
-        user = UserService().update(
-            entity_id=user_id, entity=request.get_json()
+        user = UserService().update_row(
+            entity_id=user_id,
+            entity=request.get_json(),
+            versions=if_match_versions(),
         )
 
         if not user:
@@ -285,27 +424,25 @@ class UserLogin(Resource):
         user_services = UserService()
         user = user_services.get_by_validate_user(user_email, user_password)
         if user:
-            access_token = jwt.encode(
+            claims = {"sub": user.id, "role": user.role_id}
+            if JWT_ROLE_CLAIM_AUTH:
+                claims["role_name"] = user.role.role_name
+
+            access_token = key_ring.encode(
                 {
-                    "sub": user.id,
+                    **claims,
                     "exp": datetime.now(tz=timezone.utc)
                     + timedelta(seconds=ACCESS_TOKEN_EXPIRY_TIME),
-                    "role": user.role_id,
-                },
-                PRIVATE_KEY,
-                algorithm="RS256",
+                }
             )
             user.access_token = access_token
 
-            refresh_token = jwt.encode(
+            refresh_token = key_ring.encode(
                 {
-                    "sub": user.id,
+                    **claims,
                     "exp": datetime.now(tz=timezone.utc)
                     + timedelta(seconds=REFRESH_TOKEN_EXPIRY_TIME),
-                    "role": user.role_id,
-                },
-                PRIVATE_KEY,
-                algorithm="RS256",
+                }
             )
             user.refresh_token = refresh_token
             return UserResponse.success(data=user)
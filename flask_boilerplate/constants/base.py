@@ -20,6 +20,30 @@ TOTAL_PAGES: int = 1
 PAGE: int = 1
 LIMIT: int = 10
 
+# Pagination Constants
+DEFAULT_PAGE_LIMIT: int = 50
+MAX_PAGE_LIMIT: int = 100
+INVALID_CURSOR: str = "Invalid cursor"
+UNKNOWN_FIELDS: str = "Unknown fields: {fields}"
+
+# Bulk Constants
+BULK_BATCH_SIZE: int = 1000
+MAX_BULK_SIZE: int = 10_000
+BULK_NOT_LIST: str = "Request body must be a list"
+BULK_TOO_LARGE: str = "Bulk requests are limited to {limit} items"
+BULK_NO_SELECTION: str = "Provide ids or filter to select rows"
+BULK_INVALID_FILTER: str = (
+    "Filter must be an object of field values or lists of values"
+)
+BULK_NO_CHANGES: str = "Provide at least one field to update"
+BULK_READONLY_FIELDS: str = "Fields can't be updated in bulk: {fields}"
+# Columns maintained by the application, never set by clients
+SYSTEM_COLUMNS: tuple[str, ...] = ("id", "created_at", "updated_at", "version")
+
+# Concurrency Constants
+VERSION_MISMATCH: str = "Resource has been modified, read it again"
+IF_MATCH_DESCRIPTION: str = "ETags of the versions the update may apply to"
+
 # Error Messages
 ERROR_MESSAGES: dict[str, str] = {
     "409": "Integrity Error",
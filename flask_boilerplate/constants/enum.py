@@ -17,6 +17,7 @@ class Roles(Enum):
 
 
 class UserPermissions(Enum):
+    CREATE_USERS = "Create Users"
     GET_ALL_USERS = "Get All Users"
     GET_USER = "Get User"
     UPDATE_USER = "Update User"
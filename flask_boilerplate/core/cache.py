@@ -0,0 +1,184 @@
+"""
+In-Process Cache Module
+
+Description:
+    - This module contains a bounded, thread-safe LRU cache whose entries can
+    carry their own expiry time.
+    - It is shared by everything that keeps hot data in worker memory.
+
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from time import time
+from typing import Any
+
+
+class TTLCache:
+    """
+    TTL Cache
+
+    Description:
+        - This is a bounded least recently used cache with per entry expiry.
+        - All operations are guarded by a lock so the cache can be shared by
+        request threads.
+
+    Attributes:
+        - `max_size (int)`: Maximum number of entries. **(Required)**
+        - `ttl (float)`: Default time to live in seconds. **(Optional)**
+        - `hits (int)`: Number of successful lookups.
+        - `misses (int)`: Number of failed lookups.
+
+    """
+
+    def __init__(self, max_size: int, ttl: float | None = None) -> None:
+        """
+        TTL Cache Constructor
+
+        Description:
+            - Initializes TTL Cache object.
+
+        Args:
+            - `max_size (int)`: Maximum number of entries, `0` disables the
+            cache. **(Required)**
+            - `ttl (float)`: Default time to live in seconds, `None` keeps
+            entries until evicted. **(Optional)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self.max_size: int = max_size
+        self.ttl: float | None = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None]] = (
+            OrderedDict()
+        )
+        self._lock: Lock = Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Get Entry
+
+        Description:
+            - This is used to read an entry and mark it as recently used.
+            - Expired entries are removed and reported as a miss.
+
+        Args:
+            - `key (Hashable)`: Cache key. **(Required)**
+
+        Returns:
+            - `value (Any)`: Cached value or `None`.
+
+        """
+
+        with self._lock:
+            entry: tuple[Any, float | None] | None = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def set(
+        self, key: Hashable, value: Any, expires_at: float | None = None
+    ) -> None:
+        """
+        Set Entry
+
+        Description:
+            - This is used to store an entry, evicting the least recently used
+            one when the cache is full.
+
+        Args:
+            - `key (Hashable)`: Cache key. **(Required)**
+            - `value (Any)`: Value to store. **(Required)**
+            - `expires_at (float)`: Unix timestamp at which the entry expires,
+            defaults to now plus `ttl`. **(Optional)**
+
+        Returns:
+            - `None`
+
+        """
+
+        if self.max_size <= 0:
+            return
+
+        if expires_at is None and self.ttl is not None:
+            expires_at = time() + self.ttl
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Delete Entry
+
+        Description:
+            - This is used to remove an entry if it exists.
+
+        Args:
+            - `key (Hashable)`: Cache key. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Clear Cache
+
+        Description:
+            - This is used to remove all entries.
+
+        Returns:
+            - `None`
+
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Cache Statistics
+
+        Description:
+            - This is used to report size and hit/miss counters.
+
+        Returns:
+            - `stats (dict)`: Size, max size, hits, misses and hit ratio.
+
+        """
+
+        with self._lock:
+            lookups: int = self.hits + self.misses
+
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
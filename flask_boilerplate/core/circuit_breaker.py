@@ -0,0 +1,206 @@
+"""
+Circuit Breaker Module
+
+Description:
+    - This module contains a circuit breaker used to fail fast while a
+    backing service is unavailable.
+    - After `failure_threshold` consecutive failures the circuit opens and
+    calls fail immediately, once `reset_timeout` has passed a single probe
+    call is let through to decide whether to close it again.
+
+"""
+
+from collections.abc import Callable
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+
+class CircuitOpenError(Exception):
+    """
+    Circuit Open Error
+
+    Description:
+        - This is raised when a call is rejected because the circuit is open.
+
+    """
+
+
+class CircuitBreaker:
+    """
+    Circuit Breaker
+
+    Description:
+        - This is used to guard calls to a service that may be unavailable.
+
+    Attributes:
+        - `name (str)`: Name used in error messages.
+        - `failure_threshold (int)`: Consecutive failures opening circuit.
+        - `reset_timeout (float)`: Seconds before a probe call is allowed.
+        - `exceptions (tuple)`: Exceptions counted as failures.
+
+    """
+
+    CLOSED: str = "closed"
+    OPEN: str = "open"
+    HALF_OPEN: str = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        exceptions: tuple[type[BaseException], ...] = (Exception,),
+    ) -> None:
+        """
+        Circuit Breaker Constructor
+
+        Description:
+            - Initializes Circuit Breaker object in closed state.
+
+        Args:
+            - `name (str)`: Name used in error messages. **(Required)**
+            - `failure_threshold (int)`: Consecutive failures opening
+            circuit. **(Required)**
+            - `reset_timeout (float)`: Seconds before a probe call is
+            allowed. **(Required)**
+            - `exceptions (tuple)`: Exceptions counted as failures.
+            **(Optional)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self.name: str = name
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.exceptions: tuple[type[BaseException], ...] = exceptions
+        self.state: str = self.CLOSED
+        self.failures: int = 0
+        self._opened_at: float = 0.0
+        self._lock: Lock = Lock()
+
+    @property
+    def available(self) -> bool:
+        """
+        Available
+
+        Description:
+            - This is used to check whether a call would be let through,
+            without reserving the probe call.
+
+        Returns:
+            - `available (bool)`: Whether circuit accepts calls.
+
+        """
+
+        return self.state == self.CLOSED or (
+            self.state == self.OPEN
+            and monotonic() - self._opened_at >= self.reset_timeout
+        )
+
+    def call(self, function: Callable, *args, **kwargs) -> Any:
+        """
+        Call
+
+        Description:
+            - This is used to run a function through the circuit.
+
+        Args:
+            - `function (Callable)`: Function to call. **(Required)**
+            - `args (Any)`: Function arguments. **(Optional)**
+            - `kwargs (Any)`: Function keyword arguments. **(Optional)**
+
+        Raises:
+            - `CircuitOpenError`: When circuit is open or a probe call is
+            already running.
+
+        Returns:
+            - `result (Any)`: Function result.
+
+        """
+
+        self._before_call()
+
+        try:
+            result: Any = function(*args, **kwargs)
+        except self.exceptions:
+            self._on_failure()
+            raise
+        except BaseException:
+            # Errors that say nothing about availability end a probe too
+            self._on_success()
+            raise
+
+        self._on_success()
+
+        return result
+
+    def _before_call(self) -> None:
+        """
+        Before Call
+
+        Description:
+            - This is used to reject calls while open and move to half open
+            once reset timeout has passed.
+
+        Raises:
+            - `CircuitOpenError`: When call is rejected.
+
+        Returns:
+            - `None`
+
+        """
+
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+
+            if (
+                self.state == self.OPEN
+                and monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                self.state = self.HALF_OPEN
+                return
+
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+    def _on_success(self) -> None:
+        """
+        On Success
+
+        Description:
+            - This is used to close circuit after a successful call.
+
+        Returns:
+            - `None`
+
+        """
+
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def _on_failure(self) -> None:
+        """
+        On Failure
+
+        Description:
+            - This is used to count a failure and open circuit when threshold
+            is reached or a probe call fails.
+
+        Returns:
+            - `None`
+
+        """
+
+        with self._lock:
+            self.failures += 1
+
+            if (
+                self.state == self.HALF_OPEN
+                or self.failures >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self._opened_at = monotonic()
@@ -0,0 +1,276 @@
+"""
+Cache Codecs Module
+
+Description:
+    - This module contains the serialization codecs used for values cached in
+    Redis: stdlib `json`, `orjson` and `msgpack`.
+    - Every encoded value starts with a two byte header naming its codec, so
+    values written with any codec can be read back while the configured codec
+    is changed across a rollout.
+    - Values without a header are read as plain JSON, which is how they were
+    written before codecs were introduced.
+    - `orjson` and `msgpack` are optional extras imported only when used, so
+    they need to be installed only where they are configured or already
+    present in Redis.
+
+"""
+
+import json
+from abc import ABC, abstractmethod
+from importlib import import_module
+from typing import Any
+
+# First byte of every tagged value, JSON text never starts with it
+CODEC_MARKER: bytes = b"\x00"
+
+
+def import_extra(module: str) -> Any:
+    """
+    Import Extra
+
+    Description:
+        - This is used to import the package of an optional codec, naming the
+        extra to install when it is missing.
+
+    Args:
+        - `module (str)`: Module name, same as the extra name. **(Required)**
+
+    Returns:
+        - `module (ModuleType)`: Imported module.
+
+    """
+
+    try:
+        return import_module(module)
+    except ImportError as ex:
+        raise ImportError(
+            f"The {module} codec needs the {module} package, install it with "
+            f"`poetry install --extras {module}`"
+        ) from ex
+
+
+class Codec(ABC):
+    """
+    Codec
+
+    Description:
+        - This is the abstract base class of cache value codecs.
+
+    Attributes:
+        - `name (str)`: Name used in configuration.
+        - `tag (bytes)`: Single byte stored in front of encoded values.
+
+    """
+
+    name: str = ""
+    tag: bytes = b""
+
+    @abstractmethod
+    def encode(self, data: Any) -> bytes:
+        """
+        Encode
+
+        Description:
+            - This is used to serialize a value.
+
+        Args:
+            - `data (Any)`: Value to serialize. **(Required)**
+
+        Returns:
+            - `payload (bytes)`: Serialized value.
+
+        """
+
+    @abstractmethod
+    def decode(self, payload: bytes) -> Any:
+        """
+        Decode
+
+        Description:
+            - This is used to deserialize a value.
+
+        Args:
+            - `payload (bytes)`: Serialized value. **(Required)**
+
+        Returns:
+            - `data (Any)`: Deserialized value.
+
+        """
+
+
+class JsonCodec(Codec):
+    """
+    JSON Codec
+
+    Description:
+        - This is used to serialize values with stdlib `json`.
+
+    """
+
+    name: str = "json"
+    tag: bytes = b"j"
+
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def decode(self, payload: bytes) -> Any:
+        return json.loads(payload)
+
+
+class OrjsonCodec(Codec):
+    """
+    orjson Codec
+
+    Description:
+        - This is used to serialize values with `orjson`, output is plain
+        JSON so it can also be read by `JsonCodec`.
+
+    """
+
+    name: str = "orjson"
+    tag: bytes = b"o"
+
+    def __init__(self) -> None:
+        self._orjson = import_extra("orjson")
+
+    def encode(self, data: Any) -> bytes:
+        return self._orjson.dumps(data)
+
+    def decode(self, payload: bytes) -> Any:
+        return self._orjson.loads(payload)
+
+
+class MsgpackCodec(Codec):
+    """
+    MessagePack Codec
+
+    Description:
+        - This is used to serialize values with `msgpack`.
+
+    """
+
+    name: str = "msgpack"
+    tag: bytes = b"m"
+
+    def __init__(self) -> None:
+        self._msgpack = import_extra("msgpack")
+
+    def encode(self, data: Any) -> bytes:
+        return self._msgpack.packb(data, use_bin_type=True)
+
+    def decode(self, payload: bytes) -> Any:
+        return self._msgpack.unpackb(payload, raw=False)
+
+
+CODECS: dict[str, type[Codec]] = {
+    codec.name: codec for codec in (JsonCodec, OrjsonCodec, MsgpackCodec)
+}
+
+
+class TaggedSerializer:
+    """
+    Tagged Serializer
+
+    Description:
+        - This is used to write values with the configured codec and read
+        values written with any codec.
+
+    Attributes:
+        - `codec (Codec)`: Codec used for writing.
+
+    """
+
+    def __init__(self, codec_name: str) -> None:
+        """
+        Tagged Serializer Constructor
+
+        Description:
+            - Initializes Tagged Serializer object.
+
+        Args:
+            - `codec_name (str)`: Name of the codec used for writing.
+            **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        if codec_name not in CODECS:
+            raise ValueError(
+                f"Unknown codec {codec_name}, expected one of "
+                f"{', '.join(CODECS)}"
+            )
+
+        self._codecs: dict[bytes, Codec] = {}
+        self.codec: Codec = self._get_codec(CODECS[codec_name].tag)
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Dumps
+
+        Description:
+            - This is used to serialize a value with the configured codec.
+
+        Args:
+            - `data (Any)`: Value to serialize. **(Required)**
+
+        Returns:
+            - `payload (bytes)`: Tagged serialized value.
+
+        """
+
+        return CODEC_MARKER + self.codec.tag + self.codec.encode(data)
+
+    def loads(self, payload: bytes | str | None) -> Any:
+        """
+        Loads
+
+        Description:
+            - This is used to deserialize a value with the codec named in its
+            header, untagged values are read as JSON.
+
+        Args:
+            - `payload (bytes)`: Serialized value. **(Required)**
+
+        Returns:
+            - `data (Any)`: Deserialized value or `None`.
+
+        """
+
+        if not payload:
+            return None
+
+        if isinstance(payload, str):
+            payload = payload.encode()
+
+        if payload[:1] != CODEC_MARKER:
+            return json.loads(payload)
+
+        return self._get_codec(payload[1:2]).decode(payload[2:])
+
+    def _get_codec(self, tag: bytes) -> Codec:
+        """
+        Get Codec
+
+        Description:
+            - This is used to get codec of a tag, creating it on first use.
+
+        Args:
+            - `tag (bytes)`: Codec tag. **(Required)**
+
+        Returns:
+            - `codec (Codec)`: Codec object.
+
+        """
+
+        codec: Codec | None = self._codecs.get(tag)
+        if codec:
+            return codec
+
+        for codec_class in CODECS.values():
+            if codec_class.tag == tag:
+                codec = self._codecs[tag] = codec_class()
+                return codec
+
+        raise ValueError(f"Unknown codec tag {tag!r}")
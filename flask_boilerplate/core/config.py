@@ -37,8 +37,28 @@ CORS_ALLOW_CREDENTIALS: bool = env.bool("CORS_ALLOW_CREDENTIALS")
 # JWT
 PRIVATE_KEY: str = env.str("PRIVATE_KEY").replace("\\n", "\n")
 PUBLIC_KEY: str = env.str("PUBLIC_KEY").replace("\\n", "\n")
+# Algorithm of the signing key: RS256, ES256 or EdDSA
+JWT_ALGORITHM: str = env.str("JWT_ALGORITHM", "RS256")
+# Sent as `kid` header so the signing key can be rotated
+JWT_KEY_ID: str = env.str("JWT_KEY_ID", "default")
+# Public keys of previous signing keys still accepted, by key ID
+JWT_VERIFICATION_KEYS: dict[str, str] = {
+    key_id: public_key.replace("\\n", "\n")
+    for key_id, public_key in env.json("JWT_VERIFICATION_KEYS", {}).items()
+}
 ACCESS_TOKEN_EXPIRY_TIME: int = 60 * 24  # 1 day
 REFRESH_TOKEN_EXPIRY_TIME: int = 60 * 24 * 7  # 1 week
+JWT_CACHE_MAX_SIZE: int = env.int("JWT_CACHE_MAX_SIZE", 10_000)
+# Sign role name into tokens and authorize without loading the user row
+JWT_ROLE_CLAIM_AUTH: bool = env.bool("JWT_ROLE_CLAIM_AUTH", False)
+
+
+# Password hashing
+PASSWORD_HASH_WORKERS: int = env.int("PASSWORD_HASH_WORKERS", 2)
+PASSWORD_HASH_QUEUE_DEPTH: int = env.int("PASSWORD_HASH_QUEUE_DEPTH", 32)
+# Fixed PBKDF2 rounds, 0 calibrates them at startup to the target time
+PASSWORD_HASH_ROUNDS: int = env.int("PASSWORD_HASH_ROUNDS", 0)
+PASSWORD_HASH_TARGET_MS: int = env.int("PASSWORD_HASH_TARGET_MS", 50)
 
 
 # Project
@@ -64,3 +84,43 @@ SWAGGER_AUTHORIZATIONS: dict[str, dict[str, str]] = {
 
 REDIS_PORT: int = env.str("REDIS_PORT")
 REDIS_HOST: str = env.str("REDIS_HOST")
+REDIS_MAX_CONNECTIONS: int = env.int("REDIS_MAX_CONNECTIONS", 50)
+# Seconds to wait for a free pooled connection
+REDIS_POOL_TIMEOUT: float = env.float("REDIS_POOL_TIMEOUT", 1.0)
+REDIS_SOCKET_TIMEOUT: float = env.float("REDIS_SOCKET_TIMEOUT", 1.0)
+REDIS_SOCKET_CONNECT_TIMEOUT: float = env.float(
+    "REDIS_SOCKET_CONNECT_TIMEOUT", 1.0
+)
+REDIS_HEALTH_CHECK_INTERVAL: int = env.int("REDIS_HEALTH_CHECK_INTERVAL", 30)
+# Codec of cached values: json, orjson or msgpack
+REDIS_CODEC: str = env.str("REDIS_CODEC", "json")
+# Consecutive errors after which Redis calls fail fast
+REDIS_BREAKER_FAILURE_THRESHOLD: int = env.int(
+    "REDIS_BREAKER_FAILURE_THRESHOLD", 5
+)
+# Seconds before a probe call is let through an open breaker
+REDIS_BREAKER_RESET_TIMEOUT: float = env.float(
+    "REDIS_BREAKER_RESET_TIMEOUT", 5.0
+)
+
+# Permission cache
+PERMISSION_CACHE_TTL: int = env.int("PERMISSION_CACHE_TTL", 60)
+# Seconds permissions read from database are kept while Redis is down
+PERMISSION_FALLBACK_TTL: int = env.int("PERMISSION_FALLBACK_TTL", 5)
+PERMISSION_CACHE_CHANNEL: str = env.str(
+    "PERMISSION_CACHE_CHANNEL", "permission-cache-invalidation"
+)
+# Expiry of the lock held while a role's permissions are rebuilt
+PERMISSION_REBUILD_LOCK_TTL_MS: int = env.int(
+    "PERMISSION_REBUILD_LOCK_TTL_MS", 5_000
+)
+# Seconds a request waits for another worker's rebuild
+PERMISSION_REBUILD_WAIT: float = env.float("PERMISSION_REBUILD_WAIT", 0.5)
+
+# Entity cache, seconds entities read by ID are kept, disabled (0) by default
+ENTITY_CACHE_TTL: int = env.int("ENTITY_CACHE_TTL", 0)
+
+# Reference cache, milliseconds between checks of the Redis version counter
+REFERENCE_CACHE_CHECK_MS: int = env.int("REFERENCE_CACHE_CHECK_MS", 1000)
+# Seconds a reference snapshot is used before it is reloaded anyway
+REFERENCE_CACHE_MAX_AGE: int = env.int("REFERENCE_CACHE_MAX_AGE", 60)
@@ -0,0 +1,65 @@
+"""
+ETag Module
+
+Description:
+    - This module contains helpers for optimistic concurrency with row
+    versions.
+    - Responses carry the row version as a strong `ETag`, clients send it
+    back in `If-Match` so an update only applies to the version they read.
+
+"""
+
+from flask import request
+from werkzeug.exceptions import PreconditionFailed
+
+from flask_boilerplate.constants.base import VERSION_MISMATCH
+
+
+def make_etag(version: int) -> str:
+    """
+    Make ETag
+
+    Description:
+        - This is used to create `ETag` header value of a row version.
+
+    Args:
+        - `version (int)`: Row version. **(Required)**
+
+    Returns:
+        - `etag (str)`: Quoted entity tag.
+
+    """
+
+    return f'"{version}"'
+
+
+def if_match_versions() -> list[int] | None:
+    """
+    If-Match Versions
+
+    Description:
+        - This is used to read the row versions accepted by `If-Match`
+        header of current request, an update applies when the row has any
+        of them.
+
+    Raises:
+        - `PreconditionFailed`: When header can't match any row version.
+
+    Returns:
+        - `versions (list[int])`: Accepted row versions or `None` when any
+        version is accepted.
+
+    """
+
+    if_match = request.if_match
+    if not if_match or if_match.star_tag:
+        return None
+
+    # Weak tags never match under the strong comparison If-Match requires
+    versions: list[int] = sorted(
+        int(tag) for tag in if_match.as_set() if tag.isdigit()
+    )
+    if not versions:
+        raise PreconditionFailed(VERSION_MISMATCH)
+
+    return versions
@@ -0,0 +1,500 @@
+"""
+Password Hashing Module
+
+Description:
+    - This module runs password hashing and verification in a dedicated,
+    bounded process pool, so CPU heavy logins don't hold request threads.
+    - Requests beyond the queue depth are rejected with `503 Service
+    Unavailable` instead of queueing without bound.
+    - Hash cost can be calibrated at startup to hit a target verify time on
+    the current hardware, hashes made with other parameters are reported so
+    they can be rehashed on login.
+
+"""
+
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from logging import Logger
+from multiprocessing import get_context
+from threading import BoundedSemaphore, Lock
+from time import perf_counter
+from typing import Any
+
+from passlib.hash import pbkdf2_sha256
+from werkzeug.exceptions import ServiceUnavailable
+
+from flask_boilerplate.core.config import (
+    PASSWORD_HASH_QUEUE_DEPTH,
+    PASSWORD_HASH_ROUNDS,
+    PASSWORD_HASH_TARGET_MS,
+    PASSWORD_HASH_WORKERS,
+)
+from flask_boilerplate.core.logger import AppLogger
+
+logger: Logger = AppLogger().get_logger()
+
+PASSWORD_HASH_SATURATED: str = "Too many login requests, try again later."
+
+# Calibration never goes below passlib's default cost
+PASSWORD_HASH_MIN_ROUNDS: int = pbkdf2_sha256.default_rounds
+CALIBRATION_ROUNDS: int = 10_000
+# Calibrated rounds differ slightly between restarts and nodes, hashes within
+# this ratio of the policy are not rehashed
+CALIBRATION_TOLERANCE: float = 1.25
+
+
+def hash_password(password: str, rounds: int) -> str:
+    """
+    Hash Password
+
+    Description:
+        - This is used to hash a password, it runs inside pool workers.
+
+    Args:
+        - `password (str)`: Plain password. **(Required)**
+        - `rounds (int)`: PBKDF2 rounds. **(Required)**
+
+    Returns:
+        - `hash (str)`: Password hash.
+
+    """
+
+    return pbkdf2_sha256.using(rounds=rounds).hash(password)
+
+
+def calibrate_rounds(target_ms: int) -> int:
+    """
+    Calibrate Rounds
+
+    Description:
+        - This is used to find PBKDF2 rounds whose verify time is close to
+        the target on the current hardware.
+
+    Args:
+        - `target_ms (int)`: Target verify time in milliseconds. **(Required)**
+
+    Returns:
+        - `rounds (int)`: PBKDF2 rounds.
+
+    """
+
+    hasher = pbkdf2_sha256.using(rounds=CALIBRATION_ROUNDS)
+    password_hash: str = hasher.hash("calibration")
+
+    # Best of a few runs filters out scheduler noise
+    elapsed: float = min(
+        _time_verify(password_hash=password_hash) for _ in range(3)
+    )
+    rounds: int = int(CALIBRATION_ROUNDS * target_ms / (elapsed * 1_000))
+
+    return max(rounds, PASSWORD_HASH_MIN_ROUNDS)
+
+
+def _time_verify(password_hash: str) -> float:
+    """
+    Time Verify
+
+    Description:
+        - This is used to measure a single password verification.
+
+    Args:
+        - `password_hash (str)`: Password hash. **(Required)**
+
+    Returns:
+        - `elapsed (float)`: Elapsed seconds.
+
+    """
+
+    start: float = perf_counter()
+    pbkdf2_sha256.verify("calibration", password_hash)
+
+    return perf_counter() - start
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """
+    Verify Password
+
+    Description:
+        - This is used to verify a password, it runs inside pool workers.
+
+    Args:
+        - `password (str)`: Plain password. **(Required)**
+        - `password_hash (str)`: Stored password hash. **(Required)**
+
+    Returns:
+        - `is_valid (bool)`: Whether password matches.
+
+    """
+
+    return pbkdf2_sha256.verify(password, password_hash)
+
+
+class PasswordHasher:
+    """
+    Password Hasher
+
+    Description:
+        - This is used to hash and verify passwords through a process pool.
+        - Pool is created in every process, so prefork servers get a pool
+        per worker instead of sharing the parent's one.
+
+    Attributes:
+        - `max_workers (int)`: Pool size, `0` runs hashing inline.
+        - `queue_depth (int)`: Maximum running and queued jobs.
+        - `target_ms (int)`: Target verify time used for calibration.
+
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        queue_depth: int,
+        rounds: int = 0,
+        target_ms: int = 50,
+    ) -> None:
+        """
+        Password Hasher Constructor
+
+        Description:
+            - Initializes Password Hasher object.
+
+        Args:
+            - `max_workers (int)`: Pool size, `0` runs hashing inline.
+            **(Required)**
+            - `queue_depth (int)`: Maximum running and queued jobs.
+            **(Required)**
+            - `rounds (int)`: PBKDF2 rounds, `0` calibrates them against
+            `target_ms`. **(Optional)**
+            - `target_ms (int)`: Target verify time in milliseconds.
+            **(Optional)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self.max_workers: int = max_workers
+        self.queue_depth: int = queue_depth
+        self.target_ms: int = target_ms
+        self._rounds: int = rounds
+        self._calibrated: bool = not rounds
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots: BoundedSemaphore = BoundedSemaphore(queue_depth)
+        self._pid: int | None = None
+        self._lock: Lock = Lock()
+
+    @property
+    def rounds(self) -> int:
+        """
+        Rounds
+
+        Description:
+            - This is used to get PBKDF2 rounds of the current policy,
+            calibrating them on first use when not configured.
+
+        Returns:
+            - `rounds (int)`: PBKDF2 rounds.
+
+        """
+
+        if not self._rounds:
+            self.calibrate()
+
+        return self._rounds
+
+    def calibrate(self) -> int:
+        """
+        Calibrate
+
+        Description:
+            - This is used to pick PBKDF2 rounds for the target verify time,
+            configured rounds are kept as they are.
+
+        Returns:
+            - `rounds (int)`: PBKDF2 rounds.
+
+        """
+
+        with self._lock:
+            if not self._rounds:
+                self._rounds = calibrate_rounds(target_ms=self.target_ms)
+                logger.info(
+                    f"Password hash calibrated to {self._rounds} rounds "
+                    f"for {self.target_ms} ms"
+                )
+
+        return self._rounds
+
+    def start(self) -> None:
+        """
+        Start
+
+        Description:
+            - This is used to create the pool and fork its workers at
+            startup, while the process runs no other threads, forking a
+            multithreaded process could deadlock workers on locks held by
+            the other threads.
+
+        Returns:
+            - `None`
+
+        """
+
+        if self.max_workers <= 0:
+            return
+
+        # Workers are forked on the first submitted job
+        self._get_executor().submit(os.getpid).result()
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Needs Rehash
+
+        Description:
+            - This is used to check whether a hash was made with parameters
+            other than the current policy.
+
+        Args:
+            - `password_hash (str)`: Stored password hash. **(Required)**
+
+        Returns:
+            - `needs_rehash (bool)`: Whether password should be rehashed.
+
+        """
+
+        if not pbkdf2_sha256.identify(password_hash):
+            return True
+
+        rounds: int = pbkdf2_sha256.from_string(password_hash).rounds
+
+        if self._calibrated:
+            return not (
+                self.rounds / CALIBRATION_TOLERANCE
+                <= rounds
+                <= self.rounds * CALIBRATION_TOLERANCE
+            )
+
+        return rounds != self.rounds
+
+    def hash(self, password: str) -> str:
+        """
+        Hash Password
+
+        Description:
+            - This is used to hash a password in the pool.
+
+        Args:
+            - `password (str)`: Plain password. **(Required)**
+
+        Returns:
+            - `hash (str)`: Password hash.
+
+        """
+
+        return self._run(hash_password, password, self.rounds)
+
+    def hash_many(self, passwords: list[str]) -> list[str]:
+        """
+        Hash Passwords
+
+        Description:
+            - This is used to hash several passwords in parallel across the
+            pool, a chunk at a time so logins queued meanwhile only wait for
+            the running chunk.
+
+        Args:
+            - `passwords (list[str])`: Plain passwords. **(Required)**
+
+        Returns:
+            - `hashes (list[str])`: Password hashes in the same order.
+
+        """
+
+        return self._run_many(
+            hash_password, passwords, [self.rounds] * len(passwords)
+        )
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        """
+        Verify Password
+
+        Description:
+            - This is used to verify a password in the pool.
+
+        Args:
+            - `password (str)`: Plain password. **(Required)**
+            - `password_hash (str)`: Stored password hash. **(Required)**
+
+        Returns:
+            - `is_valid (bool)`: Whether password matches.
+
+        """
+
+        return self._run(verify_password, password, password_hash)
+
+    def _run(self, function: Callable, *args) -> Any:
+        """
+        Run Job
+
+        Description:
+            - This is used to run a job in the pool and wait for its result.
+
+        Args:
+            - `function (Callable)`: Module level function. **(Required)**
+            - `args (Any)`: Function arguments. **(Optional)**
+
+        Returns:
+            - `result (Any)`: Function result.
+
+        """
+
+        if self.max_workers <= 0:
+            return function(*args)
+
+        return self._submit(
+            lambda executor: executor.submit(function, *args).result()
+        )
+
+    def _run_many(self, function: Callable, *iterables: list) -> list:
+        """
+        Run Jobs
+
+        Description:
+            - This is used to run a function over lists of arguments in the
+            pool, in chunks of one argument per worker.
+            - Every chunk takes a queue slot, waiting for one to free up
+            rather than being rejected, so a large batch never holds more
+            than one slot or queues more than one chunk ahead of other jobs.
+
+        Args:
+            - `function (Callable)`: Module level function. **(Required)**
+            - `iterables (list)`: Lists of function arguments.
+            **(Required)**
+
+        Returns:
+            - `results (list)`: Function results in argument order.
+
+        """
+
+        if self.max_workers <= 0:
+            return list(map(function, *iterables))
+
+        results: list = []
+        for start in range(0, len(iterables[0]), self.max_workers):
+            chunk: list[list] = [
+                iterable[start : start + self.max_workers]
+                for iterable in iterables
+            ]
+            results.extend(
+                self._submit(
+                    lambda executor, chunk=chunk: list(
+                        executor.map(function, *chunk)
+                    ),
+                    wait=True,
+                )
+            )
+
+        return results
+
+    def _submit(
+        self, job: Callable[[ProcessPoolExecutor], Any], wait: bool = False
+    ) -> Any:
+        """
+        Submit Job
+
+        Description:
+            - This is used to run a job against the pool while holding a
+            queue slot.
+
+        Args:
+            - `job (Callable)`: Function submitting work to the pool and
+            waiting for it. **(Required)**
+            - `wait (bool)`: Wait for a free slot instead of failing when
+            queue depth is reached. **(Optional)**
+
+        Raises:
+            - `ServiceUnavailable`: When queue depth is reached without
+            `wait` or the pool is broken.
+
+        Returns:
+            - `result (Any)`: Job result.
+
+        """
+
+        executor: ProcessPoolExecutor = self._get_executor()
+        slots: BoundedSemaphore = self._slots
+
+        if not slots.acquire(blocking=wait):
+            raise ServiceUnavailable(PASSWORD_HASH_SATURATED)
+
+        try:
+            return job(executor)
+        except BrokenProcessPool as ex:
+            logger.error(f"Password hashing pool broken: {ex}")
+            self._reset(executor)
+            raise ServiceUnavailable(PASSWORD_HASH_SATURATED) from ex
+        finally:
+            slots.release()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Get Executor
+
+        Description:
+            - This is used to create the pool once per process, `start`
+            creates it at startup before other threads run.
+            - Workers are forked, so they don't re-import the application.
+
+        Returns:
+            - `executor (ProcessPoolExecutor)`: Process pool.
+
+        """
+
+        pid: int = os.getpid()
+        if self._executor and self._pid == pid:
+            return self._executor
+
+        with self._lock:
+            if not self._executor or self._pid != pid:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=get_context("fork"),
+                )
+                self._slots = BoundedSemaphore(self.queue_depth)
+                self._pid = pid
+
+            return self._executor
+
+    def _reset(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Reset Executor
+
+        Description:
+            - This is used to drop a broken pool so the next job creates a
+            new one.
+
+        Args:
+            - `executor (ProcessPoolExecutor)`: Broken process pool.
+            **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    max_workers=PASSWORD_HASH_WORKERS,
+    queue_depth=PASSWORD_HASH_QUEUE_DEPTH,
+    rounds=PASSWORD_HASH_ROUNDS,
+    target_ms=PASSWORD_HASH_TARGET_MS,
+)
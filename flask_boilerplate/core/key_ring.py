@@ -0,0 +1,222 @@
+"""
+JWT Key Ring Module
+
+Description:
+    - This module loads JWT signing and verification keys once into key
+    objects, so tokens are not signed or verified from PEM strings.
+    - Verification keys are indexed by `kid` header, so keys can be rotated by
+    signing with a new key while tokens signed with old keys stay valid.
+
+"""
+
+from typing import Any
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric.ec import (
+    EllipticCurvePrivateKey,
+    EllipticCurvePublicKey,
+)
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.asymmetric.rsa import (
+    RSAPrivateKey,
+    RSAPublicKey,
+)
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+from jwt.exceptions import InvalidKeyError, InvalidTokenError
+
+from flask_boilerplate.core.config import (
+    JWT_ALGORITHM,
+    JWT_KEY_ID,
+    JWT_VERIFICATION_KEYS,
+    PRIVATE_KEY,
+    PUBLIC_KEY,
+)
+
+# Algorithms supported for each key type
+KEY_ALGORITHMS: dict[tuple[type, ...], tuple[str, ...]] = {
+    (RSAPrivateKey, RSAPublicKey): ("RS256", "RS384", "RS512"),
+    (EllipticCurvePrivateKey, EllipticCurvePublicKey): (
+        "ES256",
+        "ES384",
+        "ES512",
+    ),
+    (Ed25519PrivateKey, Ed25519PublicKey): ("EdDSA",),
+}
+
+
+def key_algorithms(key) -> tuple[str, ...]:
+    """
+    Key Algorithms
+
+    Description:
+        - This is used to get algorithms that can be used with a key.
+
+    Args:
+        - `key (Any)`: Private or public key object. **(Required)**
+
+    Returns:
+        - `algorithms (tuple[str])`: Supported algorithms.
+
+    """
+
+    for key_types, algorithms in KEY_ALGORITHMS.items():
+        if isinstance(key, key_types):
+            return algorithms
+
+    raise InvalidKeyError(f"Unsupported key type {type(key).__name__}")
+
+
+class KeyRing:
+    """
+    Key Ring
+
+    Description:
+        - This is used to sign tokens with the current key and verify tokens
+        with the key named by their `kid` header.
+
+    Attributes:
+        - `key_id (str)`: ID of the current signing key.
+        - `algorithm (str)`: Signing algorithm.
+
+    """
+
+    def __init__(
+        self,
+        key_id: str,
+        algorithm: str,
+        private_key: str,
+        public_key: str,
+        verification_keys: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Key Ring Constructor
+
+        Description:
+            - Initializes Key Ring object and parses all keys.
+
+        Args:
+            - `key_id (str)`: ID of the current signing key. **(Required)**
+            - `algorithm (str)`: Signing algorithm. **(Required)**
+            - `private_key (str)`: PEM of the current signing key.
+            **(Required)**
+            - `public_key (str)`: PEM of the current verification key.
+            **(Required)**
+            - `verification_keys (dict)`: PEMs of previous verification keys
+            by key ID. **(Optional)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self.key_id: str = key_id
+        self.algorithm: str = algorithm
+        self._signing_key: Any = load_pem_private_key(
+            private_key.encode(), password=None
+        )
+
+        if algorithm not in key_algorithms(self._signing_key):
+            raise InvalidKeyError(
+                f"{algorithm} can't be used with "
+                f"{type(self._signing_key).__name__}"
+            )
+
+        self._verification_keys: dict[str, tuple[Any, tuple[str, ...]]] = {}
+        for kid, pem in (verification_keys or {}).items():
+            self.add_verification_key(kid, pem)
+
+        self.add_verification_key(key_id, public_key, algorithms=(algorithm,))
+
+    def add_verification_key(
+        self, key_id: str, pem: str, algorithms: tuple[str, ...] | None = None
+    ) -> None:
+        """
+        Add Verification Key
+
+        Description:
+            - This is used to accept tokens signed with another key.
+
+        Args:
+            - `key_id (str)`: Key ID. **(Required)**
+            - `pem (str)`: PEM encoded public key. **(Required)**
+            - `algorithms (tuple[str])`: Accepted algorithms, defaults to
+            algorithms supported by the key type. **(Optional)**
+
+        Returns:
+            - `None`
+
+        """
+
+        key: Any = load_pem_public_key(pem.encode())
+        self._verification_keys[key_id] = (
+            key,
+            algorithms or key_algorithms(key),
+        )
+
+    def encode(self, payload: dict) -> str:
+        """
+        Encode Token
+
+        Description:
+            - This is used to sign a token with the current key.
+
+        Args:
+            - `payload (dict)`: Token claims. **(Required)**
+
+        Returns:
+            - `token (str)`: Signed token.
+
+        """
+
+        return jwt.encode(
+            payload,
+            self._signing_key,
+            algorithm=self.algorithm,
+            headers={"kid": self.key_id},
+        )
+
+    def decode(self, token: str) -> dict:
+        """
+        Decode Token
+
+        Description:
+            - This is used to verify a token with the key named by its `kid`
+            header, tokens without `kid` are verified with the current key.
+
+        Args:
+            - `token (str)`: Signed token. **(Required)**
+
+        Returns:
+            - `claims (dict)`: Verified token claims.
+
+        """
+
+        kid: str = jwt.get_unverified_header(token).get("kid", self.key_id)
+        verification_key = self._verification_keys.get(kid)
+
+        if not verification_key:
+            raise InvalidTokenError("Unknown key id")
+
+        key, algorithms = verification_key
+
+        return jwt.decode(
+            token,
+            key,
+            algorithms=list(algorithms),
+            options={"verify_aud": False},
+        )
+
+
+key_ring = KeyRing(
+    key_id=JWT_KEY_ID,
+    algorithm=JWT_ALGORITHM,
+    private_key=PRIVATE_KEY,
+    public_key=PUBLIC_KEY,
+    verification_keys=JWT_VERIFICATION_KEYS,
+)
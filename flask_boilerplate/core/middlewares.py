@@ -29,6 +29,47 @@ from flask_boilerplate.core.logger import AppLogger
 logger: Logger = AppLogger().get_logger()
 
 
+def integrity_error_message(err) -> str | None:
+    """
+    Integrity Error Message
+
+    Description:
+        - This is used to build a readable message from an integrity error.
+
+    Args:
+        - `err (IntegrityError)`: The exception object. **(Required)**
+
+    Returns:
+        - `message (str)`: Error message or `None`.
+
+    """
+
+    # Hanlde NotNullViolation Exception
+    if isinstance(err.orig, NotNullViolation):
+        match: re.Match[str] | None = re.search(
+            pattern=r'"([^"]+)"', string=str(err.orig)
+        )
+        if match:
+            return f"{match.group(1)} can't be null"
+
+        return None
+
+    # Handle ForeignKeyViolation and UniqueViolation Exception
+    if isinstance(err.orig, (ForeignKeyViolation, UniqueViolation)):
+        message: str = (
+            str(err.orig)
+            .split("DETAIL:")[1]
+            .replace("Key", "")
+            .replace("(", "")
+            .replace(")", "")
+            .strip()
+        )
+        return re.sub(pattern=r"in table.*", repl="", string=message).strip()
+
+    # Handle other IntegrityError Exception
+    return ERROR_MESSAGES.get(str(HTTPStatus.CONFLICT))
+
+
 class ExceptionHandler:
     """
     Custom Exception Handler
@@ -112,32 +153,7 @@ class ExceptionHandler:
         # Handle Integrity Exception
         elif isinstance(err, IntegrityError):
             status_code = HTTPStatus.CONFLICT
-
-            # Hanlde NotNullViolation Exception
-            if isinstance(err.orig, NotNullViolation):
-                match: re.Match[str] | None = re.search(
-                    pattern=r'"([^"]+)"', string=str(err.orig)
-                )
-                if match:
-                    err_message = f"{match.group(1)} can't be null"
-
-            # Handle ForeignKeyViolation and UniqueViolation Exception
-            elif isinstance(err.orig, (ForeignKeyViolation, UniqueViolation)):
-                err_message = (
-                    str(err.orig)
-                    .split("DETAIL:")[1]
-                    .replace("Key", "")
-                    .replace("(", "")
-                    .replace(")", "")
-                    .strip()
-                )
-                err_message = re.sub(
-                    pattern=r"in table.*", repl="", string=err_message
-                ).strip()
-
-            # Handle other IntegrityError Exception
-            else:
-                err_message = ERROR_MESSAGES.get(str(HTTPStatus.CONFLICT))
+            err_message = integrity_error_message(err) or err_message
 
         # Handle HTTPException
         elif isinstance(err, HTTPException):
@@ -0,0 +1,72 @@
+"""
+Pagination Module
+
+Description:
+    - This module contains helpers for keyset (cursor) pagination.
+    - Cursors are opaque to clients, they encode the key of the last row of a
+    page so the next page starts right after it with an index seek.
+
+"""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+
+from werkzeug.exceptions import BadRequest
+
+from flask_boilerplate.constants.base import INVALID_CURSOR
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encode Cursor
+
+    Description:
+        - This is used to create cursor of the page following a row.
+
+    Args:
+        - `last_id (int)`: ID of the last row of a page. **(Required)**
+
+    Returns:
+        - `cursor (str)`: Opaque cursor.
+
+    """
+
+    payload: bytes = json.dumps({"id": last_id}).encode()
+
+    return urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    """
+    Decode Cursor
+
+    Description:
+        - This is used to read the row key encoded in a cursor.
+
+    Args:
+        - `cursor (str)`: Opaque cursor. **(Optional)**
+
+    Raises:
+        - `BadRequest`: When cursor is malformed.
+
+    Returns:
+        - `last_id (int)`: ID of the last row of previous page or `None`.
+
+    """
+
+    if not cursor:
+        return None
+
+    try:
+        payload: dict = json.loads(
+            urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+        last_id = payload["id"]
+    except (Base64Error, ValueError, TypeError, KeyError) as ex:
+        raise BadRequest(INVALID_CURSOR) from ex
+
+    if not isinstance(last_id, int):
+        raise BadRequest(INVALID_CURSOR)
+
+    return last_id
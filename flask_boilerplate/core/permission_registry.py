@@ -0,0 +1,144 @@
+"""
+Permission Registry Module
+
+Description:
+    - This module assigns every permission a bit index so a set of
+    permissions can be stored and checked as a single integer mask.
+    - Permissions declared in `constants/enum.py` get their indexes in
+    declaration order, permissions created at runtime are appended on first
+    use.
+
+"""
+
+from collections.abc import Iterable
+from threading import Lock
+
+from flask_boilerplate.constants.enum import (
+    PermissionPermissions,
+    RolePermissions,
+    UserPermissions,
+)
+
+
+class PermissionRegistry:
+    """
+    Permission Registry
+
+    Description:
+        - This is used to map permission names to bit indexes and compile
+        permission names into masks.
+
+    """
+
+    def __init__(self, *modules) -> None:
+        """
+        Permission Registry Constructor
+
+        Description:
+            - Initializes Permission Registry object and registers permissions
+            of the given enums.
+
+        Args:
+            - `modules (Enum)`: Permission enums. **(Optional)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self._bits: dict[str, int] = {}
+        self._lock: Lock = Lock()
+
+        for module in modules:
+            for permission in module.list():
+                self.bit(permission)
+
+    def bit(self, permission) -> int:
+        """
+        Get Bit Index
+
+        Description:
+            - This is used to get bit index of a permission, registering it
+            when it is unknown.
+
+        Args:
+            - `permission (str)`: Permission name. **(Required)**
+
+        Returns:
+            - `bit (int)`: Bit index.
+
+        """
+
+        bit: int | None = self._bits.get(permission)
+        if bit is not None:
+            return bit
+
+        with self._lock:
+            return self._bits.setdefault(permission, len(self._bits))
+
+    def mask(self, permissions: Iterable[str]) -> int:
+        """
+        Compile Mask
+
+        Description:
+            - This is used to compile permission names into a bitmask.
+
+        Args:
+            - `permissions (Iterable[str])`: Permission names. **(Required)**
+
+        Returns:
+            - `mask (int)`: Permission bitmask.
+
+        """
+
+        mask: int = 0
+        for permission in permissions:
+            mask |= 1 << self.bit(permission)
+
+        return mask
+
+    def names(self, mask: int) -> list[str]:
+        """
+        Decompile Mask
+
+        Description:
+            - This is used to list permission names set in a bitmask.
+
+        Args:
+            - `mask (int)`: Permission bitmask. **(Required)**
+
+        Returns:
+            - `permissions (list[str])`: Permission names.
+
+        """
+
+        return [name for name, bit in self._bits.items() if mask >> bit & 1]
+
+    @staticmethod
+    def allows(mask: int, all_of: int = 0, any_of: int = 0) -> bool:
+        """
+        Check Mask
+
+        Description:
+            - This is used to check a role mask against required permissions.
+
+        Args:
+            - `mask (int)`: Role permission bitmask. **(Required)**
+            - `all_of (int)`: Mask of permissions that are all required.
+            **(Optional)**
+            - `any_of (int)`: Mask of permissions of which one is required.
+            **(Optional)**
+
+        Returns:
+            - `allowed (bool)`: Whether the role is allowed.
+
+        """
+
+        return (mask & all_of) == all_of and (
+            not any_of or bool(mask & any_of)
+        )
+
+
+permission_registry = PermissionRegistry(
+    UserPermissions, RolePermissions, PermissionPermissions
+)
@@ -8,9 +8,10 @@ Description:
 """
 
 from datetime import datetime
+from typing import ClassVar
 
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, literal_column, text
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -31,10 +32,17 @@ class BaseTable(DeclarativeBase):
         - `id (int)`: Primary key.
         - `created_at (datetime)`: Created at timestamp.
         - `updated_at (datetime)`: Updated at timestamp.
+        - `version (int)`: Row version, incremented by every update.
+        - `__entity_cache__ (bool)`: Whether entities read by ID are cached
+        in Redis.
+        - `__reference_cache__ (bool)`: Whether the table is kept in memory
+        by every worker.
 
     """
 
     __abstract__ = True
+    __entity_cache__: ClassVar[bool] = False
+    __reference_cache__: ClassVar[bool] = False
 
     id: Mapped[int] = mapped_column(primary_key=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -43,6 +51,11 @@ class BaseTable(DeclarativeBase):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=now(), onupdate=now()
     )
+    version: Mapped[int] = mapped_column(
+        default=1,
+        server_default=text("1"),
+        onupdate=literal_column("version") + 1,
+    )
 
     @declared_attr.directive
     def __tablename__(self) -> str:
@@ -25,7 +25,7 @@ def add_permissions():
     for module in module_list:
         permission_list = module.list()
         for perm in permission_list:
-            permission = PermissionService().read_by_name(
+            permission = PermissionService().read_reference_row(
                 "permission_name", perm
             )
             if permission:
@@ -40,7 +40,7 @@ def add_roles():
     """
     roles = Roles.list()
     for role in roles:
-        data = RoleService().read_by_name("role_name", role)
+        data = RoleService().read_reference_row("role_name", role)
         if data:
             logger.error("Role already exist")
         else:
@@ -51,8 +51,10 @@ def add_admin_permissions():
     """
     This function will add all permissions against admin role
     """
-    admin_id = RoleService().read_by_name("role_name", Roles.ADMIN.value).id
-    permissions = PermissionService().read_all()
+    admin_id = (
+        RoleService().read_reference_row("role_name", Roles.ADMIN.value).id
+    )
+    permissions = PermissionService().read_reference_rows()
     for permission in permissions:
         role_permission = RolePermissionService().get_role_n_permission(
             admin_id, permission.id
@@ -0,0 +1,183 @@
+"""
+Unit of Work Module
+
+Description:
+    - This module contains the unit of work used to run several repository
+    writes in a single transaction.
+    - Inside a unit repositories only flush their changes, the unit commits
+    once when it ends or rolls everything back when it fails.
+    - Callbacks registered with `after_commit`, such as cache invalidations,
+    run once the unit has committed and are dropped on rollback.
+    - Units can be nested, inner units join the outermost one.
+
+"""
+
+from collections.abc import Callable
+from contextlib import ContextDecorator
+from logging import Logger
+from typing import Self
+
+from flask import g
+
+from flask_boilerplate.core.logger import AppLogger
+from flask_boilerplate.database.base import db
+
+logger: Logger = AppLogger().get_logger()
+
+
+class UnitOfWork(ContextDecorator):
+    """
+    Unit of Work
+
+    Description:
+        - This is used to group writes of a request into one transaction,
+        either as a decorator on API resource methods or as a `with` block.
+        - State is kept on `flask.g`, so an instance can be shared between
+        requests and threads.
+
+    """
+
+    def __enter__(self) -> Self:
+        """
+        Enter
+
+        Description:
+            - This is used to start a unit or join the running one.
+
+        Returns:
+            - `unit_of_work (UnitOfWork)`: Unit of work object.
+
+        """
+
+        g.unit_of_work_depth = g.get("unit_of_work_depth", 0) + 1
+        if g.unit_of_work_depth == 1:
+            g.unit_of_work_callbacks = []
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """
+        Exit
+
+        Description:
+            - This is used to commit outermost unit and run its callbacks, or
+            roll it back when an exception was raised.
+
+        Args:
+            - `exc_type (type)`: Exception type. **(Optional)**
+            - `exc_value (BaseException)`: Exception object. **(Optional)**
+            - `traceback (TracebackType)`: Exception traceback.
+            **(Optional)**
+
+        Returns:
+            - `suppress (bool)`: Always `False`, exceptions are re-raised.
+
+        """
+
+        g.unit_of_work_depth -= 1
+        if g.unit_of_work_depth:
+            return False
+
+        callbacks: list[tuple[Callable, tuple, dict]] = g.pop(
+            "unit_of_work_callbacks"
+        )
+
+        if exc_type is not None:
+            db.session.rollback()
+            return False
+
+        try:
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        run_callbacks(callbacks)
+
+        return False
+
+
+def in_unit_of_work() -> bool:
+    """
+    In Unit of Work
+
+    Description:
+        - This is used to check whether a unit of work is running.
+
+    Returns:
+        - `active (bool)`: Whether writes are part of a unit of work.
+
+    """
+
+    return bool(g.get("unit_of_work_depth"))
+
+
+def commit() -> None:
+    """
+    Commit
+
+    Description:
+        - This is used by repositories to end a write, it commits outside a
+        unit of work and only flushes inside one so that generated values are
+        available while the commit waits for the end of the unit.
+
+    Returns:
+        - `None`
+
+    """
+
+    if in_unit_of_work():
+        db.session.flush()
+    else:
+        db.session.commit()
+
+
+def after_commit(callback: Callable, *args, **kwargs) -> None:
+    """
+    After Commit
+
+    Description:
+        - This is used to run a callback once the running unit of work has
+        committed, or right away outside a unit of work.
+
+    Args:
+        - `callback (Callable)`: Function to call. **(Required)**
+        - `args (Any)`: Function arguments. **(Optional)**
+        - `kwargs (Any)`: Function keyword arguments. **(Optional)**
+
+    Returns:
+        - `None`
+
+    """
+
+    if in_unit_of_work():
+        g.unit_of_work_callbacks.append((callback, args, kwargs))
+    else:
+        run_callbacks([(callback, args, kwargs)])
+
+
+def run_callbacks(callbacks: list[tuple[Callable, tuple, dict]]) -> None:
+    """
+    Run Callbacks
+
+    Description:
+        - This is used to run callbacks of a committed unit of work, every
+        callback runs even when an earlier one fails.
+        - Failures are logged and not raised, the transaction is already
+        committed so the request must not fail because of them.
+
+    Args:
+        - `callbacks (list[tuple])`: Callbacks with their arguments.
+        **(Required)**
+
+    Returns:
+        - `None`
+
+    """
+
+    for callback, args, kwargs in callbacks:
+        try:
+            callback(*args, **kwargs)
+        # Callbacks may fail in any way, none of them may skip the others
+        except Exception as ex:  # noqa: BLE001
+            logger.error(f"After commit callback {callback} failed: {ex}")
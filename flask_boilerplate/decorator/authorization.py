@@ -1,18 +1,32 @@
+from functools import partial
+from hashlib import sha256
 from typing import Dict
 
-import jwt
 from flask import g, request
 from werkzeug.exceptions import Unauthorized
+from werkzeug.local import LocalProxy
 from flask_boilerplate.services.user import UserService
-from flask_boilerplate.core.config import PUBLIC_KEY
-from flask_boilerplate.services.redis import redis
+from flask_boilerplate.core.cache import TTLCache
+from flask_boilerplate.core.permission_registry import permission_registry
+from flask_boilerplate.core.config import (
+    JWT_CACHE_MAX_SIZE,
+    JWT_ROLE_CLAIM_AUTH,
+)
+from flask_boilerplate.core.key_ring import key_ring
+from flask_boilerplate.services.permission_cache import permission_cache
 from functools import wraps as functools_wraps
 
+# Tokens whose signature has already been verified, keyed by token digest
+token_cache = TTLCache(max_size=JWT_CACHE_MAX_SIZE)
+
 
 def decode_jwt_token(token: str) -> Dict:
     """
     Decode jwt token
 
+    Verified claims are cached until the token's `exp`, so a token reused
+    across requests is only signature checked once per worker.
+
     Args:
         token: Token to decode
 
@@ -20,25 +34,48 @@ def decode_jwt_token(token: str) -> Dict:
         Decoded dictionary
     """
 
-    public_key = PUBLIC_KEY
-    if public_key:
-        decoded = jwt.decode(
-            token,
-            public_key,
-            algorithms=["RS256"],
-            options={
-                "verify_aud": False,
-            },
-        )
+    token_key = sha256(token.encode()).hexdigest()
+    decoded = token_cache.get(token_key)
+    if decoded:
         return decoded
 
+    decoded = key_ring.decode(token)
+    token_cache.set(token_key, decoded, expires_at=decoded.get("exp"))
+    return decoded
 
-def auth(*value):
+
+def load_user(user_id):
+    """
+    Load the authenticated user once per request
+
+    The user is memoized with its ID, an app context outliving the request
+    can never hand it to a request authenticated as someone else.
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        User object
+    """
+
+    memo = g.get("current_user")
+    if memo is None or memo[0] != user_id:
+        memo = g.current_user = (user_id, UserService().read_by_id(user_id))
+    return memo[1]
+
+
+def auth(*value, all_of=(), any_of=()):
     """
     Authorize user by decoding token
 
+    Permissions passed positionally or in `all_of` are all required, at
+    least one permission of `any_of` is required. Both are compiled into
+    bitmasks once, so a check is a single integer AND.
+
     Args:
         f: Function
+        all_of: Permissions that are all required
+        any_of: Permissions of which at least one is required
 
     Raises:
         Unauthorized: Authorization Missing.
@@ -50,8 +87,12 @@ def auth(*value):
     """
 
     def decorator(f):
+        all_of_mask = permission_registry.mask((*value, *all_of))
+        any_of_mask = permission_registry.mask(any_of)
+
         @functools_wraps(f)
         def wrapper_function(*args, **kwargs):
+            g.pop("current_user", None)
             g.user = None
             g.permission = value
             authorization = request.headers.get("Authorization")
@@ -66,11 +107,21 @@ def auth(*value):
 
             decoded = decode_jwt_token(token)
             if decoded and "sub" in decoded.keys():
-                g.user = UserService().read_by_id(decoded["sub"])
-                permissions = redis.get(g.user.role.role_name)
-                if permissions:
-                    if g.permission[0] in permissions:
-                        return f(*args, **kwargs)
+                if JWT_ROLE_CLAIM_AUTH and "role_name" in decoded:
+                    # User row is only queried if the handler touches g.user
+                    g.user = LocalProxy(partial(load_user, decoded["sub"]))
+                    role_name = decoded["role_name"]
+                else:
+                    g.user = load_user(decoded["sub"])
+                    if not g.user:
+                        raise Unauthorized("Invalid Token")
+                    role_name = g.user.role.role_name
+
+                mask = permission_cache.get(role_name)
+                if mask is not None and permission_registry.allows(
+                    mask, all_of=all_of_mask, any_of=any_of_mask
+                ):
+                    return f(*args, **kwargs)
             else:
                 raise Unauthorized("Invalid Token")
 
@@ -0,0 +1,70 @@
+"""
+Sparse Fieldset Decorator
+
+Description:
+    - This module contains a marshalling decorator that limits the records of
+    a response to the fields requested with `fields=`.
+
+"""
+
+from functools import wraps
+from http import HTTPStatus
+
+from flask import current_app, request
+from flask_restx import Model, Namespace, marshal
+
+from flask_boilerplate.schemas.pagination import fields_parser
+
+
+def marshal_with_fields(
+    namespace: Namespace,
+    model: Model,
+    code: HTTPStatus = HTTPStatus.OK,
+    skip_none: bool = False,
+):
+    """
+    Marshal With Fields
+
+    Description:
+        - This is used in place of `marshal_with` on read APIs, records under
+        `data` only keep fields named in `fields` query parameter.
+        - Without `fields` the `X-Fields` mask header is honoured as before.
+
+    Args:
+        - `namespace (Namespace)`: API namespace. **(Required)**
+        - `model (Model)`: Response model. **(Required)**
+        - `code (HTTPStatus)`: Success status code. **(Optional)**
+        - `skip_none (bool)`: Whether keys with `None` values are left out.
+        **(Optional)**
+
+    Returns:
+        - `decorator (Callable)`: Resource method decorator.
+
+    """
+
+    def decorator(f):
+        @namespace.response(code=code, description=code.phrase, model=model)
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            response = f(*args, **kwargs)
+            data, *rest = (
+                response if isinstance(response, tuple) else (response,)
+            )
+            status = rest[0] if rest else code
+
+            fields: list[str] | None = fields_parser.parse_args()["fields"]
+            if fields and status < HTTPStatus.BAD_REQUEST:
+                mask: str | None = f"*,data{{{','.join(fields)}}}"
+            else:
+                mask = request.headers.get(
+                    current_app.config["RESTX_MASK_HEADER"]
+                )
+
+            return (
+                marshal(data, model, mask=mask, skip_none=skip_none),
+                *rest,
+            )
+
+        return wrapper
+
+    return decorator
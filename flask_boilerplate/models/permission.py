@@ -21,6 +21,9 @@ class PermissionTable(BaseTable, db.Model):
 
     """
 
+    __entity_cache__ = True
+    __reference_cache__ = True
+
     permission_name: Mapped[str] = mapped_column(String(2_55), unique=True)
     permission_description: Mapped[str] = mapped_column(
         String(2_55), nullable=True
@@ -21,6 +21,9 @@ class RoleTable(BaseTable, db.Model):
 
     """
 
+    __entity_cache__ = True
+    __reference_cache__ = True
+
     role_name: Mapped[str] = mapped_column(String(2_55), unique=True)
     role_description: Mapped[str] = mapped_column(String(2_55), nullable=True)
 
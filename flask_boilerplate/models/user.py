@@ -23,6 +23,8 @@ class UserTable(BaseTable):
 
     """
 
+    __entity_cache__ = True
+
     first_name: Mapped[str] = mapped_column(String(2_55))
     last_name: Mapped[str] = mapped_column(String(2_55))
     contact: Mapped[str] = mapped_column(String(2_55), nullable=True)
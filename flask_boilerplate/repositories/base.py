@@ -6,9 +6,45 @@ Description:
 
 """
 
+from collections.abc import Iterable, Mapping
 from typing import Generic, Type, TypeVar
 
+from sqlalchemy import (
+    CTE,
+    Column,
+    ColumnElement,
+    Delete,
+    Insert,
+    Result,
+    Row,
+    RowMapping,
+    Select,
+    Update,
+    delete,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+from werkzeug.exceptions import BadRequest
+
+from flask_boilerplate.constants.base import (
+    BULK_BATCH_SIZE,
+    BULK_READONLY_FIELDS,
+    ERROR_MESSAGES,
+    SYSTEM_COLUMNS,
+    UNKNOWN_FIELDS,
+)
+from flask_boilerplate.core.middlewares import integrity_error_message
 from flask_boilerplate.database.base import BaseTable, db
+from flask_boilerplate.database.unit_of_work import commit
+from flask_boilerplate.services.entity_cache import entity_cache
+from flask_boilerplate.services.reference_cache import (
+    ReferenceSnapshot,
+    reference_cache,
+)
 
 Model = TypeVar("Model", bound=BaseTable)
 
@@ -22,9 +58,12 @@ class BaseRepository(Generic[Model]):
 
     Attributes:
         - `model (Model)`: Model object. **(Required)**
+        - `private_columns (tuple[str])`: Columns never read in row mode.
 
     """
 
+    private_columns: tuple[str, ...] = ()
+
     def __init__(self, model: Type[Model]) -> None:
         """
         Base Repository Constructor
@@ -60,36 +99,129 @@ class BaseRepository(Generic[Model]):
         db_instance: Model = self.model(**entity)
 
         db.session.add(instance=db_instance)
-        db.session.commit()
+        commit()
         db.session.refresh(instance=db_instance)
 
         return db_instance
 
-    def create_multiple(self, entities) -> list[Model]:
+    def create_row(self, entity) -> RowMapping:
+        """
+        Create Row
+
+        Description:
+            - This is used to create entity with a single
+            `INSERT ... RETURNING` statement, the created row is returned
+            without reading it back.
+
+        Args:
+            - `entity (dict)`: Entity object. **(Required)**
+
+        Returns:
+            - `row (RowMapping)`: Created entity row.
+
+        """
+
+        statement: Insert = (
+            insert(self.model.__table__)
+            .values(**entity)
+            .returning(*self._columns().values())
+        )
+
+        row: RowMapping = db.session.execute(statement).mappings().one()
+        commit()
+
+        return row
+
+    def create_multiple(self, entities) -> tuple[list[RowMapping], list[dict]]:
         """
         Create Multiple Entities
 
         Description:
-            - This is used to create multiple entities.
+            - This is used to create multiple entities in a single
+            transaction.
+            - Entities are inserted in batches with multi-row
+            `INSERT ... RETURNING` statements, each batch in a savepoint.
+            - When a batch violates a constraint it is retried row by row, so
+            only failing rows are rejected and reported.
 
         Args:
-            - `entities (List[self.model])`: List of entity objects.
+            - `entities (List[dict])`: List of entity objects.
             **(Required)**
 
         Returns:
-            - `entities (List[Model])`: List of entity objects.
+            - `rows (List[RowMapping])`: Created entity rows in request order.
+            - `errors (List[dict])`: Index and message of every rejected
+            entity.
 
         """
 
-        db_instances: list[Model] = [
-            self.model(**entity) for entity in entities
-        ]
+        statement: Insert = insert(self.model.__table__).returning(
+            *self._columns().values(), sort_by_parameter_order=True
+        )
+        rows: dict[int, RowMapping] = {}
+        errors: list[dict] = []
+
+        for start in range(0, len(entities), BULK_BATCH_SIZE):
+            batch: dict[int, dict] = dict(
+                enumerate(entities[start : start + BULK_BATCH_SIZE], start)
+            )
+
+            try:
+                with db.session.begin_nested():
+                    rows.update(self._insert_rows(statement, batch))
+            except IntegrityError:
+                for index, entity in batch.items():
+                    try:
+                        with db.session.begin_nested():
+                            rows.update(
+                                self._insert_rows(statement, {index: entity})
+                            )
+                    except IntegrityError as ex:
+                        errors.append(
+                            {
+                                "index": index,
+                                "message": integrity_error_message(ex)
+                                or ERROR_MESSAGES["409"],
+                            }
+                        )
+
+        commit()
+
+        return [rows[index] for index in sorted(rows)], errors
+
+    def _insert_rows(
+        self, statement: Insert, entities: dict[int, dict]
+    ) -> dict[int, RowMapping]:
+        """
+        Insert Rows
+
+        Description:
+            - This is used to execute insert statement for indexed entities.
+            - Entities are grouped by the keys they set, so columns left out
+            still get their defaults.
+
+        Args:
+            - `statement (Insert)`: Insert statement. **(Required)**
+            - `entities (dict[int, dict])`: Entities by request index.
+            **(Required)**
+
+        Returns:
+            - `rows (dict[int, RowMapping])`: Created rows by request index.
+
+        """
+
+        groups: dict[frozenset, list[int]] = {}
+        for index, entity in entities.items():
+            groups.setdefault(frozenset(entity), []).append(index)
 
-        db.session.add_all(instances=db_instances)
-        db.session.commit()
-        db.session.refresh(instance=db_instances)
+        rows: dict[int, RowMapping] = {}
+        for indexes in groups.values():
+            result = db.session.execute(
+                statement, [entities[index] for index in indexes]
+            )
+            rows.update(zip(indexes, result.mappings()))
 
-        return db_instances
+        return rows
 
     def read_by_id(self, entity_id) -> Model | None:
         """
@@ -97,6 +229,8 @@ class BaseRepository(Generic[Model]):
 
         Description:
             - This is used to read entity by ID.
+            - For models using entity cache, entity is built from its cached
+            row without a query when it isn't already in the session.
 
         Args:
             - `entity_id` (int): Entity ID. **(Required)**
@@ -106,7 +240,35 @@ class BaseRepository(Generic[Model]):
 
         """
 
-        return db.session.get(entity=self.model, ident=entity_id)
+        if not entity_cache.enabled_for(self.model):
+            return db.session.get(entity=self.model, ident=entity_id)
+
+        instance: Model | None = db.session.identity_map.get(
+            identity_key(self.model, entity_id)
+        )
+        if instance is not None:
+            return instance
+
+        row: dict | None = entity_cache.get(self.model, entity_id)
+        if row is None:
+            instance = db.session.get(entity=self.model, ident=entity_id)
+            if instance is not None:
+                entity_cache.set(
+                    self.model,
+                    entity_id,
+                    {
+                        name: getattr(instance, name)
+                        for name in self._columns()
+                    },
+                )
+            return instance
+
+        # Columns left out of the cache are loaded on first access
+        instance = self.model(**row)
+        make_transient_to_detached(instance)
+        db.session.add(instance)
+
+        return instance
 
     def read_by_column(self, entity_column, entity_value) -> Model | None:
         """
@@ -148,6 +310,184 @@ class BaseRepository(Generic[Model]):
 
         return db.session.query(self.model).all()
 
+    def read_reference_row(self, entity_column, entity_value) -> Row | None:
+        """
+        Read Reference Row
+
+        Description:
+            - This is used to read first row having a column value as a
+            read-only row, for reference tables it is found in the table
+            snapshot without a query.
+            - Other tables, and reference tables while the snapshot can't be
+            used, are queried, so a row is returned either way.
+
+        Args:
+            - `entity_column` (str): Entity column. **(Required)**
+            - `entity_value` (str): Entity value. **(Required)**
+
+        Returns:
+            - `row` (Row): Entity row or `None`.
+
+        """
+
+        snapshot: ReferenceSnapshot | None = self._reference_snapshot()
+        if snapshot is not None and snapshot.has_column(entity_column):
+            return snapshot.find(entity_column, entity_value)
+
+        return db.session.execute(
+            self._select()
+            .where(self.model.__table__.c[entity_column] == entity_value)
+            .order_by(self._columns()["id"])
+        ).first()
+
+    def read_reference_rows(self) -> list[Row]:
+        """
+        Read Reference Rows
+
+        Description:
+            - This is used to read all entities as read-only rows, for
+            reference tables they are taken from the table snapshot without
+            a query.
+            - Other tables, and reference tables while the snapshot can't be
+            used, are queried, so rows are returned either way.
+
+        Returns:
+            - `rows` (list[Row]): Entity rows ordered by ID.
+
+        """
+
+        snapshot: ReferenceSnapshot | None = self._reference_snapshot()
+        if snapshot is not None:
+            return list(snapshot.rows)
+
+        return list(self._read_table())
+
+    def read_page(
+        self, limit, after_id=None
+    ) -> tuple[list[Model], int | None]:
+        """
+        Read Page of Entities
+
+        Description:
+            - This is used to read entities ordered by ID, starting after a
+            given ID.
+            - Pages are read with a primary key seek, so every page costs the
+            same no matter how deep it is.
+
+        Args:
+            - `limit (int)`: Maximum number of entities. **(Required)**
+            - `after_id (int)`: ID of the last entity of previous page.
+            **(Optional)**
+
+        Returns:
+            - `entities (list[Model])`: List of entity objects.
+            - `last_id (int)`: ID of the last entity when more entities
+            follow, otherwise `None`.
+
+        """
+
+        query = db.session.query(self.model)
+        if after_id is not None:
+            query = query.filter(self.model.id > after_id)
+
+        # One extra row tells whether a next page exists
+        entities: list[Model] = (
+            query.order_by(self.model.id).limit(limit + 1).all()
+        )
+
+        if len(entities) <= limit:
+            return entities, None
+
+        return entities[:limit], entities[limit - 1].id
+
+    def read_row_by_id(self, entity_id, fields=None) -> Mapping | None:
+        """
+        Read Row by ID
+
+        Description:
+            - This is used to read entity by ID as a plain row mapping for
+            read-only use.
+            - Rows skip ORM hydration: no identity map, attribute
+            instrumentation or relationship loading.
+            - For models using entity cache, the whole row is cached and the
+            requested fields are picked from it.
+
+        Args:
+            - `entity_id` (int): Entity ID. **(Required)**
+            - `fields (list[str])`: Columns to read, all by default.
+            **(Optional)**
+
+        Returns:
+            - `row` (Mapping): Entity row.
+
+        """
+
+        statement: Select = self._select(fields).where(
+            self.model.__table__.c.id == entity_id
+        )
+
+        if not entity_cache.enabled_for(self.model):
+            return db.session.execute(statement).mappings().first()
+
+        row: Mapping | None = entity_cache.get(self.model, entity_id)
+        if row is None:
+            row = (
+                db.session.execute(
+                    self._select().where(
+                        self.model.__table__.c.id == entity_id
+                    )
+                )
+                .mappings()
+                .first()
+            )
+            if row is None:
+                return None
+
+            entity_cache.set(self.model, entity_id, row)
+
+        return {
+            column.key: row[column.key]
+            for column in statement.selected_columns
+        }
+
+    def read_rows_page(
+        self, limit, after_id=None, fields=None
+    ) -> tuple[list[RowMapping], int | None]:
+        """
+        Read Page of Rows
+
+        Description:
+            - This is used to read a page of entities as plain row mappings
+            for read-only use, ordered by ID and starting after a given ID.
+
+        Args:
+            - `limit (int)`: Maximum number of rows. **(Required)**
+            - `after_id (int)`: ID of the last row of previous page.
+            **(Optional)**
+            - `fields (list[str])`: Columns to read, all by default.
+            **(Optional)**
+
+        Returns:
+            - `rows (list[RowMapping])`: List of entity rows.
+            - `last_id (int)`: ID of the last row when more rows follow,
+            otherwise `None`.
+
+        """
+
+        id_column = self.model.__table__.c.id
+        statement: Select = self._select(fields).order_by(id_column)
+        if after_id is not None:
+            statement = statement.where(id_column > after_id)
+
+        rows: list[RowMapping] = list(
+            db.session.execute(statement.limit(limit + 1)).mappings()
+        )
+
+        if len(rows) <= limit:
+            return rows, None
+
+        return rows[:limit], rows[limit - 1]["id"]
+
     def update(self, entity_id, entity) -> Model | bool:
         """
         Update Entity
@@ -172,7 +512,8 @@ class BaseRepository(Generic[Model]):
         for key, value in entity.items():
             setattr(db_instance, key, value)
 
-        db.session.commit()
+        self._invalidate([entity_id])
+        commit()
         db.session.refresh(instance=db_instance)
 
         return db_instance
@@ -198,6 +539,323 @@ class BaseRepository(Generic[Model]):
             return False
 
         db.session.delete(instance=db_instance)
-        db.session.commit()
+        self._invalidate([entity_id])
+        commit()
 
         return True
+
+    def update_row(
+        self, entity_id, entity, versions=None, previous=None
+    ) -> RowMapping | None:
+        """
+        Update Row
+
+        Description:
+            - This is used to update entity with a single
+            `UPDATE ... WHERE id = :id RETURNING` statement, the updated row
+            is returned without reading it before or after.
+            - When versions are given the statement also matches
+            `version IN (:versions)`, so it only applies to those versions.
+            - Keys that are not table columns are ignored, like setting them
+            on an ORM object, system columns such as ID and version are
+            never set from entity.
+            - Values of `previous` columns before the update are returned as
+            `previous_<column>`, read by the same statement from a
+            `SELECT ... FOR UPDATE` CTE so no concurrent write can fall
+            between reading and updating them.
+
+        Args:
+            - `entity_id (int)`: Entity ID. **(Required)**
+            - `entity (dict)`: Column values to set. **(Required)**
+            - `versions (list[int])`: Accepted entity versions.
+            **(Optional)**
+            - `previous (list[str])`: Columns to return the values before
+            the update of. **(Optional)**
+
+        Returns:
+            - `row (RowMapping)`: Updated entity row or `None` when entity
+            doesn't exist or has another version.
+
+        """
+
+        table = self.model.__table__
+        returning: list[ColumnElement] = list(self._columns().values())
+        statement: Update = update(table).values(
+            **{
+                key: value
+                for key, value in entity.items()
+                if key in table.c and key not in SYSTEM_COLUMNS
+            }
+        )
+        if previous:
+            before: CTE = (
+                select(table.c.id, *(table.c[name] for name in previous))
+                .where(table.c.id == entity_id)
+                .with_for_update()
+                .cte("previous")
+            )
+            statement = statement.where(table.c.id == before.c.id)
+            returning.extend(
+                before.c[name].label(f"previous_{name}") for name in previous
+            )
+        else:
+            statement = statement.where(table.c.id == entity_id)
+        statement = statement.returning(*returning)
+        if versions is not None:
+            statement = statement.where(table.c.version.in_(versions))
+
+        row: RowMapping | None = (
+            db.session.execute(statement).mappings().first()
+        )
+        if row is not None:
+            self._invalidate([entity_id])
+        commit()
+
+        return row
+
+    def update_multiple(
+        self, entity, entity_ids=None, filters=None
+    ) -> list[RowMapping]:
+        """
+        Update Multiple Entities
+
+        Description:
+            - This is used to update every entity matching given IDs and
+            filters with a single `UPDATE ... RETURNING` statement.
+
+        Args:
+            - `entity (dict)`: Column values to set. **(Required)**
+            - `entity_ids (list[int])`: Entity IDs. **(Optional)**
+            - `filters (dict)`: Column values to match. **(Optional)**
+
+        Raises:
+            - `BadRequest`: When a field can't be updated in bulk.
+
+        Returns:
+            - `rows (list[RowMapping])`: Updated entity rows.
+
+        """
+
+        columns: dict[str, Column] = self._bulk_columns()
+        rejected: list[str] = [name for name in entity if name not in columns]
+        if rejected:
+            raise BadRequest(
+                BULK_READONLY_FIELDS.format(fields=", ".join(rejected))
+            )
+
+        statement: Update = (
+            update(self.model.__table__)
+            .where(*self._where(entity_ids, filters))
+            .values(**entity)
+            .returning(*self._columns().values())
+        )
+
+        rows: list[RowMapping] = list(db.session.execute(statement).mappings())
+        self._invalidate(row["id"] for row in rows)
+        commit()
+
+        return rows
+
+    def delete_multiple(
+        self, entity_ids=None, filters=None
+    ) -> list[RowMapping]:
+        """
+        Delete Multiple Entities
+
+        Description:
+            - This is used to delete every entity matching given IDs and
+            filters with a single `DELETE ... RETURNING` statement.
+            - Dependent rows are removed by the database `ON DELETE CASCADE`
+            foreign keys.
+
+        Args:
+            - `entity_ids (list[int])`: Entity IDs. **(Optional)**
+            - `filters (dict)`: Column values to match. **(Optional)**
+
+        Returns:
+            - `rows (list[RowMapping])`: Deleted entity rows.
+
+        """
+
+        statement: Delete = (
+            delete(self.model.__table__)
+            .where(*self._where(entity_ids, filters))
+            .returning(*self._columns().values())
+        )
+
+        rows: list[RowMapping] = list(db.session.execute(statement).mappings())
+        self._invalidate(row["id"] for row in rows)
+        commit()
+
+        return rows
+
+    def _select(self, fields=None) -> Select:
+        """
+        Select Statement
+
+        Description:
+            - This is used to build Core select statement of the table,
+            projected to the requested columns.
+            - ID is always read since pages are keyed by it, and version
+            since responses are tagged with it.
+
+        Args:
+            - `fields (list[str])`: Columns to read, all by default.
+            **(Optional)**
+
+        Raises:
+            - `BadRequest`: When a field is not a readable column.
+
+        Returns:
+            - `statement (Select)`: Select statement.
+
+        """
+
+        columns: dict[str, Column] = self._columns()
+        if not fields:
+            return select(*columns.values())
+
+        unknown: list[str] = [name for name in fields if name not in columns]
+        if unknown:
+            raise BadRequest(UNKNOWN_FIELDS.format(fields=", ".join(unknown)))
+
+        return select(
+            *(
+                columns[name]
+                for name in dict.fromkeys(["id", "version", *fields])
+            )
+        )
+
+    def _columns(self) -> dict[str, Column]:
+        """
+        Readable Columns
+
+        Description:
+            - This is used to get table columns by name, without private
+            columns.
+
+        Returns:
+            - `columns (dict[str, Column])`: Readable columns.
+
+        """
+
+        return {
+            column.name: column
+            for column in self.model.__table__.columns
+            if column.name not in self.private_columns
+        }
+
+    def _bulk_columns(self) -> dict[str, Column]:
+        """
+        Bulk Update Columns
+
+        Description:
+            - This is used to get columns that can be set on many rows at
+            once, without system, private and unique columns.
+
+        Returns:
+            - `columns (dict[str, Column])`: Columns by name.
+
+        """
+
+        return {
+            name: column
+            for name, column in self._columns().items()
+            if name not in SYSTEM_COLUMNS and not column.unique
+        }
+
+    def _where(self, entity_ids=None, filters=None) -> list[ColumnElement]:
+        """
+        Where Clause
+
+        Description:
+            - This is used to build conditions matching given IDs and column
+            values, a list value matches any of its items.
+
+        Args:
+            - `entity_ids (list[int])`: Entity IDs. **(Optional)**
+            - `filters (dict)`: Column values to match. **(Optional)**
+
+        Raises:
+            - `BadRequest`: When a filter is not a readable column.
+
+        Returns:
+            - `conditions (list[ColumnElement])`: Where conditions.
+
+        """
+
+        columns: dict[str, Column] = self._columns()
+        filters = filters or {}
+
+        unknown: list[str] = [name for name in filters if name not in columns]
+        if unknown:
+            raise BadRequest(UNKNOWN_FIELDS.format(fields=", ".join(unknown)))
+
+        conditions: list[ColumnElement] = [
+            (
+                columns[name].in_(value)
+                if isinstance(value, list)
+                else columns[name] == value
+            )
+            for name, value in filters.items()
+        ]
+        if entity_ids:
+            conditions.append(columns["id"].in_(entity_ids))
+
+        return conditions
+
+    def _invalidate(self, entity_ids: Iterable) -> None:
+        """
+        Invalidate Cached Entities
+
+        Description:
+            - This is used to drop written entities from entity cache, when
+            the model uses it.
+
+        Args:
+            - `entity_ids (Iterable)`: Entity IDs. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        if entity_cache.enabled_for(self.model):
+            entity_cache.invalidate(self.model, entity_ids, db.session)
+
+    def _reference_snapshot(self) -> ReferenceSnapshot | None:
+        """
+        Reference Snapshot
+
+        Description:
+            - This is used to get in-memory snapshot of the table, when the
+            model is a reference table and the snapshot is usable.
+
+        Returns:
+            - `snapshot (ReferenceSnapshot)`: Table snapshot or `None`.
+
+        """
+
+        if not reference_cache.enabled_for(self.model):
+            return None
+
+        return reference_cache.snapshot(
+            self.model, db.session, self._read_table
+        )
+
+    def _read_table(self) -> Result:
+        """
+        Read Table
+
+        Description:
+            - This is used to read readable columns of every row, ordered by
+            ID.
+
+        Returns:
+            - `result (Result)`: Query result.
+
+        """
+
+        return db.session.execute(
+            self._select().order_by(self._columns()["id"])
+        )
@@ -6,9 +6,13 @@ Description:
 
 """
 
+from sqlalchemy import RowMapping, select
+
 from flask_boilerplate.models.role import RoleTable
+from flask_boilerplate.models.user import UserTable
+from flask_boilerplate.services.entity_cache import entity_cache
 
-from .base import BaseRepository
+from .base import BaseRepository, db
 
 
 class RoleRepository(BaseRepository[RoleTable]):
@@ -30,3 +34,40 @@ class RoleRepository(BaseRepository[RoleTable]):
         """
 
         super().__init__(RoleTable)
+
+    def delete_multiple(
+        self, entity_ids=None, filters=None
+    ) -> list[RowMapping]:
+        """
+        Delete Multiple Entities
+
+        Description:
+            - This is used to delete roles matching given IDs and filters.
+            - Users of deleted roles are removed by the database cascade,
+            their cached entities are dropped as well.
+
+        Args:
+            - `entity_ids (list[int])`: Entity IDs. **(Optional)**
+            - `filters (dict)`: Column values to match. **(Optional)**
+
+        Returns:
+            - `rows (list[RowMapping])`: Deleted entity rows.
+
+        """
+
+        user_ids: list[int] = list(
+            db.session.scalars(
+                select(UserTable.id).where(
+                    UserTable.role_id.in_(
+                        select(RoleTable.id).where(
+                            *self._where(entity_ids, filters)
+                        )
+                    )
+                )
+            )
+        )
+
+        if entity_cache.enabled_for(UserTable):
+            entity_cache.invalidate(UserTable, user_ids, db.session)
+
+        return super().delete_multiple(entity_ids=entity_ids, filters=filters)
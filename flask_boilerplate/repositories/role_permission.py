@@ -8,6 +8,7 @@ Description:
 
 from sqlalchemy.orm.query import Query
 
+from flask_boilerplate.models.permission import PermissionTable
 from flask_boilerplate.models.role import RoleTable
 from flask_boilerplate.models.role_permission import RolePermissionTable
 
@@ -83,3 +84,69 @@ class RolePermissionRepository(BaseRepository[RolePermissionTable]):
             RolePermissionTable.permission_id == permission_id,
         )
         return row
+
+    def get_role_permission_names(self, role_name) -> list[str]:
+        """
+        Get Role Permission Names
+
+        Description:
+            - This is used to get names of all permissions against a role in
+            a single query.
+
+        Args:
+            - `role_name (str)`: Role name. **(Required)**
+
+        Returns:
+            - `permissions (list[str])`: Permission names.
+
+        """
+
+        rows = (
+            db.session.query(PermissionTable.permission_name)
+            .join(
+                RolePermissionTable,
+                RolePermissionTable.permission_id == PermissionTable.id,
+            )
+            .join(RoleTable, RoleTable.id == RolePermissionTable.role_id)
+            .filter(RoleTable.role_name == role_name)
+            .all()
+        )
+
+        return [row.permission_name for row in rows]
+
+    def get_all_role_permission_names(self) -> dict[str, list[str]]:
+        """
+        Get All Role Permission Names
+
+        Description:
+            - This is used to get names of all permissions of every role in
+            a single query, roles without permissions get an empty list.
+
+        Returns:
+            - `role_permissions (dict[str, list[str]])`: Permission names by
+            role name.
+
+        """
+
+        rows = (
+            db.session.query(
+                RoleTable.role_name, PermissionTable.permission_name
+            )
+            .outerjoin(
+                RolePermissionTable,
+                RolePermissionTable.role_id == RoleTable.id,
+            )
+            .outerjoin(
+                PermissionTable,
+                PermissionTable.id == RolePermissionTable.permission_id,
+            )
+            .all()
+        )
+
+        role_permissions: dict[str, list[str]] = {}
+        for row in rows:
+            permissions = role_permissions.setdefault(row.role_name, [])
+            if row.permission_name:
+                permissions.append(row.permission_name)
+
+        return role_permissions
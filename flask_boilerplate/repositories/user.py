@@ -6,9 +6,9 @@ Description:
 
 """
 
-from passlib.hash import pbkdf2_sha256
-
+from flask_boilerplate.core.hashing import password_hasher
 from flask_boilerplate.database.base import db
+from flask_boilerplate.database.unit_of_work import commit
 from flask_boilerplate.models.user import UserTable
 
 from .base import BaseRepository
@@ -23,6 +23,9 @@ class UserRepository(BaseRepository[UserTable]):
 
     """
 
+    # Password hashes are never returned by read-only endpoints
+    private_columns: tuple[str, ...] = ("password",)
+
     def __init__(self) -> None:
         """
         Role Repository Constructor
@@ -49,10 +52,56 @@ class UserRepository(BaseRepository[UserTable]):
 
         """
 
-        entity["password"] = pbkdf2_sha256.hash(entity["password"])
+        entity["password"] = password_hasher.hash(entity["password"])
 
         return super().create(entity)
 
+    def create_row(self, entity):
+        """
+        Create Row
+
+        Description:
+            - This is used to create entity with a single statement.
+
+        Args:
+            - `entity (dict)`: Entity object. **(Required)**
+
+        Returns:
+            - `row (RowMapping)`: Created entity row.
+
+        """
+
+        entity["password"] = password_hasher.hash(entity["password"])
+
+        return super().create_row(entity)
+
+    def create_multiple(self, entities) -> tuple[list, list[dict]]:
+        """
+        Create Multiple Entities
+
+        Description:
+            - This is used to create multiple entities, passwords are hashed
+            in parallel across the hashing pool before inserting.
+
+        Args:
+            - `entities (List[dict])`: List of entity objects.
+            **(Required)**
+
+        Returns:
+            - `rows (List[RowMapping])`: Created entity rows.
+            - `errors (List[dict])`: Index and message of every rejected
+            entity.
+
+        """
+
+        hashes: list[str] = password_hasher.hash_many(
+            [entity["password"] for entity in entities]
+        )
+        for entity, password_hash in zip(entities, hashes):
+            entity["password"] = password_hash
+
+        return super().create_multiple(entities)
+
     def get_validate_user(self, email, passowrd) -> UserTable | None:
         user: UserTable | None = (
             db.session.query(UserTable)
@@ -60,8 +109,15 @@ class UserRepository(BaseRepository[UserTable]):
             .first()
         )
         if user:
-            is_valid_user: bool = pbkdf2_sha256.verify(passowrd, user.password)
+            is_valid_user: bool = password_hasher.verify(
+                passowrd, user.password
+            )
             if is_valid_user:
+                # Upgrade hashes made under an older cost policy
+                if password_hasher.needs_rehash(user.password):
+                    user.password = password_hasher.hash(passowrd)
+                    commit()
+
                 return user
 
         return None
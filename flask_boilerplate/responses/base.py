@@ -6,10 +6,13 @@ Description:
 
 """
 
+from collections.abc import Mapping
+from datetime import datetime
 from typing import List
 from http import HTTPStatus
 
 from flask_boilerplate.constants.base import CONTENT_TYPE_JSON
+from flask_boilerplate.core.etag import make_etag
 
 
 class BaseResponse:
@@ -18,9 +21,62 @@ class BaseResponse:
 
     Description:
         - This is base response for all responses.
+        - Data can be ORM objects or read-only row mappings.
 
     """
 
+    @staticmethod
+    def to_dict(data) -> dict:
+        """
+        To Dictionary
+
+        Description:
+            - This is used to convert an ORM object or a row mapping to
+            dictionary.
+
+        Args:
+            - `data (BaseTable | Mapping)`: Data object. **(Required)**
+
+        Returns:
+            - `data (dict)`: Data dictionary.
+
+        """
+
+        if not isinstance(data, Mapping):
+            return data.to_dict()
+
+        return {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in data.items()
+        }
+
+    @staticmethod
+    def headers(data) -> dict:
+        """
+        Headers
+
+        Description:
+            - This is used to create headers of a single entity response,
+            tagged with entity version when it is known.
+
+        Args:
+            - `data (BaseTable | Mapping)`: Data object. **(Required)**
+
+        Returns:
+            - `headers (dict)`: Response headers.
+
+        """
+
+        version: int | None = (
+            data.get("version")
+            if isinstance(data, Mapping)
+            else getattr(data, "version", None)
+        )
+        if version is None:
+            return CONTENT_TYPE_JSON
+
+        return {**CONTENT_TYPE_JSON, "ETag": make_etag(version)}
+
     @staticmethod
     def create_response(data):
         """
@@ -38,8 +94,37 @@ class BaseResponse:
         """
 
         return (
-            {"success": True, "data": data.to_dict()},
+            {"success": True, "data": BaseResponse.to_dict(data)},
             HTTPStatus.CREATED,
+            BaseResponse.headers(data),
+        )
+
+    @staticmethod
+    def bulk_create_response(data, errors):
+        """
+        Bulk Create Response
+
+        Description:
+            - This is used to create bulk create response, partial success is
+            returned as multi-status.
+
+        Args:
+            - `data (list)`: Created data objects. **(Required)**
+            - `errors (list)`: Index and message of rejected items.
+            **(Required)**
+
+        Returns:
+            - `response (tuple)`: Response tuple.
+
+        """
+
+        return (
+            {
+                "success": not errors,
+                "data": [BaseResponse.to_dict(item) for item in data],
+                "errors": errors,
+            },
+            HTTPStatus.MULTI_STATUS if errors else HTTPStatus.CREATED,
             CONTENT_TYPE_JSON,
         )
 
@@ -60,13 +145,13 @@ class BaseResponse:
         """
 
         return (
-            {"success": True, "data": data.to_dict()},
+            {"success": True, "data": BaseResponse.to_dict(data)},
             HTTPStatus.OK,
-            CONTENT_TYPE_JSON,
+            BaseResponse.headers(data),
         )
 
     @staticmethod
-    def read_all_response(data):
+    def read_all_response(data, next_cursor=None):
         """
         Read All Response
 
@@ -75,6 +160,7 @@ class BaseResponse:
 
         Args:
             - `data (dict)`: Data object. **(Required)**
+            - `next_cursor (str)`: Cursor of next page. **(Optional)**
 
         Returns:
             - `response (tuple)`: Response tuple.
@@ -82,7 +168,11 @@ class BaseResponse:
         """
 
         return (
-            {"success": True, "data": [item.to_dict() for item in data]},
+            {
+                "success": True,
+                "data": [BaseResponse.to_dict(item) for item in data],
+                "next_cursor": next_cursor,
+            },
             HTTPStatus.OK,
             CONTENT_TYPE_JSON,
         )
@@ -104,8 +194,55 @@ class BaseResponse:
         """
 
         return (
-            {"success": True, "data": data.to_dict()},
+            {"success": True, "data": BaseResponse.to_dict(data)},
             HTTPStatus.ACCEPTED,
+            BaseResponse.headers(data),
+        )
+
+    @staticmethod
+    def bulk_update_response(data):
+        """
+        Bulk Update Response
+
+        Description:
+            - This is used to create bulk update response.
+
+        Args:
+            - `data (list)`: Updated data objects. **(Required)**
+
+        Returns:
+            - `response (tuple)`: Response tuple.
+
+        """
+
+        return (
+            {
+                "success": True,
+                "data": [BaseResponse.to_dict(item) for item in data],
+            },
+            HTTPStatus.ACCEPTED,
+            CONTENT_TYPE_JSON,
+        )
+
+    @staticmethod
+    def bulk_delete_response(data):
+        """
+        Bulk Delete Response
+
+        Description:
+            - This is used to create bulk delete response.
+
+        Args:
+            - `data (list)`: Deleted data objects. **(Required)**
+
+        Returns:
+            - `response (tuple)`: Response tuple with deleted IDs.
+
+        """
+
+        return (
+            {"success": True, "data": [item["id"] for item in data]},
+            HTTPStatus.OK,
             CONTENT_TYPE_JSON,
         )
 
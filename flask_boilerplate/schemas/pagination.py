@@ -0,0 +1,60 @@
+"""
+Query Validation Schemas
+
+Description:
+    - This file contains query parameter parsers shared by read APIs.
+
+"""
+
+from flask_restx import inputs, reqparse
+
+from flask_boilerplate.constants.base import (
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+)
+
+
+def field_list(value: str) -> list[str]:
+    """
+    Field List
+
+    Description:
+        - This is used to parse a comma separated list of field names.
+
+    Args:
+        - `value (str)`: Comma separated field names. **(Required)**
+
+    Returns:
+        - `fields (list[str])`: Field names without duplicates.
+
+    """
+
+    return list(
+        dict.fromkeys(field.strip() for field in value.split(",") if field)
+    )
+
+
+# Sparse Fieldset Parser
+fields_parser: reqparse.RequestParser = reqparse.RequestParser()
+fields_parser.add_argument(
+    "fields",
+    type=field_list,
+    location="args",
+    help="Comma separated fields to return, all fields by default.",
+)
+
+# Cursor Pagination Parser
+pagination_parser: reqparse.RequestParser = fields_parser.copy()
+pagination_parser.add_argument(
+    "limit",
+    type=inputs.int_range(1, MAX_PAGE_LIMIT),
+    default=DEFAULT_PAGE_LIMIT,
+    location="args",
+    help=f"Number of records, at most {MAX_PAGE_LIMIT}.",
+)
+pagination_parser.add_argument(
+    "after",
+    type=str,
+    location="args",
+    help="Cursor returned as `next_cursor` by previous page.",
+)
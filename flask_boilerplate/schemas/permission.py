@@ -9,7 +9,15 @@ Description:
 from datetime import datetime, timezone
 
 from flask_restx import Model, OrderedModel
-from flask_restx.fields import Boolean, DateTime, Integer, Nested, String
+from flask_restx.fields import (
+    Boolean,
+    DateTime,
+    Integer,
+    List,
+    Nested,
+    Raw,
+    String,
+)
 
 from flask_boilerplate.constants.permission import (
     PERMISSION_DESCRIPTION,
@@ -45,6 +53,7 @@ permission_read_base_schema: Model | OrderedModel = ns_permission.inherit(
     permission_base_schema,
     {
         "id": Integer(readonly=True),
+        "version": Integer(readonly=True),
         "created_at": DateTime(
             required=True,
             readonly=True,
@@ -75,11 +84,83 @@ permission_read_all_schema: Model | OrderedModel = ns_permission.model(
     model={
         "success": Boolean(default=True),
         "data": Nested(permission_read_base_schema, as_list=True),
+        "next_cursor": String(),
     },
     strict=True,
 )
 
 
+# Permission Bulk Error Schema
+permission_bulk_error_schema: Model | OrderedModel = ns_permission.model(
+    name="PermissionBulkErrorSchema",
+    model={
+        "index": Integer(description="Position of item in request"),
+        "message": String(),
+    },
+)
+
+# Permission Bulk Create Read Schema
+permission_bulk_create_read_schema: Model | OrderedModel = ns_permission.model(
+    name="PermissionBulkCreateReadSchema",
+    model={
+        "success": Boolean(default=True),
+        "data": Nested(permission_read_base_schema, as_list=True),
+        "errors": Nested(permission_bulk_error_schema, as_list=True),
+    },
+    strict=True,
+)
+
+# Permission Bulk Selection Schema
+permission_bulk_selection_schema: Model | OrderedModel = ns_permission.model(
+    name="PermissionBulkSelectionSchema",
+    model={
+        "ids": List(Integer(minimum=1), min_items=1),
+        "filter": Raw(description="Column values to match, lists match any"),
+    },
+    strict=True,
+)
+
+# Permission Bulk Update Schema, unique columns can't be set on many rows
+permission_bulk_update_schema: Model | OrderedModel = ns_permission.model(
+    name="PermissionBulkUpdateSchema",
+    model={
+        **permission_bulk_selection_schema,
+        "data": Nested(
+            ns_permission.model(
+                name="PermissionBulkUpdateDataSchema",
+                model={
+                    key: value
+                    for key, value in permission_base_schema.items()
+                    if key not in ("permission_name",)
+                },
+                strict=True,
+            ),
+            required=True,
+        ),
+    },
+    strict=True,
+)
+
+# Permission Bulk Read Schema
+permission_bulk_read_schema: Model | OrderedModel = ns_permission.model(
+    name="PermissionBulkReadSchema",
+    model={
+        "success": Boolean(default=True),
+        "data": Nested(permission_read_base_schema, as_list=True),
+    },
+    strict=True,
+)
+
+# Permission Bulk Delete Read Schema
+permission_bulk_delete_read_schema: Model | OrderedModel = ns_permission.model(
+    name="PermissionBulkDeleteReadSchema",
+    model={
+        "success": Boolean(default=True),
+        "data": List(Integer, description="IDs of deleted permissions"),
+    },
+    strict=True,
+)
+
 # Permission Update Schema
 permission_update_schema: Model | OrderedModel = ns_permission.model(
     "PermissionUpdateSchema",
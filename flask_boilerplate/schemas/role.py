@@ -9,7 +9,15 @@ Description:
 from datetime import datetime, timezone
 
 from flask_restx import Model, OrderedModel
-from flask_restx.fields import Boolean, DateTime, Integer, Nested, String
+from flask_restx.fields import (
+    Boolean,
+    DateTime,
+    Integer,
+    List,
+    Nested,
+    Raw,
+    String,
+)
 
 from flask_boilerplate.constants.role import ROLE_DESCRIPTION, ROLE_NAME
 from flask_boilerplate.namespaces.role import ns_role
@@ -39,6 +47,7 @@ role_read_base_schema: Model | OrderedModel = ns_role.inherit(
     role_base_schema,
     {
         "id": Integer(readonly=True),
+        "version": Integer(readonly=True),
         "created_at": DateTime(
             required=True,
             readonly=True,
@@ -66,6 +75,78 @@ role_read_all_schema: Model | OrderedModel = ns_role.model(
     model={
         "success": Boolean(default=True),
         "data": Nested(role_read_base_schema, as_list=True),
+        "next_cursor": String(),
+    },
+    strict=True,
+)
+
+# Role Bulk Error Schema
+role_bulk_error_schema: Model | OrderedModel = ns_role.model(
+    name="RoleBulkErrorSchema",
+    model={
+        "index": Integer(description="Position of item in request"),
+        "message": String(),
+    },
+)
+
+# Role Bulk Create Read Schema
+role_bulk_create_read_schema: Model | OrderedModel = ns_role.model(
+    name="RoleBulkCreateReadSchema",
+    model={
+        "success": Boolean(default=True),
+        "data": Nested(role_read_base_schema, as_list=True),
+        "errors": Nested(role_bulk_error_schema, as_list=True),
+    },
+    strict=True,
+)
+
+# Role Bulk Selection Schema
+role_bulk_selection_schema: Model | OrderedModel = ns_role.model(
+    name="RoleBulkSelectionSchema",
+    model={
+        "ids": List(Integer(minimum=1), min_items=1),
+        "filter": Raw(description="Column values to match, lists match any"),
+    },
+    strict=True,
+)
+
+# Role Bulk Update Schema, unique columns can't be set on many rows
+role_bulk_update_schema: Model | OrderedModel = ns_role.model(
+    name="RoleBulkUpdateSchema",
+    model={
+        **role_bulk_selection_schema,
+        "data": Nested(
+            ns_role.model(
+                name="RoleBulkUpdateDataSchema",
+                model={
+                    key: value
+                    for key, value in role_base_schema.items()
+                    if key not in ("role_name",)
+                },
+                strict=True,
+            ),
+            required=True,
+        ),
+    },
+    strict=True,
+)
+
+# Role Bulk Read Schema
+role_bulk_read_schema: Model | OrderedModel = ns_role.model(
+    name="RoleBulkReadSchema",
+    model={
+        "success": Boolean(default=True),
+        "data": Nested(role_read_base_schema, as_list=True),
+    },
+    strict=True,
+)
+
+# Role Bulk Delete Read Schema
+role_bulk_delete_read_schema: Model | OrderedModel = ns_role.model(
+    name="RoleBulkDeleteReadSchema",
+    model={
+        "success": Boolean(default=True),
+        "data": List(Integer, description="IDs of deleted roles"),
     },
     strict=True,
 )
@@ -9,7 +9,15 @@ Description:
 from datetime import datetime, timezone
 
 from flask_restx import Model, OrderedModel
-from flask_restx.fields import Boolean, DateTime, Integer, Nested, String
+from flask_restx.fields import (
+    Boolean,
+    DateTime,
+    Integer,
+    List,
+    Nested,
+    Raw,
+    String,
+)
 
 from flask_boilerplate.constants.user import (
     ADDRESS,
@@ -78,6 +86,7 @@ user_read_base_schema: Model | OrderedModel = ns_user.inherit(
     user_base_schema,
     {
         "id": Integer(readonly=True),
+        "version": Integer(readonly=True),
         "created_at": DateTime(
             required=True,
             readonly=True,
@@ -105,6 +114,78 @@ user_read_all_schema: Model | OrderedModel = ns_user.model(
     model={
         "success": Boolean(default=True),
         "data": Nested(user_read_base_schema, as_list=True),
+        "next_cursor": String(),
+    },
+    strict=True,
+)
+
+# User Bulk Error Schema
+user_bulk_error_schema: Model | OrderedModel = ns_user.model(
+    name="UserBulkErrorSchema",
+    model={
+        "index": Integer(description="Position of item in request"),
+        "message": String(),
+    },
+)
+
+# User Bulk Create Read Schema
+user_bulk_create_read_schema: Model | OrderedModel = ns_user.model(
+    name="UserBulkCreateReadSchema",
+    model={
+        "success": Boolean(default=True),
+        "data": Nested(user_read_base_schema, as_list=True),
+        "errors": Nested(user_bulk_error_schema, as_list=True),
+    },
+    strict=True,
+)
+
+# User Bulk Selection Schema
+user_bulk_selection_schema: Model | OrderedModel = ns_user.model(
+    name="UserBulkSelectionSchema",
+    model={
+        "ids": List(Integer(minimum=1), min_items=1),
+        "filter": Raw(description="Column values to match, lists match any"),
+    },
+    strict=True,
+)
+
+# User Bulk Update Schema, unique columns can't be set on many rows
+user_bulk_update_schema: Model | OrderedModel = ns_user.model(
+    name="UserBulkUpdateSchema",
+    model={
+        **user_bulk_selection_schema,
+        "data": Nested(
+            ns_user.model(
+                name="UserBulkUpdateDataSchema",
+                model={
+                    key: value
+                    for key, value in user_base_schema.items()
+                    if key not in ("username", "email")
+                },
+                strict=True,
+            ),
+            required=True,
+        ),
+    },
+    strict=True,
+)
+
+# User Bulk Read Schema
+user_bulk_read_schema: Model | OrderedModel = ns_user.model(
+    name="UserBulkReadSchema",
+    model={
+        "success": Boolean(default=True),
+        "data": Nested(user_read_base_schema, as_list=True),
+    },
+    strict=True,
+)
+
+# User Bulk Delete Read Schema
+user_bulk_delete_read_schema: Model | OrderedModel = ns_user.model(
+    name="UserBulkDeleteReadSchema",
+    model={
+        "success": Boolean(default=True),
+        "data": List(Integer, description="IDs of deleted users"),
     },
     strict=True,
 )
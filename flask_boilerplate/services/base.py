@@ -8,8 +8,23 @@ Description:
 
 from typing import Any
 
+from werkzeug.exceptions import BadRequest, PreconditionFailed
+
+from flask_boilerplate.constants.base import (
+    BULK_INVALID_FILTER,
+    BULK_NO_CHANGES,
+    BULK_NO_SELECTION,
+    BULK_NOT_LIST,
+    BULK_TOO_LARGE,
+    MAX_BULK_SIZE,
+    VERSION_MISMATCH,
+)
+from flask_boilerplate.core.pagination import decode_cursor, encode_cursor
 from flask_boilerplate.repositories.base import BaseRepository
 
+# Types a filter value, or an item of a list filter value, can have
+FILTER_SCALARS: tuple[type, ...] = (str, int, float, bool, type(None))
+
 
 class BaseService:
     """
@@ -57,6 +72,54 @@ class BaseService:
 
         return self.repository.create(entity=entity)
 
+    def create_row(self, entity) -> Any:
+        """
+        Create Row
+
+        Description:
+            - This is used to create entity and get it back as a row, in one
+            round trip.
+
+        Args:
+            - `entity (dict)`: Entity object. **(Required)**
+
+        Returns:
+            - `row (RowMapping)`: Created entity row.
+
+        """
+
+        return self.repository.create_row(entity=entity)
+
+    def create_multiple(self, entities) -> tuple[list, list[dict]]:
+        """
+        Create Multiple Entities
+
+        Description:
+            - This is used to create multiple entities, rows that can't be
+            created are reported instead of failing the whole request.
+
+        Args:
+            - `entities (List[dict])`: List of entity objects. **(Required)**
+
+        Raises:
+            - `BadRequest`: When entities are not a list or more than
+            `MAX_BULK_SIZE` entities are given.
+
+        Returns:
+            - `rows (List[RowMapping])`: Created entity rows.
+            - `errors (List[dict])`: Index and message of every rejected
+            entity.
+
+        """
+
+        if not isinstance(entities, list):
+            raise BadRequest(BULK_NOT_LIST)
+
+        if len(entities) > MAX_BULK_SIZE:
+            raise BadRequest(BULK_TOO_LARGE.format(limit=MAX_BULK_SIZE))
+
+        return self.repository.create_multiple(entities=entities)
+
     def read_by_id(self, entity_id) -> Any | None:
         """
         Read Entity By ID
@@ -108,6 +171,118 @@ class BaseService:
 
         return self.repository.read_all()
 
+    def read_reference_row(self, entity_column, entity_value) -> Any | None:
+        """
+        Read Reference Row
+
+        Description:
+            - This is used to read entity by column as a read-only row,
+            without a query for reference tables.
+
+        Args:
+            - `entity_column (str)`: Entity column. **(Required)**
+            - `entity_value (str)`: Entity value. **(Required)**
+
+        Returns:
+            - `row (Row)`: Entity row or `None`.
+
+        """
+
+        return self.repository.read_reference_row(
+            entity_column=entity_column, entity_value=entity_value
+        )
+
+    def read_reference_rows(self) -> Any:
+        """
+        Read Reference Rows
+
+        Description:
+            - This is used to read all entities as read-only rows, without a
+            query for reference tables.
+
+        Returns:
+            - `rows (List[Row])`: List of entity rows.
+
+        """
+
+        return self.repository.read_reference_rows()
+
+    def read_page(self, limit, after=None) -> tuple[Any, str | None]:
+        """
+        Read Page of Entities
+
+        Description:
+            - This is used to read a page of entities after a cursor.
+
+        Args:
+            - `limit (int)`: Maximum number of entities. **(Required)**
+            - `after (str)`: Cursor returned with previous page.
+            **(Optional)**
+
+        Returns:
+            - `entities (List[Model])`: List of entity objects.
+            - `next_cursor (str)`: Cursor of next page or `None`.
+
+        """
+
+        entities, last_id = self.repository.read_page(
+            limit=limit, after_id=decode_cursor(after)
+        )
+
+        return entities, (
+            encode_cursor(last_id) if last_id is not None else None
+        )
+
+    def read_row_by_id(self, entity_id, fields=None) -> Any | None:
+        """
+        Read Row By ID
+
+        Description:
+            - This is used to read entity by ID as a read-only row.
+
+        Args:
+            - `entity_id (int)`: Entity ID. **(Required)**
+            - `fields (list[str])`: Fields to read, all by default.
+            **(Optional)**
+
+        Returns:
+            - `row (RowMapping)`: Entity row.
+
+        """
+
+        return self.repository.read_row_by_id(
+            entity_id=entity_id, fields=fields
+        )
+
+    def read_rows_page(
+        self, limit, after=None, fields=None
+    ) -> tuple[Any, str | None]:
+        """
+        Read Page of Rows
+
+        Description:
+            - This is used to read a page of entities as read-only rows
+            after a cursor.
+
+        Args:
+            - `limit (int)`: Maximum number of rows. **(Required)**
+            - `after (str)`: Cursor returned with previous page.
+            **(Optional)**
+            - `fields (list[str])`: Fields to read, all by default.
+            **(Optional)**
+
+        Returns:
+            - `rows (List[RowMapping])`: List of entity rows.
+            - `next_cursor (str)`: Cursor of next page or `None`.
+
+        """
+
+        rows, last_id = self.repository.read_rows_page(
+            limit=limit, after_id=decode_cursor(after), fields=fields
+        )
+
+        return rows, (encode_cursor(last_id) if last_id is not None else None)
+
     def update(self, entity_id, entity) -> Any | None:
         """
         Update Entity
@@ -126,6 +301,111 @@ class BaseService:
 
         return self.repository.update(entity_id=entity_id, entity=entity)
 
+    def update_row(
+        self, entity_id, entity, versions=None, previous=None
+    ) -> Any | None:
+        """
+        Update Row
+
+        Description:
+            - This is used to update entity and get it back as a row, in one
+            round trip.
+            - When versions are given the update only applies to those
+            versions of entity.
+            - Values of `previous` columns before the update are returned as
+            `previous_<column>`.
+
+        Args:
+            - `entity_id (int)`: Entity ID. **(Required)**
+            - `entity (dict)`: Entity object. **(Required)**
+            - `versions (list[int])`: Accepted entity versions.
+            **(Optional)**
+            - `previous (list[str])`: Columns to return the values before
+            the update of. **(Optional)**
+
+        Raises:
+            - `PreconditionFailed`: When entity has another version.
+
+        Returns:
+            - `row (RowMapping)`: Updated entity row or `None`.
+
+        """
+
+        row = self.repository.update_row(
+            entity_id=entity_id,
+            entity=entity,
+            versions=versions,
+            previous=previous,
+        )
+
+        # Only a failed conditional update needs to tell both cases apart
+        if (
+            row is None
+            and versions is not None
+            and self.repository.read_row_by_id(
+                entity_id=entity_id, fields=["id"]
+            )
+        ):
+            raise PreconditionFailed(VERSION_MISMATCH)
+
+        return row
+
+    def update_multiple(self, entity, entity_ids=None, filters=None) -> Any:
+        """
+        Update Multiple Entities
+
+        Description:
+            - This is used to update every entity selected by IDs and
+            filters in one statement.
+
+        Args:
+            - `entity (dict)`: Fields to set. **(Required)**
+            - `entity_ids (list[int])`: Entity IDs. **(Optional)**
+            - `filters (dict)`: Field values to match. **(Optional)**
+
+        Raises:
+            - `BadRequest`: When no fields are given or no rows are selected.
+
+        Returns:
+            - `rows (List[RowMapping])`: Updated entity rows.
+
+        """
+
+        if not entity:
+            raise BadRequest(BULK_NO_CHANGES)
+
+        self._check_selection(entity_ids=entity_ids, filters=filters)
+
+        return self.repository.update_multiple(
+            entity=entity, entity_ids=entity_ids, filters=filters
+        )
+
+    def delete_multiple(self, entity_ids=None, filters=None) -> Any:
+        """
+        Delete Multiple Entities
+
+        Description:
+            - This is used to delete every entity selected by IDs and filters
+            in one statement.
+
+        Args:
+            - `entity_ids (list[int])`: Entity IDs. **(Optional)**
+            - `filters (dict)`: Field values to match. **(Optional)**
+
+        Raises:
+            - `BadRequest`: When no rows are selected.
+
+        Returns:
+            - `rows (List[RowMapping])`: Deleted entity rows.
+
+        """
+
+        self._check_selection(entity_ids=entity_ids, filters=filters)
+
+        return self.repository.delete_multiple(
+            entity_ids=entity_ids, filters=filters
+        )
+
     def delete(self, entity_id):
         """
         Delete Entity
@@ -142,3 +422,45 @@ class BaseService:
         """
 
         return self.repository.delete(entity_id=entity_id)
+
+    @staticmethod
+    def _check_selection(entity_ids=None, filters=None) -> None:
+        """
+        Check Selection
+
+        Description:
+            - This is used to reject bulk operations that would touch the
+            whole table, that select too many IDs or whose filter isn't an
+            object of scalars or lists of scalars.
+
+        Args:
+            - `entity_ids (list[int])`: Entity IDs. **(Optional)**
+            - `filters (dict)`: Field values to match. **(Optional)**
+
+        Raises:
+            - `BadRequest`: When filter is malformed, nothing is selected or
+            more than `MAX_BULK_SIZE` IDs are given.
+
+        Returns:
+            - `None`
+
+        """
+
+        if filters is not None and not (
+            isinstance(filters, dict)
+            and all(
+                isinstance(value, FILTER_SCALARS)
+                or (
+                    isinstance(value, list)
+                    and all(isinstance(item, FILTER_SCALARS) for item in value)
+                )
+                for value in filters.values()
+            )
+        ):
+            raise BadRequest(BULK_INVALID_FILTER)
+
+        if not entity_ids and not filters:
+            raise BadRequest(BULK_NO_SELECTION)
+
+        if entity_ids and len(entity_ids) > MAX_BULK_SIZE:
+            raise BadRequest(BULK_TOO_LARGE.format(limit=MAX_BULK_SIZE))
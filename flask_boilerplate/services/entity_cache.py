@@ -0,0 +1,335 @@
+"""
+Entity Cache Module
+
+Description:
+    - This module contains a Redis cache of entities read by ID, used by
+    models that opt in with `__entity_cache__ = True` once ENTITY_CACHE_TTL
+    is set above 0.
+    - Entities are stored under `table:id` keys with a TTL, only columns
+    readable in row mode are stored so private columns such as password
+    hashes never leave the database.
+    - Writes through `BaseRepository` drop keys right away and again once the
+    transaction commits, ORM changes made elsewhere are dropped by the
+    session `after_commit` event.
+    - Lookups and misses of every table are counted in a Redis hash, lookups
+    in the same round trip as the cache read, so the hit ratio covers every
+    worker.
+
+"""
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from logging import Logger
+from typing import Any
+
+from redis.exceptions import RedisError
+from sqlalchemy import DateTime, event
+from sqlalchemy.orm import Session
+
+from flask_boilerplate.core.config import ENTITY_CACHE_TTL
+from flask_boilerplate.core.logger import AppLogger
+from flask_boilerplate.database.base import BaseTable
+from flask_boilerplate.services.redis import redis
+
+logger: Logger = AppLogger().get_logger()
+
+ENTITY_CACHE_STATS_KEY: str = "entity_cache_stats"
+# Session info key of entity keys dropped again after commit
+PENDING_KEYS: str = "entity_cache_keys"
+
+
+class EntityCache:
+    """
+    Entity Cache
+
+    Description:
+        - This is used to cache entity rows by ID in Redis.
+        - Redis errors are logged and treated as misses, reads then go to
+        the database as if the cache was disabled.
+
+    Attributes:
+        - `ttl (int)`: Seconds entities are kept, `0` disables the cache.
+
+    """
+
+    def __init__(self, ttl: int = ENTITY_CACHE_TTL) -> None:
+        """
+        Entity Cache Constructor
+
+        Description:
+            - Initializes Entity Cache object and registers session events.
+
+        Args:
+            - `ttl (int)`: Seconds entities are kept. **(Optional)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self.ttl: int = ttl
+
+        event.listen(Session, "after_flush", self._on_after_flush)
+        event.listen(Session, "after_commit", self._on_after_commit)
+        event.listen(Session, "after_rollback", self._on_after_rollback)
+
+    def enabled_for(self, model: type[BaseTable]) -> bool:
+        """
+        Enabled For
+
+        Description:
+            - This is used to check whether entities of a model are cached.
+
+        Args:
+            - `model (type[BaseTable])`: Model class. **(Required)**
+
+        Returns:
+            - `enabled (bool)`: Whether model opted in.
+
+        """
+
+        return self.ttl > 0 and model.__entity_cache__
+
+    @staticmethod
+    def key(model: type[BaseTable], entity_id) -> str:
+        """
+        Key
+
+        Description:
+            - This is used to get cache key of an entity.
+
+        Args:
+            - `model (type[BaseTable])`: Model class. **(Required)**
+            - `entity_id (int)`: Entity ID. **(Required)**
+
+        Returns:
+            - `key (str)`: Cache key.
+
+        """
+
+        return f"{model.__tablename__}:{entity_id}"
+
+    def get(self, model: type[BaseTable], entity_id) -> dict | None:
+        """
+        Get Entity
+
+        Description:
+            - This is used to read a cached entity row and count the lookup,
+            and the miss when the row has to be read from the database.
+
+        Args:
+            - `model (type[BaseTable])`: Model class. **(Required)**
+            - `entity_id (int)`: Entity ID. **(Required)**
+
+        Returns:
+            - `row (dict)`: Entity row or `None` on a miss.
+
+        """
+
+        try:
+            data: dict | None = redis.get_and_count(
+                self.key(model, entity_id),
+                ENTITY_CACHE_STATS_KEY,
+                f"{model.__tablename__}:lookups",
+            )
+        except RedisError as ex:
+            logger.error(f"Entity cache read failed: {ex}")
+            return None
+
+        if data is None:
+            try:
+                redis.hincrby(
+                    ENTITY_CACHE_STATS_KEY, f"{model.__tablename__}:misses"
+                )
+            except RedisError as ex:
+                logger.error(f"Entity cache miss count failed: {ex}")
+            return None
+
+        return {
+            column.name: (
+                datetime.fromisoformat(data[column.name])
+                if isinstance(column.type, DateTime)
+                and data[column.name] is not None
+                else data[column.name]
+            )
+            for column in model.__table__.columns
+            if column.name in data
+        }
+
+    def set(
+        self, model: type[BaseTable], entity_id, row: Mapping[str, Any]
+    ) -> None:
+        """
+        Set Entity
+
+        Description:
+            - This is used to cache an entity row read from the database.
+
+        Args:
+            - `model (type[BaseTable])`: Model class. **(Required)**
+            - `entity_id (int)`: Entity ID. **(Required)**
+            - `row (Mapping)`: Entity row. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        data: dict = {
+            name: value.isoformat() if isinstance(value, datetime) else value
+            for name, value in row.items()
+        }
+
+        try:
+            redis.set(self.key(model, entity_id), data, ttl=self.ttl)
+        except RedisError as ex:
+            logger.error(f"Entity cache write failed: {ex}")
+
+    def invalidate(
+        self, model: type[BaseTable], entity_ids: Iterable, session: Session
+    ) -> None:
+        """
+        Invalidate Entities
+
+        Description:
+            - This is used to drop cached entities being written, right away
+            and again once the session commits, so a read racing the write
+            can't keep a stale copy.
+
+        Args:
+            - `model (type[BaseTable])`: Model class. **(Required)**
+            - `entity_ids (Iterable)`: Entity IDs. **(Required)**
+            - `session (Session)`: Session running the write. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        keys: set[str] = {
+            self.key(model, entity_id) for entity_id in entity_ids
+        }
+        if not keys:
+            return
+
+        session.info.setdefault(PENDING_KEYS, set()).update(keys)
+        self._delete(keys)
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        """
+        Cache Statistics
+
+        Description:
+            - This is used to report lookups, hits, misses and hit ratio of
+            every cached table, counted across all workers.
+
+        Returns:
+            - `stats (dict)`: Statistics by table name.
+
+        """
+
+        counters: dict[str, str] = redis.hgetall(ENTITY_CACHE_STATS_KEY)
+
+        stats: dict[str, dict[str, int | float]] = {}
+        for field, value in counters.items():
+            table, counter = field.rsplit(":", 1)
+            stats.setdefault(table, {"lookups": 0, "misses": 0})[counter] = (
+                int(value)
+            )
+
+        for table_stats in stats.values():
+            lookups: int = table_stats["lookups"]
+            table_stats["hits"] = max(lookups - table_stats["misses"], 0)
+            table_stats["hit_ratio"] = (
+                table_stats["hits"] / lookups if lookups else 0.0
+            )
+
+        return stats
+
+    def _delete(self, keys: Iterable[str]) -> None:
+        """
+        Delete Keys
+
+        Description:
+            - This is used to delete cache keys, logging Redis errors since
+            entries expire on their own.
+
+        Args:
+            - `keys (Iterable[str])`: Cache keys. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        try:
+            redis.delete(*keys)
+        except RedisError as ex:
+            logger.error(f"Entity cache invalidation failed: {ex}")
+
+    def _on_after_flush(self, session: Session, flush_context) -> None:
+        """
+        On After Flush
+
+        Description:
+            - This is used to remember cached entities changed or deleted
+            through the ORM, until the session commits.
+
+        Args:
+            - `session (Session)`: Flushed session. **(Required)**
+            - `flush_context (UOWTransaction)`: Flush context. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        keys: set[str] = {
+            self.key(type(instance), instance.id)
+            for instance in (*session.dirty, *session.deleted)
+            if isinstance(instance, BaseTable)
+            and self.enabled_for(type(instance))
+        }
+        if keys:
+            session.info.setdefault(PENDING_KEYS, set()).update(keys)
+
+    def _on_after_commit(self, session: Session) -> None:
+        """
+        On After Commit
+
+        Description:
+            - This is used to drop entities written in a committed
+            transaction.
+
+        Args:
+            - `session (Session)`: Committed session. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        keys: set[str] | None = session.info.pop(PENDING_KEYS, None)
+        if keys:
+            self._delete(keys)
+
+    def _on_after_rollback(self, session: Session) -> None:
+        """
+        On After Rollback
+
+        Description:
+            - This is used to forget entities of a rolled back transaction,
+            they were already dropped when written.
+
+        Args:
+            - `session (Session)`: Rolled back session. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        session.info.pop(PENDING_KEYS, None)
+
+
+entity_cache = EntityCache()
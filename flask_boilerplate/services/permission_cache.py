@@ -0,0 +1,744 @@
+"""
+Permission Cache Service
+
+Description:
+    - This module contains a per-process near-cache of role permissions kept
+    in front of Redis, each role is held as a compiled permission bitmask.
+    - In Redis every role's permissions are a set, maintained by Lua scripts
+    that change the set and publish the invalidation in one atomic call.
+    - Redis stays the source of truth, every change to a role is published on
+    a pub/sub channel so all workers drop their local copy.
+    - While Redis is unavailable permissions are computed from database and
+    kept locally for a short time.
+    - A role missing in Redis is rebuilt from database by one worker at a
+    time, guarded by a Redis lock and an in-process single-flight.
+    - Roles without permissions hold a marker member, so they are cached
+    like any other role instead of being rebuilt on every lookup.
+
+"""
+
+import os
+from logging import Logger
+from threading import Event, Lock
+from time import monotonic, perf_counter, sleep, time
+
+from redis.exceptions import RedisError
+
+from flask_boilerplate.core.cache import TTLCache
+from flask_boilerplate.core.config import (
+    PERMISSION_CACHE_CHANNEL,
+    PERMISSION_CACHE_TTL,
+    PERMISSION_FALLBACK_TTL,
+    PERMISSION_REBUILD_LOCK_TTL_MS,
+    PERMISSION_REBUILD_WAIT,
+)
+from flask_boilerplate.core.logger import AppLogger
+from flask_boilerplate.core.permission_registry import permission_registry
+from flask_boilerplate.repositories.role_permission import (
+    RolePermissionRepository,
+)
+from flask_boilerplate.services.redis import redis
+
+logger: Logger = AppLogger().get_logger()
+
+# Message published to drop every role at once
+INVALIDATE_ALL: str = "*"
+
+# Redis set holding permission names of a role
+ROLE_PERMISSIONS_KEY: str = "role_permissions:{role_name}"
+# Only member of the set of a role without permissions, permission names are
+# never empty
+EMPTY_ROLE_MARKER: str = ""
+# Lock held by the worker rebuilding a missing role
+REBUILD_LOCK_KEY: str = "role_permissions_rebuild:{role_name}"
+# Seconds between Redis reads while another worker rebuilds a role
+REBUILD_POLL_INTERVAL: float = 0.05
+
+# Lua `unpack` is limited by the stack size, members are sent in chunks
+LUA_CHUNK: str = f"""
+local EMPTY = "{EMPTY_ROLE_MARKER}"
+local function chunks(from)
+    local result = {{}}
+    for index = from, #ARGV, 1000 do
+        table.insert(result, {{index, math.min(index + 999, #ARGV)}})
+    end
+    return result
+end
+local function fill(key, from)
+    if #ARGV < from then
+        redis.call("SADD", key, EMPTY)
+        return
+    end
+    for _, range in ipairs(chunks(from)) do
+        redis.call("SADD", key, unpack(ARGV, range[1], range[2]))
+    end
+end
+"""
+
+# KEYS[1]: permission set, ARGV: channel, message, permissions...
+# An unchanged set is left alone and nothing is published
+REPLACE_PERMISSIONS_SCRIPT: str = LUA_CHUNK + """
+if redis.call("SCARD", KEYS[1]) == math.max(#ARGV - 2, 1) then
+    local same = true
+    if #ARGV == 2 then
+        same = redis.call("SISMEMBER", KEYS[1], EMPTY) == 1
+    end
+    for index = 3, #ARGV do
+        if redis.call("SISMEMBER", KEYS[1], ARGV[index]) == 0 then
+            same = false
+            break
+        end
+    end
+    if same then
+        return 0
+    end
+end
+redis.call("DEL", KEYS[1])
+fill(KEYS[1], 3)
+redis.call("PUBLISH", ARGV[1], ARGV[2])
+return 1
+"""
+
+# KEYS[1]: permission set, ARGV: permissions...
+# Used for rebuilds, missing sets are created without publishing since no
+# worker holds a copy newer than database
+FILL_PERMISSIONS_SCRIPT: str = LUA_CHUNK + """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return 0
+end
+fill(KEYS[1], 1)
+return 1
+"""
+
+# KEYS[1]: permission set, ARGV: channel, message, permissions...
+# Missing sets are left alone, so a partial set is never created
+ADD_PERMISSIONS_SCRIPT: str = LUA_CHUNK + """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return -1
+end
+local added = 0
+for _, range in ipairs(chunks(3)) do
+    added = added + redis.call(
+        "SADD", KEYS[1], unpack(ARGV, range[1], range[2])
+    )
+end
+if added > 0 then
+    redis.call("SREM", KEYS[1], EMPTY)
+    redis.call("PUBLISH", ARGV[1], ARGV[2])
+end
+return added
+"""
+
+# KEYS: permission sets, ARGV: channel, message, permissions...
+# Sets left without permissions keep the empty role marker
+REMOVE_PERMISSIONS_SCRIPT: str = LUA_CHUNK + """
+local removed = 0
+for _, key in ipairs(KEYS) do
+    local existed = redis.call("EXISTS", key)
+    for _, range in ipairs(chunks(3)) do
+        removed = removed + redis.call(
+            "SREM", key, unpack(ARGV, range[1], range[2])
+        )
+    end
+    if existed == 1 and redis.call("EXISTS", key) == 0 then
+        redis.call("SADD", key, EMPTY)
+    end
+end
+if removed > 0 then
+    redis.call("PUBLISH", ARGV[1], ARGV[2])
+end
+return removed
+"""
+
+
+def role_permissions_key(role_name) -> str:
+    """
+    Role Permissions Key
+
+    Description:
+        - This is used to get Redis key of the permission set of a role.
+
+    Args:
+        - `role_name (str)`: Role name. **(Required)**
+
+    Returns:
+        - `key (str)`: Redis key.
+
+    """
+
+    return ROLE_PERMISSIONS_KEY.format(role_name=role_name)
+
+
+class PermissionCache:
+    """
+    Permission Cache
+
+    Description:
+        - This is used to read role permissions without a Redis round trip.
+        - Local entries also expire after `PERMISSION_CACHE_TTL` seconds so a
+        lost invalidation message can't keep stale permissions forever.
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Permission Cache Constructor
+
+        Description:
+            - Initializes Permission Cache object.
+
+        Returns:
+            - `None`
+
+        """
+
+        self._local: TTLCache = TTLCache(
+            max_size=1_024, ttl=PERMISSION_CACHE_TTL
+        )
+        self._listener = None
+        self._listener_pid: int | None = None
+        self._lock: Lock = Lock()
+        # Last known masks, served while a missing role is rebuilt
+        self._stale: TTLCache = TTLCache(max_size=1_024)
+        self._flights: dict[str, Event] = {}
+        self._flight_lock: Lock = Lock()
+
+        redis.register_script(
+            "replace_permissions", REPLACE_PERMISSIONS_SCRIPT
+        )
+        redis.register_script("fill_permissions", FILL_PERMISSIONS_SCRIPT)
+        redis.register_script("add_permissions", ADD_PERMISSIONS_SCRIPT)
+        redis.register_script("remove_permissions", REMOVE_PERMISSIONS_SCRIPT)
+
+    def get(self, role_name) -> int | None:
+        """
+        Get Role Permissions
+
+        Description:
+            - This is used to read permission bitmask of a role, falling back
+            to Redis on a local miss.
+            - Roles missing in Redis are rebuilt from database by a single
+            request across all workers.
+
+        Args:
+            - `role_name (str)`: Role name. **(Required)**
+
+        Returns:
+            - `mask (int)`: Permission bitmask or `None`.
+
+        """
+
+        self._ensure_listener()
+
+        mask: int | None = self._local.get(role_name)
+        if mask is not None:
+            # Roles without permissions are cached as an empty mask
+            return mask or None
+
+        try:
+            data: set[str] = redis.smembers(role_permissions_key(role_name))
+            if not data:
+                return self._rebuild(role_name)
+        except RedisError as ex:
+            logger.error(f"Permission cache falling back to database: {ex}")
+            return self._load_from_database(role_name)
+
+        data.discard(EMPTY_ROLE_MARKER)
+        return self._remember(role_name, permission_registry.mask(data))
+
+    def _remember(self, role_name, mask) -> int | None:
+        """
+        Remember Mask
+
+        Description:
+            - This is used to store a mask locally, it is also kept as the
+            last known value to serve while the role is rebuilt.
+
+        Args:
+            - `role_name (str)`: Role name. **(Required)**
+            - `mask (int)`: Permission bitmask. **(Required)**
+
+        Returns:
+            - `mask (int)`: Permission bitmask or `None` if empty.
+
+        """
+
+        self._local.set(role_name, mask)
+        if mask:
+            self._stale.set(role_name, mask)
+
+        return mask or None
+
+    def _rebuild(self, role_name) -> int | None:
+        """
+        Rebuild Role
+
+        Description:
+            - This is used to rebuild a role missing in Redis, only the first
+            request of a process does it while others wait up to
+            `PERMISSION_REBUILD_WAIT` seconds for its result.
+            - Waiters that time out get the last known mask of the role.
+
+        Args:
+            - `role_name (str)`: Role name. **(Required)**
+
+        Returns:
+            - `mask (int)`: Permission bitmask or `None`.
+
+        """
+
+        with self._flight_lock:
+            flight: Event | None = self._flights.get(role_name)
+            leader: bool = flight is None
+            if leader:
+                flight = self._flights[role_name] = Event()
+
+        if not leader:
+            flight.wait(PERMISSION_REBUILD_WAIT)
+            mask: int | None = self._local.get(role_name)
+            if mask is not None:
+                return mask or None
+            return self._stale.get(role_name)
+
+        try:
+            return self._rebuild_from_database(role_name)
+        finally:
+            with self._flight_lock:
+                self._flights.pop(role_name, None)
+            flight.set()
+
+    def _rebuild_from_database(self, role_name) -> int | None:
+        """
+        Rebuild From Database
+
+        Description:
+            - This is used to load a role from database and write it to
+            Redis while holding a lock shared by all workers, so one missing
+            key costs a single query however many workers see it.
+            - When another worker holds the lock its result is read from
+            Redis instead.
+            - Nothing is published, other workers have no copy of a role
+            missing in Redis that the rebuild would change.
+
+        Args:
+            - `role_name (str)`: Role name. **(Required)**
+
+        Returns:
+            - `mask (int)`: Permission bitmask or `None`.
+
+        """
+
+        lock_key: str = REBUILD_LOCK_KEY.format(role_name=role_name)
+        token: str | None = redis.acquire_lock(
+            lock_key, PERMISSION_REBUILD_LOCK_TTL_MS
+        )
+        if token is None:
+            return self._wait_for_rebuild(role_name)
+
+        try:
+            permissions: list[str] = (
+                RolePermissionRepository().get_role_permission_names(role_name)
+            )
+            redis.run_script(
+                "fill_permissions",
+                keys=[role_permissions_key(role_name)],
+                args=permissions,
+            )
+        finally:
+            redis.release_lock(lock_key, token)
+
+        return self._remember(role_name, permission_registry.mask(permissions))
+
+    def _wait_for_rebuild(self, role_name) -> int | None:
+        """
+        Wait For Rebuild
+
+        Description:
+            - This is used to poll Redis while another worker rebuilds a
+            role, for up to `PERMISSION_REBUILD_WAIT` seconds.
+
+        Args:
+            - `role_name (str)`: Role name. **(Required)**
+
+        Returns:
+            - `mask (int)`: Permission bitmask, last known mask or `None`.
+
+        """
+
+        deadline: float = monotonic() + PERMISSION_REBUILD_WAIT
+        while monotonic() < deadline:
+            sleep(REBUILD_POLL_INTERVAL)
+            data: set[str] = redis.smembers(role_permissions_key(role_name))
+            if data:
+                data.discard(EMPTY_ROLE_MARKER)
+                return self._remember(
+                    role_name, permission_registry.mask(data)
+                )
+
+        return self._stale.get(role_name)
+
+    def _load_from_database(self, role_name) -> int | None:
+        """
+        Load From Database
+
+        Description:
+            - This is used to compute permission bitmask of a role from
+            database while Redis is unavailable.
+            - Result is kept for `PERMISSION_FALLBACK_TTL` seconds only, so
+            Redis is used again soon after it recovers.
+
+        Args:
+            - `role_name (str)`: Role name. **(Required)**
+
+        Returns:
+            - `mask (int)`: Permission bitmask or `None`.
+
+        """
+
+        permissions: list[str] = (
+            RolePermissionRepository().get_role_permission_names(role_name)
+        )
+        if not permissions:
+            return None
+
+        mask: int = permission_registry.mask(permissions)
+        self._local.set(
+            role_name, mask, expires_at=time() + PERMISSION_FALLBACK_TTL
+        )
+
+        return mask
+
+    def set(self, role_name, permissions) -> None:
+        """
+        Set Role Permissions
+
+        Description:
+            - This is used to atomically replace permissions of a role in
+            Redis and invalidate it on every worker, in one round trip.
+            - Nothing is written or published when permissions are unchanged.
+
+        Args:
+            - `role_name (str)`: Role name. **(Required)**
+            - `permissions (list[str])`: Permission names. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self.set_many({role_name: permissions})
+
+    def set_many(self, role_permissions) -> None:
+        """
+        Set Many Role Permissions
+
+        Description:
+            - This is used to replace permissions of several roles in Redis
+            and invalidate them on every worker, in one round trip.
+            - Every role is replaced atomically by a server side script.
+
+        Args:
+            - `role_permissions (dict[str, list[str]])`: Permission names by
+            role name. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        with redis.batch(transaction=False) as pipeline:
+            for role_name, permissions in role_permissions.items():
+                redis.run_script(
+                    "replace_permissions",
+                    keys=[role_permissions_key(role_name)],
+                    args=[PERMISSION_CACHE_CHANNEL, role_name, *permissions],
+                    pipeline=pipeline,
+                )
+
+        self._drop_many(role_permissions)
+
+    def add(self, role_name, *permissions) -> bool:
+        """
+        Add Role Permissions
+
+        Description:
+            - This is used to atomically add permissions to a cached role and
+            invalidate it on every worker.
+            - Roles missing in Redis are not created, so a partial set never
+            hides the rest of a role's permissions.
+
+        Args:
+            - `role_name (str)`: Role name. **(Required)**
+            - `permissions (str)`: Permission names. **(Required)**
+
+        Returns:
+            - `added (bool)`: Whether role was cached in Redis.
+
+        """
+
+        added: int = redis.run_script(
+            "add_permissions",
+            keys=[role_permissions_key(role_name)],
+            args=[PERMISSION_CACHE_CHANNEL, role_name, *permissions],
+        )
+        self._drop(role_name)
+
+        return added >= 0
+
+    def remove(self, role_names, *permissions) -> None:
+        """
+        Remove Role Permissions
+
+        Description:
+            - This is used to atomically remove permissions from one or more
+            roles in Redis and invalidate them on every worker, in one round
+            trip no matter how many roles are given.
+
+        Args:
+            - `role_names (str | list[str])`: Role name or names.
+            **(Required)**
+            - `permissions (str)`: Permission names. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        if isinstance(role_names, str):
+            role_names = [role_names]
+
+        if not role_names or not permissions:
+            return
+
+        message: str = (
+            role_names[0] if len(role_names) == 1 else INVALIDATE_ALL
+        )
+        redis.run_script(
+            "remove_permissions",
+            keys=[role_permissions_key(role_name) for role_name in role_names],
+            args=[PERMISSION_CACHE_CHANNEL, message, *permissions],
+        )
+        self._drop_many(role_names)
+
+    def delete(self, role_name) -> None:
+        """
+        Delete Role Permissions
+
+        Description:
+            - This is used to remove permissions of a role from Redis and
+            invalidate it on every worker, in one round trip.
+
+        Args:
+            - `role_name (str)`: Role name. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self.delete_many([role_name])
+
+    def delete_many(self, role_names) -> None:
+        """
+        Delete Permissions of Roles
+
+        Description:
+            - This is used to remove permissions of several roles from Redis
+            and invalidate them on every worker with a single message, in one
+            round trip.
+
+        Args:
+            - `role_names (list[str])`: Role names. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        if not role_names:
+            return
+
+        message: str = (
+            role_names[0] if len(role_names) == 1 else INVALIDATE_ALL
+        )
+        with redis.batch() as pipeline:
+            pipeline.delete(
+                *(role_permissions_key(role_name) for role_name in role_names)
+            )
+            pipeline.publish(PERMISSION_CACHE_CHANNEL, message)
+
+        self._drop_many(role_names)
+
+    def warm(self) -> int:
+        """
+        Warm Cache
+
+        Description:
+            - This is used to write permissions of every role to Redis,
+            loaded with one joined query and written in one pipeline.
+            - Query and write timings are logged.
+
+        Returns:
+            - `roles (int)`: Number of roles written.
+
+        """
+
+        start: float = perf_counter()
+        role_permissions: dict[str, list[str]] = (
+            RolePermissionRepository().get_all_role_permission_names()
+        )
+        loaded: float = perf_counter()
+
+        self.set_many(role_permissions)
+        written: float = perf_counter()
+
+        logger.info(
+            f"Permission cache warmed with {len(role_permissions)} roles and "
+            f"{sum(map(len, role_permissions.values()))} permissions: "
+            f"query {(loaded - start) * 1_000:.1f} ms, "
+            f"write {(written - loaded) * 1_000:.1f} ms"
+        )
+
+        return len(role_permissions)
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Cache Statistics
+
+        Description:
+            - This is used to report hit/miss counters of the local cache.
+
+        Returns:
+            - `stats (dict)`: Local cache statistics.
+
+        """
+
+        return self._local.stats()
+
+    def _drop(self, role_name) -> None:
+        """
+        Drop Local Entry
+
+        Description:
+            - This is used to remove a role, or every role, from local cache.
+
+        Args:
+            - `role_name (str)`: Role name or `INVALIDATE_ALL`. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        if role_name == INVALIDATE_ALL:
+            self._local.clear()
+        else:
+            self._local.delete(role_name)
+
+    def _drop_many(self, role_names) -> None:
+        """
+        Drop Local Entries
+
+        Description:
+            - This is used to remove several roles from local cache.
+
+        Args:
+            - `role_names (list[str])`: Role names. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        for role_name in role_names:
+            self._drop(role_name)
+
+    def _handle_message(self, message) -> None:
+        """
+        Handle Invalidation Message
+
+        Description:
+            - This is used as pub/sub handler for invalidation messages.
+
+        Args:
+            - `message (dict)`: Pub/sub message. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        data = message["data"]
+        if isinstance(data, bytes):
+            data = data.decode()
+
+        self._drop(data)
+
+    def _handle_listener_error(self, ex, pubsub, thread) -> None:
+        """
+        Handle Listener Error
+
+        Description:
+            - This is used to stop a broken listener so that the next lookup
+            subscribes again, local cache is cleared since messages may have
+            been missed.
+
+        Args:
+            - `ex (Exception)`: Raised exception. **(Required)**
+            - `pubsub (PubSub)`: Pub/sub object. **(Required)**
+            - `thread (PubSubWorkerThread)`: Listener thread. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        logger.error(f"Permission cache listener stopped: {ex}")
+        thread.stop()
+        pubsub.close()
+        self._local.clear()
+        self._listener_pid = None
+
+    def _ensure_listener(self) -> None:
+        """
+        Ensure Listener
+
+        Description:
+            - This is used to start the invalidation listener thread once per
+            process, so it is started again in forked workers.
+            - Local cache is cleared when subscribing because messages sent
+            before the subscription were missed.
+
+        Returns:
+            - `None`
+
+        """
+
+        pid: int = os.getpid()
+        if self._listener_pid == pid or not redis.breaker.available:
+            return
+
+        with self._lock:
+            if self._listener_pid == pid:
+                return
+
+            try:
+                pubsub = redis.pubsub()
+                redis.execute(
+                    pubsub.subscribe,
+                    **{PERMISSION_CACHE_CHANNEL: self._handle_message},
+                )
+                self._listener = pubsub.run_in_thread(
+                    sleep_time=1,
+                    daemon=True,
+                    exception_handler=self._handle_listener_error,
+                )
+            except RedisError as ex:
+                logger.error(f"Permission cache listener failed: {ex}")
+                return
+
+            self._local.clear()
+            self._listener_pid = pid
+
+
+permission_cache = PermissionCache()
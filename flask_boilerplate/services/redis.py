@@ -1,88 +1,419 @@
-import json
 import logging
-import fakeredis
+import os
+from contextlib import contextmanager
+from uuid import uuid4
 
+import fakeredis
 import redis as pyredis
-from redis.exceptions import ConnectionError, RedisError, TimeoutError
-from retry import retry
+from redis.client import NEVER_DECODE
+from redis.exceptions import ConnectionError, TimeoutError
+
+from flask_boilerplate.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from flask_boilerplate.core.codecs import TaggedSerializer
+from flask_boilerplate.core.config import (
+    ENVIRONMENT,
+    REDIS_BREAKER_FAILURE_THRESHOLD,
+    REDIS_BREAKER_RESET_TIMEOUT,
+    REDIS_CODEC,
+    REDIS_HEALTH_CHECK_INTERVAL,
+    REDIS_HOST,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT,
+    REDIS_PORT,
+    REDIS_SOCKET_CONNECT_TIMEOUT,
+    REDIS_SOCKET_TIMEOUT,
+)
+
+# Deletes a lock only while it is still held by the given token
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
 
-from flask_boilerplate.core.config import ENVIRONMENT, REDIS_HOST, REDIS_PORT
+class RedisUnavailableError(ConnectionError):
+    """
+    Raised without contacting Redis while the circuit breaker is open
+    """
 
 
 class Redis:
+    """
+    Redis client wrapper
+
+    Connections come from a BlockingConnectionPool that is created lazily in
+    every process, so forked workers never share the parent's sockets and
+    the number of connections per worker is bounded.
+
+    Commands run through a circuit breaker: after repeated connection errors
+    they fail fast with RedisUnavailableError instead of waiting on sockets,
+    until a probe command succeeds again.
+
+    Values of get/set are serialized with the configured codec and read
+    back raw, since binary codecs are not valid text.
+
+    Lua scripts are registered once and called with EVALSHA, the source is
+    only sent again when the server doesn't know the script yet.
+    """
+
     def __init__(self):
         self._redis_connection = None
-        # Avoid additional ping for normal use-cases at the cost of
-        # a redundant check
-        if not self._redis_connection:
+        self._pid = None
+        self.breaker = CircuitBreaker(
+            name="redis",
+            failure_threshold=REDIS_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=REDIS_BREAKER_RESET_TIMEOUT,
+            exceptions=(ConnectionError, TimeoutError),
+        )
+        self.serializer = TaggedSerializer(REDIS_CODEC)
+        self._scripts = {}
+        self.redis_connect()
+        self.register_script("release_lock", RELEASE_LOCK_SCRIPT)
+
+    @property
+    def connection(self):
+        """
+        Client bound to the connection pool of the current process
+
+        Returns:
+            redis client
+        """
+        if self._pid != os.getpid():
             self.redis_connect()
+        return self._redis_connection
 
     def redis_connect(self):
-        try:
-            if self._redis_connection and self._redis_connection.ping():
-                return
-        except RedisError as ex:
-            logging.error(f"Error while pinging {ex}")
-            pass
+        """
+        Create the connection pool and client for the current process
+        """
+        pid = os.getpid()
+        if self._redis_connection is not None and self._pid == pid:
+            return
 
         if ENVIRONMENT == "testing":
-            self._redis_connection = fakeredis.FakeStrictRedis()
+            self._redis_connection = fakeredis.FakeStrictRedis(
+                decode_responses=True
+            )
         else:
-            self._redis_connection = pyredis.Redis(
-                REDIS_HOST, REDIS_PORT, decode_responses=True
+            pool = pyredis.BlockingConnectionPool(
+                host=REDIS_HOST,
+                port=REDIS_PORT,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=REDIS_POOL_TIMEOUT,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+                decode_responses=True,
             )
-        logging.info(f"Host={REDIS_HOST}:Port{REDIS_PORT}")
+            self._redis_connection = pyredis.Redis(connection_pool=pool)
+        self._pid = pid
+        logging.info(f"Host={REDIS_HOST}:Port{REDIS_PORT}:Pid={pid}")
 
-    @retry((ConnectionError, TimeoutError), 2, 1)
-    def get(self, key) -> set:
+    def pool_stats(self) -> dict:
         """
-        Get data
+        Connection pool usage of the current process
+
+        Returns:
+            max, created, idle and in use connection counts
+        """
+        pool = self.connection.connection_pool
+        if isinstance(pool, pyredis.BlockingConnectionPool):
+            created = len(pool._connections)
+            idle = len([conn for conn in pool.pool.queue if conn])
+        else:
+            idle = len(pool._available_connections)
+            created = idle + len(pool._in_use_connections)
+        return {
+            "max_connections": pool.max_connections,
+            "created_connections": created,
+            "idle_connections": idle,
+            "in_use_connections": created - idle,
+        }
+
+    def execute(self, function, *args, **kwargs):
+        """
+        Run a client call through the circuit breaker
 
         Args:
-            key:
+            function: bound client method or any callable talking to Redis
+            args: positional arguments
+            kwargs: keyword arguments
         Returns:
-            data string
+            call result
         """
         try:
-            data = self._redis_connection.get(key)
-            return json.loads(data) if data else None
+            return self.breaker.call(function, *args, **kwargs)
+        except CircuitOpenError as ex:
+            raise RedisUnavailableError(str(ex)) from ex
         except (ConnectionError, TimeoutError) as ex:
             logging.error(f"Redis error: {ex}")
-            self.redis_connect()
             raise
 
-    @retry((ConnectionError, TimeoutError), 2, 1)
-    def set(self, key, data: list) -> None:
+    def get(self, key) -> set:
+        """
+        Get data
+
+        Args:
+            key:
+        Returns:
+            data string
+        """
+        data = self.execute(
+            self.connection.execute_command,
+            "GET",
+            key,
+            **{NEVER_DECODE: True},
+        )
+        return self.serializer.loads(data)
+
+    def set(
+        self, key, data: list, ttl: int | None = None, pipeline=None
+    ) -> None:
         """
         Set data
 
         Args:
             key:
             data: str
+            ttl: seconds before the key expires, never by default
+            pipeline: queue the command on this pipeline instead of sending it
         Returns:
             None
         """
-        try:
-            self._redis_connection.set(key, json.dumps(data))
-        except (ConnectionError, TimeoutError) as ex:
-            logging.error(f"Redis error: {ex}")
-            self.redis_connect()
-            raise
+        if pipeline is not None:
+            pipeline.set(key, self.serializer.dumps(data), ex=ttl)
+            return
+        self.execute(
+            self.connection.set, key, self.serializer.dumps(data), ex=ttl
+        )
 
-    @retry((ConnectionError, TimeoutError), 2, 1)
-    def delete(self, key: str) -> None:
+    def get_and_count(self, key, counter_key: str, field: str):
         """
-        delete data stored at redis against a key
+        Get data and increment a hash counter in the same round trip
 
         Args:
             key: key for redis data
+            counter_key: key of the hash holding counters
+            field: counter to increment
+        Returns:
+            data or None for a missing key
+        """
+        pipeline = self.pipeline()
+        pipeline.execute_command("GET", key, **{NEVER_DECODE: True})
+        pipeline.hincrby(counter_key, field, 1)
+        data, _ = self.execute(pipeline.execute)
+        return self.serializer.loads(data)
+
+    def hincrby(self, key: str, field: str, amount: int = 1, pipeline=None):
+        """
+        Increment a hash counter
+
+        Args:
+            key: key of the hash
+            field: counter to increment
+            amount: increment
+            pipeline: queue the command on this pipeline instead of sending it
+        Returns:
+            new value, or None when queued
+        """
+        if pipeline is not None:
+            pipeline.hincrby(key, field, amount)
+            return None
+        return self.execute(self.connection.hincrby, key, field, amount)
+
+    def hgetall(self, key: str) -> dict:
+        """
+        Get every field of a hash
+
+        Args:
+            key: key of the hash
+        Returns:
+            fields and values
+        """
+        return self.execute(self.connection.hgetall, key)
+
+    def incr(self, key: str) -> int:
+        """
+        Increment a counter
+
+        Args:
+            key: key of the counter
+        Returns:
+            new value
         """
+        return self.execute(self.connection.incr, key)
+
+    def get_int(self, key: str) -> int:
+        """
+        Get a counter
+
+        Args:
+            key: key of the counter
+        Returns:
+            counter value, 0 for a missing key
+        """
+        return int(self.execute(self.connection.get, key) or 0)
+
+    def pipeline(self, transaction: bool = False):
+        """
+        Create a pipeline bound to the current connection
+
+        Commands are buffered until the pipeline is executed, which should be
+        done through execute() so the circuit breaker sees the result.
+
+        Args:
+            transaction: wrap buffered commands in MULTI/EXEC
+        Returns:
+            Pipeline object
+        """
+        return self.connection.pipeline(transaction=transaction)
+
+    @contextmanager
+    def batch(self, transaction: bool = True):
+        """
+        Buffer commands and send them in one round trip on exit
+
+        Nothing is sent if the block raises. With transaction enabled the
+        commands are applied atomically.
+
+        Args:
+            transaction: wrap buffered commands in MULTI/EXEC
+        Yields:
+            Pipeline object
+        """
+        pipeline = self.pipeline(transaction=transaction)
         try:
-            self._redis_connection.delete(key)
-        except (ConnectionError, TimeoutError) as ex:
-            logging.error(f"Redis error: {ex}")
-            self.redis_connect()
-            raise
+            yield pipeline
+            if pipeline.command_stack:
+                self.execute(pipeline.execute)
+        finally:
+            pipeline.reset()
+
+    def delete(self, *keys: str) -> None:
+        """
+        delete data stored at redis against one or more keys
+
+        Args:
+            keys: keys for redis data
+        """
+        if keys:
+            self.execute(self.connection.delete, *keys)
+
+    def key_type(self, key: str) -> str:
+        """
+        Get type of the value stored at a key
+
+        Args:
+            key: key for redis data
+        Returns:
+            redis type name, "none" if key does not exist
+        """
+        return self.execute(self.connection.type, key)
+
+    def sadd(self, key: str, *members: str) -> int:
+        """
+        Add members to a set
+
+        Args:
+            key: key of the set
+            members: members to add
+        Returns:
+            number of members added
+        """
+        return self.execute(self.connection.sadd, key, *members)
+
+    def smembers(self, key: str) -> set:
+        """
+        Get all members of a set
+
+        Args:
+            key: key of the set
+        Returns:
+            set members, empty if key does not exist
+        """
+        return self.execute(self.connection.smembers, key)
+
+    def register_script(self, name: str, source: str) -> None:
+        """
+        Register a Lua script
+
+        Args:
+            name: name used to run the script
+            source: Lua source of the script
+        """
+        self._scripts[name] = self.connection.register_script(source)
+
+    def run_script(self, name: str, keys=(), args=(), pipeline=None):
+        """
+        Run a registered Lua script atomically on the server
+
+        Args:
+            name: name of a registered script
+            keys: keys the script touches
+            args: script arguments
+            pipeline: queue the call on this pipeline instead of running it
+        Returns:
+            script result, or the pipeline when one is given
+        """
+        script = self._scripts[name]
+        if pipeline is not None:
+            return script(keys=list(keys), args=list(args), client=pipeline)
+        return self.execute(
+            script, keys=list(keys), args=list(args), client=self.connection
+        )
+
+    def acquire_lock(self, key: str, ttl_ms: int):
+        """
+        Try to take a lock shared by all processes and nodes
+
+        The lock expires after ttl_ms, so a crashed holder can't keep it.
+
+        Args:
+            key: key of the lock
+            ttl_ms: lock expiry in milliseconds
+        Returns:
+            token needed to release the lock, None if it is held elsewhere
+        """
+        token = uuid4().hex
+        if self.execute(self.connection.set, key, token, nx=True, px=ttl_ms):
+            return token
+        return None
+
+    def release_lock(self, key: str, token: str) -> None:
+        """
+        Release a lock taken with acquire_lock
+
+        Nothing happens if the lock expired and was taken by someone else.
+
+        Args:
+            key: key of the lock
+            token: token returned by acquire_lock
+        """
+        self.run_script("release_lock", keys=[key], args=[token])
+
+    def publish(self, channel: str, message: str) -> None:
+        """
+        Publish a message on a channel
+
+        Args:
+            channel: pub/sub channel name
+            message: message to publish
+        """
+        self.execute(self.connection.publish, channel, message)
+
+    def pubsub(self):
+        """
+        Create a pub/sub object bound to the current connection
+
+        Returns:
+            PubSub object
+        """
+        return self.connection.pubsub(ignore_subscribe_messages=True)
 
 
 redis = Redis()
@@ -0,0 +1,412 @@
+"""
+Reference Cache Module
+
+Description:
+    - This module contains an in-process cache of small reference tables,
+    used by models that opt in with `__reference_cache__ = True`.
+    - Every worker keeps a snapshot of the whole table, repository
+    `read_reference_row` and `read_reference_rows` serve read-only rows from
+    it, reads returning ORM instances always query the database.
+    - A global version counter in Redis is incremented once a transaction
+    writing to a reference table commits, workers read it at most every
+    REFERENCE_CACHE_CHECK_MS milliseconds and reload their snapshots when it
+    changed.
+    - Snapshots are also reloaded after REFERENCE_CACHE_MAX_AGE seconds, so
+    a version bump lost while Redis was unavailable can't keep stale rows
+    forever.
+
+"""
+
+from collections.abc import Callable, Iterable
+from logging import Logger
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from redis.exceptions import RedisError
+from sqlalchemy import Result, Row, Table, event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from flask_boilerplate.core.config import (
+    REFERENCE_CACHE_CHECK_MS,
+    REFERENCE_CACHE_MAX_AGE,
+)
+from flask_boilerplate.core.logger import AppLogger
+from flask_boilerplate.database.base import BaseTable
+from flask_boilerplate.services.redis import redis
+
+logger: Logger = AppLogger().get_logger()
+
+REFERENCE_CACHE_VERSION_KEY: str = "reference_cache_version"
+# Session info key set once a reference table is written in a transaction
+PENDING_WRITES: str = "reference_cache_writes"
+
+
+class ReferenceSnapshot:
+    """
+    Reference Snapshot
+
+    Description:
+        - This is used to hold every row of a reference table, with
+        indexes built on first lookup of a column.
+        - Rows are read-only, so a snapshot is shared by all threads of a
+        worker.
+
+    Attributes:
+        - `rows (tuple[Row])`: Table rows.
+        - `columns (frozenset[str])`: Column names of the rows.
+        - `loaded_at (float)`: Monotonic time the rows were read.
+
+    """
+
+    def __init__(self, result: Result) -> None:
+        """
+        Reference Snapshot Constructor
+
+        Description:
+            - Initializes Reference Snapshot object.
+
+        Args:
+            - `result (Result)`: Result of reading the table. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self.columns: frozenset[str] = frozenset(result.keys())
+        self.rows: tuple[Row, ...] = tuple(result.all())
+        self.loaded_at: float = monotonic()
+        self._indexes: dict[str, dict[Any, Row]] = {}
+
+    def has_column(self, column: str) -> bool:
+        """
+        Has Column
+
+        Description:
+            - This is used to check whether rows hold a column.
+
+        Args:
+            - `column (str)`: Column name. **(Required)**
+
+        Returns:
+            - `found (bool)`: Whether column is in the snapshot.
+
+        """
+
+        return column in self.columns
+
+    def find(self, column: str, value) -> Row | None:
+        """
+        Find Row
+
+        Description:
+            - This is used to find first row having a column value.
+
+        Args:
+            - `column (str)`: Column name. **(Required)**
+            - `value (Any)`: Column value. **(Required)**
+
+        Returns:
+            - `row (Row)`: Matching row or `None`.
+
+        """
+
+        index: dict[Any, Row] | None = self._indexes.get(column)
+        if index is None:
+            index = {}
+            for row in self.rows:
+                index.setdefault(row._mapping[column], row)
+            self._indexes[column] = index
+
+        return index.get(value)
+
+
+class ReferenceCache:
+    """
+    Reference Cache
+
+    Description:
+        - This is used to keep snapshots of reference tables in memory.
+        - Snapshots are bypassed while Redis is unavailable and in
+        transactions that wrote to a reference table, those reads go to the
+        database.
+
+    Attributes:
+        - `check_interval (float)`: Seconds between version checks.
+        - `max_age (int)`: Seconds a snapshot is used before reloading it.
+
+    """
+
+    def __init__(
+        self,
+        check_ms: int = REFERENCE_CACHE_CHECK_MS,
+        max_age: int = REFERENCE_CACHE_MAX_AGE,
+    ) -> None:
+        """
+        Reference Cache Constructor
+
+        Description:
+            - Initializes Reference Cache object and registers session
+            events.
+
+        Args:
+            - `check_ms (int)`: Milliseconds between version checks.
+            **(Optional)**
+            - `max_age (int)`: Seconds a snapshot is used before reloading
+            it. **(Optional)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self.check_interval: float = check_ms / 1000
+        self.max_age: int = max_age
+        self._snapshots: dict[str, ReferenceSnapshot] = {}
+        self._version: int | None = None
+        self._checked_at: float = 0.0
+        self._lock: Lock = Lock()
+
+        event.listen(Session, "after_flush", self._on_after_flush)
+        event.listen(Session, "do_orm_execute", self._on_do_orm_execute)
+        event.listen(Session, "after_commit", self._on_after_commit)
+        event.listen(Session, "after_rollback", self._on_after_rollback)
+
+    @staticmethod
+    def enabled_for(model: type[BaseTable]) -> bool:
+        """
+        Enabled For
+
+        Description:
+            - This is used to check whether a model is a reference table.
+
+        Args:
+            - `model (type[BaseTable])`: Model class. **(Required)**
+
+        Returns:
+            - `enabled (bool)`: Whether model opted in.
+
+        """
+
+        return model.__reference_cache__
+
+    def snapshot(
+        self,
+        model: type[BaseTable],
+        session: Session,
+        load: Callable[[], Result],
+    ) -> ReferenceSnapshot | None:
+        """
+        Get Snapshot
+
+        Description:
+            - This is used to get snapshot of a reference table, loading it
+            when missing, outdated or older than `max_age`.
+
+        Args:
+            - `model (type[BaseTable])`: Model class. **(Required)**
+            - `session (Session)`: Session running the read. **(Required)**
+            - `load (Callable)`: Function reading every row of the table.
+            **(Required)**
+
+        Returns:
+            - `snapshot (ReferenceSnapshot)`: Table snapshot or `None` when
+            the read has to go to the database.
+
+        """
+
+        if session.info.get(PENDING_WRITES) or not self._check_version():
+            return None
+
+        # A snapshot loaded while the version changes is left out of the
+        # snapshots of the new version
+        snapshots: dict[str, ReferenceSnapshot] = self._snapshots
+        snapshot: ReferenceSnapshot | None = snapshots.get(model.__tablename__)
+        if snapshot is None or monotonic() - snapshot.loaded_at > self.max_age:
+            snapshot = ReferenceSnapshot(load())
+            snapshots[model.__tablename__] = snapshot
+
+        return snapshot
+
+    def _check_version(self) -> bool:
+        """
+        Check Version
+
+        Description:
+            - This is used to read the version counter when the check
+            interval has passed, snapshots are dropped when it changed.
+            - Snapshots are also dropped when the counter can't be read,
+            changes published meanwhile would otherwise go unnoticed when
+            the counter is readable again.
+
+        Returns:
+            - `usable (bool)`: Whether snapshots are up to date.
+
+        """
+
+        if monotonic() - self._checked_at < self.check_interval:
+            return self._version is not None
+
+        try:
+            version: int = redis.get_int(REFERENCE_CACHE_VERSION_KEY)
+        except RedisError as ex:
+            logger.error(f"Reference cache version check failed: {ex}")
+            with self._lock:
+                self._snapshots = {}
+                self._version = None
+            return False
+
+        with self._lock:
+            if version != self._version:
+                self._snapshots = {}
+                self._version = version
+            self._checked_at = monotonic()
+
+        return True
+
+    def _bump_version(self) -> None:
+        """
+        Bump Version
+
+        Description:
+            - This is used to drop snapshots of this worker and increment
+            the version counter, so other workers reload theirs.
+
+        Returns:
+            - `None`
+
+        """
+
+        try:
+            version: int | None = redis.incr(REFERENCE_CACHE_VERSION_KEY)
+        except RedisError as ex:
+            logger.error(f"Reference cache version bump failed: {ex}")
+            version = None
+
+        with self._lock:
+            self._snapshots = {}
+            self._version = version
+            self._checked_at = monotonic()
+
+    def _mark(self, session: Session, tables: Iterable[Table]) -> None:
+        """
+        Mark Writes
+
+        Description:
+            - This is used to remember that a transaction wrote to a
+            reference table.
+
+        Args:
+            - `session (Session)`: Writing session. **(Required)**
+            - `tables (Iterable[Table])`: Written tables. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        reference_tables: set[Table] = {
+            mapper.local_table
+            for mapper in BaseTable.registry.mappers
+            if self.enabled_for(mapper.class_)
+        }
+        if reference_tables.intersection(tables):
+            session.info[PENDING_WRITES] = True
+
+    def _on_after_flush(self, session: Session, flush_context) -> None:
+        """
+        On After Flush
+
+        Description:
+            - This is used to catch reference rows written through the ORM.
+
+        Args:
+            - `session (Session)`: Flushed session. **(Required)**
+            - `flush_context (UOWTransaction)`: Flush context. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        self._mark(
+            session,
+            {
+                instance.__table__
+                for instance in (
+                    *session.new,
+                    *session.dirty,
+                    *session.deleted,
+                )
+            },
+        )
+
+    def _on_do_orm_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        """
+        On Do ORM Execute
+
+        Description:
+            - This is used to catch reference rows written with insert,
+            update and delete statements.
+
+        Args:
+            - `orm_execute_state (ORMExecuteState)`: Statement execution.
+            **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        if not (
+            orm_execute_state.is_insert
+            or orm_execute_state.is_update
+            or orm_execute_state.is_delete
+        ):
+            return
+
+        self._mark(
+            orm_execute_state.session,
+            (orm_execute_state.statement.table,),
+        )
+
+    def _on_after_commit(self, session: Session) -> None:
+        """
+        On After Commit
+
+        Description:
+            - This is used to publish reference writes of a committed
+            transaction.
+
+        Args:
+            - `session (Session)`: Committed session. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        if session.info.pop(PENDING_WRITES, None):
+            self._bump_version()
+
+    def _on_after_rollback(self, session: Session) -> None:
+        """
+        On After Rollback
+
+        Description:
+            - This is used to forget reference writes of a rolled back
+            transaction.
+
+        Args:
+            - `session (Session)`: Rolled back session. **(Required)**
+
+        Returns:
+            - `None`
+
+        """
+
+        session.info.pop(PENDING_WRITES, None)
+
+
+reference_cache = ReferenceCache()
@@ -10,8 +10,9 @@ from flask_boilerplate.repositories.role_permission import (
     RolePermissionRepository,
 )
 
+from flask_boilerplate.database.unit_of_work import UnitOfWork, after_commit
 from flask_boilerplate.services.base import BaseService
-from flask_boilerplate.services.redis import redis
+from flask_boilerplate.services.permission_cache import permission_cache
 
 
 class RolePermissionService(BaseService):
@@ -35,17 +36,34 @@ class RolePermissionService(BaseService):
         super().__init__(RolePermissionRepository)
 
     def create_record(self, role_id, permission_id):
-        record = self.repository.create_role_permission(role_id, permission_id)
-        if record:
-            redis.delete(role_id)
-            permissions, role_name = self.repository.get_role_permissions(
-                role_id
+        """
+        Create Record
+
+        Description:
+            - This is used to add a permission against a role.
+            - Duplicate check and insert run as one unit of work, the
+            permission is added to cached permissions of the role once the
+            row is committed.
+
+        Args:
+            - `role_id (int)`: Role ID. **(Required)**
+            - `permission_id (int)`: Permission ID. **(Required)**
+
+        Returns:
+            - `record (RolePermissionTable)`: Created record or `None` when
+            the permission is already granted to the role.
+
+        """
+        with UnitOfWork():
+            record = self.repository.create_role_permission(
+                role_id, permission_id
             )
-            if permissions:
-                name = []
-                for perm in permissions:
-                    name.append(perm.permission.permission_name)
-                redis.set(role_name, name)
+            if record:
+                after_commit(
+                    permission_cache.add,
+                    record.role.role_name,
+                    record.permission.permission_name,
+                )
         return record
 
     def get_role_permission(self, role_id):
@@ -0,0 +1,83 @@
+"""
+Micro-benchmark of cache codecs on entity cache rows
+
+Usage: python -m scripts.benchmark_codecs [--number N]
+"""
+
+import argparse
+from functools import partial
+from timeit import repeat
+
+from flask_boilerplate.core.codecs import CODECS, TaggedSerializer
+
+# Rows as written by the entity cache, datetimes are ISO strings
+SYSTEM_COLUMNS = {
+    "id": 42,
+    "version": 3,
+    "created_at": "2024-05-20T09:41:12.123456",
+    "updated_at": "2024-06-02T17:05:48.654321",
+}
+
+PAYLOADS = {
+    "user row": {
+        **SYSTEM_COLUMNS,
+        "first_name": "Zeeshan",
+        "last_name": "Asim",
+        "contact": "+923001234567",
+        "username": "zeeshan",
+        "email": "zeeshan@example.com",
+        "password": "$argon2id$v=19$m=65536,t=3,p=4$"
+        "c2FsdHNhbHRzYWx0$aGFzaGhhc2hoYXNoaGFzaGhhc2hoYXNo",
+        "address": "House 1, Street 2",
+        "city": "Lahore",
+        "state": None,
+        "country": "Pakistan",
+        "postal_code": "54000",
+        "role_id": 2,
+    },
+    "role row": {
+        **SYSTEM_COLUMNS,
+        "role_name": "client",
+        "role_description": "Default role of new users",
+    },
+    "permission row": {
+        **SYSTEM_COLUMNS,
+        "permission_name": "Read User",
+        "permission_description": None,
+    },
+}
+
+
+def benchmark(number: int):
+    print(
+        f"{'codec':<10}{'payload':<14}{'bytes':>8}"
+        f"{'dumps us':>12}{'loads us':>12}"
+    )
+    for name in CODECS:
+        try:
+            serializer = TaggedSerializer(name)
+        except ImportError as ex:
+            print(f"{name:<10}skipped: {ex}")
+            continue
+
+        for label, payload in PAYLOADS.items():
+            encoded = serializer.dumps(payload)
+            assert serializer.loads(encoded) == payload
+
+            # Best of several runs filters out scheduler noise
+            dumps = min(
+                repeat(partial(serializer.dumps, payload), number=number)
+            )
+            loads = min(
+                repeat(partial(serializer.loads, encoded), number=number)
+            )
+            print(
+                f"{name:<10}{label:<14}{len(encoded):>8}"
+                f"{dumps / number * 1e6:>12.2f}{loads / number * 1e6:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10_000)
+    benchmark(parser.parse_args().number)
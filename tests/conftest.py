@@ -0,0 +1,136 @@
+"""
+Test Configuration
+
+Description:
+    - This module sets environment used by tests, so the application is
+    configured without a `.env` file, with fakeredis instead of Redis.
+    - A throwaway RSA key pair is generated for signing test tokens.
+    - API tests get an application backed by an in-memory SQLite database,
+    seeded with default roles and permissions.
+
+"""
+
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+private_key = rsa.generate_private_key(public_exponent=65_537, key_size=2_048)
+
+for name, value in {
+    "ENV": "testing",
+    "DATABASE": "sqlite",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_USER": "user",
+    "DB_PASSWORD": "password",
+    "DB_NAME": "flask_boilerplate",
+    "CORS_ALLOW_ORIGINS": "*",
+    "CORS_ALLOW_METHODS": "*",
+    "CORS_ALLOW_HEADERS": "*",
+    "CORS_ALLOW_CREDENTIALS": "true",
+    "PRIVATE_KEY": private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode(),
+    "PUBLIC_KEY": private_key.public_key()
+    .public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    .decode(),
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    Application
+
+    Description:
+        - This is used to create application with every namespace, backed by
+        an in-memory SQLite database holding default roles, permissions and
+        an admin user.
+
+    """
+
+    from flask import Flask
+    from flask_restx import Api
+
+    from flask_boilerplate.apis.permission import ns_permission
+    from flask_boilerplate.apis.role import ns_role
+    from flask_boilerplate.apis.role_permission import ns_role_permission
+    from flask_boilerplate.apis.user import ns_user
+    from flask_boilerplate.core.middlewares import ExceptionHandler
+    from flask_boilerplate.database.base import db
+    from flask_boilerplate.database.initialize_database import (
+        add_admin_permissions,
+        add_permissions,
+        add_roles,
+    )
+    from flask_boilerplate.models.user import UserTable
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    ExceptionHandler(app)
+    api = Api(app=app)
+    for namespace in (ns_role, ns_user, ns_permission, ns_role_permission):
+        api.add_namespace(namespace)
+    db.init_app(app=app)
+
+    with app.app_context():
+        db.create_all()
+        add_permissions()
+        add_roles()
+        add_admin_permissions()
+        db.session.add(
+            UserTable(
+                first_name="Admin",
+                last_name="User",
+                username="admin",
+                email="admin@example.com",
+                password="not-a-hash",
+                role_id=1,
+            )
+        )
+        db.session.commit()
+
+        yield app
+
+
+@pytest.fixture
+def client(app):
+    """
+    Test Client
+
+    Description:
+        - This is used to send requests to the application.
+
+    """
+
+    return app.test_client()
+
+
+@pytest.fixture
+def headers():
+    """
+    Admin Headers
+
+    Description:
+        - This is used to authorize requests as the admin user.
+
+    """
+
+    from flask_boilerplate.core.key_ring import key_ring
+
+    token: str = key_ring.encode(
+        {"sub": "1", "exp": datetime.now(tz=UTC) + timedelta(hours=1)}
+    )
+
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,159 @@
+"""
+Bulk Endpoint Tests
+
+Description:
+    - This module tests bulk create, update and delete endpoints, including
+    partial success of bulk create.
+
+"""
+
+from http import HTTPStatus
+
+
+def create_permissions(client, headers, *names) -> list[int]:
+    """
+    Create Permissions
+
+    Description:
+        - This is used to add permissions in bulk and get their IDs.
+
+    """
+
+    response = client.post(
+        "/permission/bulk",
+        json=[{"permission_name": name} for name in names],
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.CREATED
+
+    return [permission["id"] for permission in response.json["data"]]
+
+
+def test_create_all_valid_returns_created(client, headers):
+    response = client.post(
+        "/role/bulk",
+        json=[{"role_name": "bulk editor"}, {"role_name": "bulk viewer"}],
+        headers=headers,
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json["success"] is True
+    assert response.json["errors"] == []
+    assert [role["role_name"] for role in response.json["data"]] == [
+        "bulk editor",
+        "bulk viewer",
+    ]
+
+
+def test_create_partial_success_returns_multi_status(client, headers):
+    response = client.post(
+        "/role/bulk",
+        json=[
+            {"role_name": "bulk author"},
+            {"role_name": "admin"},
+            {"role_name": "bulk author"},
+            {"role_name": "bulk reviewer"},
+        ],
+        headers=headers,
+    )
+
+    assert response.status_code == HTTPStatus.MULTI_STATUS
+    assert response.json["success"] is False
+    assert [error["index"] for error in response.json["errors"]] == [1, 2]
+    assert [role["role_name"] for role in response.json["data"]] == [
+        "bulk author",
+        "bulk reviewer",
+    ]
+
+    names = {
+        role["role_name"]
+        for role in client.get(
+            "/role/", query_string={"limit": 100}, headers=headers
+        ).json["data"]
+    }
+    assert {"bulk author", "bulk reviewer"} <= names
+
+
+def test_update_selected_rows(client, headers):
+    first, second, third = create_permissions(
+        client, headers, "Bulk Update 1", "Bulk Update 2", "Bulk Update 3"
+    )
+
+    response = client.patch(
+        "/permission/bulk",
+        json={"ids": [first, third], "data": {"permission_description": "x"}},
+        headers=headers,
+    )
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    assert sorted(row["id"] for row in response.json["data"]) == [
+        first,
+        third,
+    ]
+    assert all(
+        row["permission_description"] == "x" for row in response.json["data"]
+    )
+    assert (
+        client.get(f"/permission/{second}", headers=headers).json["data"][
+            "permission_description"
+        ]
+        is None
+    )
+
+
+def test_update_of_unique_field_is_rejected(client, headers):
+    (permission_id,) = create_permissions(client, headers, "Bulk Unique")
+
+    response = client.patch(
+        "/permission/bulk",
+        json={"ids": [permission_id], "data": {"permission_name": "Taken"}},
+        headers=headers,
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_delete_returns_deleted_ids_only(client, headers):
+    first, second = create_permissions(
+        client, headers, "Bulk Delete 1", "Bulk Delete 2"
+    )
+
+    response = client.delete(
+        "/permission/bulk", json={"ids": [first, 999_999]}, headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json["data"] == [first]
+    assert (
+        client.get(f"/permission/{first}", headers=headers).status_code
+        == HTTPStatus.NOT_FOUND
+    )
+    assert (
+        client.get(f"/permission/{second}", headers=headers).status_code
+        == HTTPStatus.OK
+    )
+
+
+def test_delete_by_filter(client, headers):
+    create_permissions(client, headers, "Bulk Filter 1", "Bulk Filter 2")
+
+    response = client.delete(
+        "/permission/bulk",
+        json={
+            "filter": {"permission_name": ["Bulk Filter 1", "Bulk Filter 2"]}
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json["data"]) == 2
+
+
+def test_delete_with_malformed_filter_is_rejected(client, headers):
+    response = client.delete(
+        "/permission/bulk",
+        json={"filter": {"permission_name": {"nested": "value"}}},
+        headers=headers,
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
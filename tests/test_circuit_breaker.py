@@ -0,0 +1,148 @@
+"""
+Circuit Breaker Tests
+
+Description:
+    - This module tests state transitions of the circuit breaker and how the
+    Redis service reports an open circuit.
+
+"""
+
+from unittest import mock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from flask_boilerplate.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from flask_boilerplate.services.redis import RedisUnavailableError, redis
+
+
+@pytest.fixture
+def clock():
+    """
+    Clock
+
+    Description:
+        - This is used to set the time seen by the breaker.
+
+    """
+
+    with mock.patch(
+        "flask_boilerplate.core.circuit_breaker.monotonic"
+    ) as monotonic:
+        monotonic.return_value = 100.0
+        yield monotonic
+
+
+@pytest.fixture
+def breaker(clock):
+    """
+    Breaker
+
+    Description:
+        - This is used to get a closed breaker opening after two failures.
+
+    """
+
+    return CircuitBreaker(
+        name="test",
+        failure_threshold=2,
+        reset_timeout=5,
+        exceptions=(ConnectionError,),
+    )
+
+
+def fail():
+    raise ConnectionError("down")
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+
+
+def test_opens_after_consecutive_failures(breaker):
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    assert breaker.state == breaker.CLOSED
+
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    assert breaker.state == breaker.OPEN
+    assert not breaker.available
+
+
+def test_success_resets_failure_count(breaker):
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+
+    assert breaker.call(lambda: "ok") == "ok"
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+
+    assert breaker.state == breaker.CLOSED
+
+
+def test_open_circuit_rejects_calls_without_running_them(breaker):
+    trip(breaker)
+    function = mock.Mock()
+
+    with pytest.raises(CircuitOpenError):
+        breaker.call(function)
+
+    function.assert_not_called()
+
+
+def test_probe_after_reset_timeout_closes_circuit(breaker, clock):
+    trip(breaker)
+
+    clock.return_value += breaker.reset_timeout
+    assert breaker.available
+
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == breaker.CLOSED
+
+
+def test_failed_probe_opens_circuit_again(breaker, clock):
+    trip(breaker)
+    clock.return_value += breaker.reset_timeout
+
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+
+    assert breaker.state == breaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "ok")
+
+
+def test_only_one_probe_runs_while_half_open(breaker, clock):
+    trip(breaker)
+    clock.return_value += breaker.reset_timeout
+
+    def probe():
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "ok")
+        return "ok"
+
+    assert breaker.call(probe) == "ok"
+
+
+def test_other_errors_do_not_count_as_failures(breaker):
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(KeyError):
+            breaker.call(lambda: {}["missing"])
+
+    assert breaker.state == breaker.CLOSED
+
+
+def test_redis_reports_open_circuit_as_redis_error(breaker):
+    trip(breaker)
+
+    with (
+        mock.patch.object(redis, "breaker", breaker),
+        pytest.raises(RedisUnavailableError),
+    ):
+        redis.get_int("key")
@@ -0,0 +1,122 @@
+"""
+ETag Tests
+
+Description:
+    - This module tests `If-Match` parsing and conditional updates of rows
+    by version.
+
+"""
+
+from http import HTTPStatus
+from itertools import count
+
+import pytest
+from werkzeug.exceptions import PreconditionFailed
+
+from flask_boilerplate.core.etag import if_match_versions, make_etag
+from flask_boilerplate.services.permission import PermissionService
+
+permission_numbers = count()
+
+
+@pytest.mark.parametrize(
+    ("header", "versions"),
+    [
+        (None, None),
+        ("*", None),
+        ('"3"', [3]),
+        ('"3", "1"', [1, 3]),
+        ('W/"2", "5"', [5]),
+        ('"abc", "7"', [7]),
+    ],
+)
+def test_if_match_versions(app, header, versions):
+    headers: dict = {"If-Match": header} if header else {}
+    with app.test_request_context(headers=headers):
+        assert if_match_versions() == versions
+
+
+@pytest.mark.parametrize("header", ['W/"3"', '"abc"', 'W/"1", "x"'])
+def test_if_match_without_usable_tag_fails(app, header):
+    with (
+        app.test_request_context(headers={"If-Match": header}),
+        pytest.raises(PreconditionFailed),
+    ):
+        if_match_versions()
+
+
+@pytest.fixture
+def permission(app):
+    """
+    Permission
+
+    Description:
+        - This is used to get a new permission row.
+
+    """
+
+    return PermissionService().create_row(
+        {"permission_name": f"ETag {next(permission_numbers)}"}
+    )
+
+
+def test_update_of_accepted_version_applies(permission):
+    row = PermissionService().update_row(
+        entity_id=permission["id"],
+        entity={"permission_description": "updated"},
+        versions=[permission["version"]],
+    )
+
+    assert row["permission_description"] == "updated"
+    assert row["version"] == permission["version"] + 1
+
+
+def test_update_of_other_version_fails(permission):
+    PermissionService().update_row(
+        entity_id=permission["id"], entity={"permission_description": "new"}
+    )
+
+    with pytest.raises(PreconditionFailed):
+        PermissionService().update_row(
+            entity_id=permission["id"],
+            entity={"permission_description": "stale"},
+            versions=[permission["version"]],
+        )
+
+
+def test_update_of_missing_row_returns_none(app):
+    assert (
+        PermissionService().update_row(
+            entity_id=999_999, entity={}, versions=[1]
+        )
+        is None
+    )
+
+
+def test_patch_with_stale_etag_returns_precondition_failed(
+    client, headers, permission
+):
+    url: str = f"/permission/{permission['id']}"
+    current: str = make_etag(permission["version"])
+    updated: str = make_etag(permission["version"] + 1)
+
+    response = client.patch(
+        url,
+        json={"permission_description": "first"},
+        headers={**headers, "If-Match": current},
+    )
+    assert response.status_code == HTTPStatus.ACCEPTED
+
+    response = client.patch(
+        url,
+        json={"permission_description": "second"},
+        headers={**headers, "If-Match": current},
+    )
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+
+    response = client.patch(
+        url,
+        json={"permission_description": "second"},
+        headers={**headers, "If-Match": f'"999", {current}, {updated}'},
+    )
+    assert response.status_code == HTTPStatus.ACCEPTED
@@ -0,0 +1,48 @@
+"""
+Sparse Fieldset Tests
+
+Description:
+    - This module tests that read endpoints only return fields requested
+    with `fields=`.
+
+"""
+
+from http import HTTPStatus
+
+
+def test_single_record_keeps_requested_fields(client, headers):
+    response = client.get(
+        "/role/1", query_string={"fields": "role_name"}, headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json["data"] == {"role_name": "admin"}
+
+
+def test_list_keeps_requested_fields(client, headers):
+    response = client.get(
+        "/role/", query_string={"fields": "id,role_name"}, headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert {"id": 1, "role_name": "admin"} in response.json["data"]
+    assert all(
+        set(role) == {"id", "role_name"} for role in response.json["data"]
+    )
+
+
+def test_unknown_field_is_rejected(client, headers):
+    response = client.get(
+        "/role/1", query_string={"fields": "password"}, headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_permission_list_leaves_out_null_keys(client, headers):
+    response = client.get(
+        "/permission/", query_string={"limit": 100}, headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert set(response.json) == {"success", "data"}
@@ -0,0 +1,60 @@
+"""
+Pagination Tests
+
+Description:
+    - This module tests keyset pagination of list endpoints.
+
+"""
+
+from http import HTTPStatus
+
+
+def read_pages(client, headers, limit) -> list[list[int]]:
+    """
+    Read Pages
+
+    Description:
+        - This is used to follow cursors until the last role page.
+
+    """
+
+    pages: list[list[int]] = []
+    cursor: str | None = None
+    while True:
+        query: dict = {"limit": limit, **({"after": cursor} if cursor else {})}
+        response = client.get("/role/", query_string=query, headers=headers)
+        assert response.status_code == HTTPStatus.OK
+        pages.append([role["id"] for role in response.json["data"]])
+        cursor = response.json["next_cursor"]
+        if not cursor:
+            return pages
+
+
+def test_pages_cover_every_row_once(client, headers):
+    for index in range(5):
+        client.post(
+            "/role/", json={"role_name": f"paged {index}"}, headers=headers
+        )
+
+    (everything,) = read_pages(client, headers, limit=100)
+    pages: list[list[int]] = read_pages(client, headers, limit=2)
+
+    assert all(len(page) <= 2 for page in pages)
+    assert [role_id for page in pages for role_id in page] == everything
+    assert everything == sorted(everything)
+
+
+def test_malformed_cursor_is_rejected(client, headers):
+    response = client.get(
+        "/role/", query_string={"after": "not a cursor"}, headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_limit_above_maximum_is_rejected(client, headers):
+    response = client.get(
+        "/role/", query_string={"limit": 1_000}, headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
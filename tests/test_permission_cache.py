@@ -0,0 +1,199 @@
+"""
+Permission Cache Tests
+
+Description:
+    - This module tests the Lua scripts maintaining role permission sets,
+    run against fakeredis.
+
+"""
+
+from unittest import mock
+
+import pytest
+
+from flask_boilerplate.core.config import PERMISSION_CACHE_CHANNEL
+from flask_boilerplate.services.permission_cache import (
+    EMPTY_ROLE_MARKER,
+    INVALIDATE_ALL,
+    permission_cache,
+    role_permissions_key,
+)
+from flask_boilerplate.services.redis import redis
+
+
+@pytest.fixture(autouse=True)
+def empty_redis():
+    """
+    Empty Redis
+
+    Description:
+        - This is used to start every test with an empty Redis and local
+        cache.
+
+    """
+
+    redis.connection.flushall()
+    permission_cache._local.clear()
+    yield
+    redis.connection.flushall()
+
+
+@pytest.fixture
+def messages():
+    """
+    Invalidation Messages
+
+    Description:
+        - This is used to collect messages published on invalidation
+        channel.
+
+    """
+
+    pubsub = redis.connection.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(PERMISSION_CACHE_CHANNEL)
+    # Reads the ignored subscribe confirmation
+    pubsub.get_message(timeout=0.01)
+
+    def read() -> list[str]:
+        received: list[str] = []
+        while message := pubsub.get_message(timeout=0.01):
+            received.append(message["data"])
+        return received
+
+    yield read
+    pubsub.close()
+
+
+def members(role_name) -> set[str]:
+    """
+    Members
+
+    Description:
+        - This is used to read permission set of a role.
+
+    """
+
+    return redis.smembers(role_permissions_key(role_name))
+
+
+def test_replace_overwrites_existing_role(messages):
+    redis.sadd(role_permissions_key("admin"), "Old Permission")
+
+    permission_cache.set("admin", ["Read User", "Update User"])
+
+    assert members("admin") == {"Read User", "Update User"}
+    assert messages() == ["admin"]
+
+
+def test_replace_creates_missing_role():
+    permission_cache.set("viewer", ["Read User"])
+
+    assert members("viewer") == {"Read User"}
+
+
+def test_replace_stores_marker_for_role_without_permissions(messages):
+    permission_cache.set("client", [])
+
+    assert members("client") == {EMPTY_ROLE_MARKER}
+    assert messages() == ["client"]
+
+
+def test_replace_unchanged_role_publishes_nothing(messages):
+    permission_cache.set("admin", ["Read User", "Update User"])
+    permission_cache.set("client", [])
+    messages()
+
+    permission_cache.set("admin", ["Update User", "Read User"])
+    permission_cache.set("client", [])
+
+    assert messages() == []
+
+
+def test_get_serves_empty_role_without_rebuild():
+    permission_cache.set("client", [])
+
+    with mock.patch.object(permission_cache, "_rebuild") as rebuild:
+        assert permission_cache.get("client") is None
+        assert permission_cache.get("client") is None
+
+    rebuild.assert_not_called()
+
+
+def test_rebuild_fills_missing_role_without_publishing(messages):
+    with mock.patch(
+        "flask_boilerplate.services.permission_cache."
+        "RolePermissionRepository"
+    ) as repository:
+        repository.return_value.get_role_permission_names.return_value = []
+        assert permission_cache.get("client") is None
+
+    assert members("client") == {EMPTY_ROLE_MARKER}
+    assert messages() == []
+
+
+def test_replace_sends_permissions_in_chunks():
+    permissions: list[str] = [f"Permission {index}" for index in range(2500)]
+
+    permission_cache.set("admin", permissions)
+
+    assert members("admin") == set(permissions)
+
+
+def test_add_extends_existing_role(messages):
+    redis.sadd(role_permissions_key("admin"), "Read User")
+
+    assert permission_cache.add("admin", "Update User", "Read User")
+
+    assert members("admin") == {"Read User", "Update User"}
+    assert messages() == ["admin"]
+
+
+def test_add_without_new_permission_publishes_nothing(messages):
+    redis.sadd(role_permissions_key("admin"), "Read User")
+
+    assert permission_cache.add("admin", "Read User")
+
+    assert messages() == []
+
+
+def test_add_leaves_missing_role_alone(messages):
+    assert not permission_cache.add("viewer", "Read User")
+
+    assert redis.key_type(role_permissions_key("viewer")) == "none"
+    assert messages() == []
+
+
+def test_add_replaces_empty_role_marker():
+    permission_cache.set("client", [])
+
+    assert permission_cache.add("client", "Read User")
+
+    assert members("client") == {"Read User"}
+
+
+def test_remove_from_one_role(messages):
+    redis.sadd(role_permissions_key("admin"), "Read User", "Update User")
+
+    permission_cache.remove("admin", "Update User")
+
+    assert members("admin") == {"Read User"}
+    assert messages() == ["admin"]
+
+
+def test_remove_from_several_roles_skips_missing_role(messages):
+    redis.sadd(role_permissions_key("admin"), "Read User", "Update User")
+    redis.sadd(role_permissions_key("editor"), "Update User")
+
+    permission_cache.remove(["admin", "editor", "viewer"], "Update User")
+
+    assert members("admin") == {"Read User"}
+    assert members("editor") == {EMPTY_ROLE_MARKER}
+    assert redis.key_type(role_permissions_key("viewer")) == "none"
+    assert messages() == [INVALIDATE_ALL]
+
+
+def test_remove_from_missing_role_publishes_nothing(messages):
+    permission_cache.remove("viewer", "Read User")
+
+    assert redis.key_type(role_permissions_key("viewer")) == "none"
+    assert messages() == []
@@ -0,0 +1,78 @@
+"""
+Reference Cache Tests
+
+Description:
+    - This module tests that reference table snapshots are only served by
+    the explicit reference reads, ORM reads keep returning instances.
+
+"""
+
+import pytest
+from sqlalchemy import Row, event
+
+from flask_boilerplate.database.base import db
+from flask_boilerplate.models.role import RoleTable
+from flask_boilerplate.repositories.role import RoleRepository
+from flask_boilerplate.services.reference_cache import reference_cache
+
+
+@pytest.fixture
+def queries(app):
+    """
+    Queries
+
+    Description:
+        - This is used to collect statements sent to the database, with
+        fresh snapshots.
+
+    """
+
+    statements: list[str] = []
+
+    def collect(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    reference_cache._checked_at = 0.0
+    reference_cache._snapshots = {}
+    event.listen(db.engine, "before_cursor_execute", collect)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", collect)
+
+
+def test_orm_reads_return_instances(queries):
+    repository = RoleRepository()
+    repository.read_reference_rows()
+    queries.clear()
+
+    role = repository.read_by_column("role_name", "admin")
+    roles = repository.read_all()
+
+    assert isinstance(role, RoleTable)
+    assert all(isinstance(role, RoleTable) for role in roles)
+    assert len(queries) == 2
+
+
+def test_reference_reads_are_served_from_snapshot(queries):
+    repository = RoleRepository()
+
+    rows = repository.read_reference_rows()
+    row = repository.read_reference_row("role_name", "admin")
+
+    assert len(queries) == 1
+    assert all(isinstance(row, Row) for row in rows)
+    assert row.id == 1
+    assert repository.read_reference_row("role_name", "missing") is None
+    assert len(queries) == 1
+
+
+def test_reference_reads_query_inside_writing_transaction(queries):
+    repository = RoleRepository()
+    repository.read_reference_rows()
+
+    db.session.add(RoleTable(role_name="reference pending"))
+    db.session.flush()
+    row = repository.read_reference_row("role_name", "reference pending")
+    db.session.rollback()
+
+    assert isinstance(row, Row)
+    assert row.role_name == "reference pending"
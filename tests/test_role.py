@@ -0,0 +1,107 @@
+"""
+Role Update Tests
+
+Description:
+    - This module tests that a role update reads the previous role name in
+    the UPDATE statement itself, and that a rename invalidates cached
+    permissions of both names.
+
+"""
+
+from http import HTTPStatus
+from unittest import mock
+
+from sqlalchemy.dialects import postgresql
+
+from flask_boilerplate.repositories.role import RoleRepository
+
+
+def test_previous_values_are_read_by_the_update_statement(app):
+    with mock.patch(
+        "flask_boilerplate.repositories.base.db.session.execute"
+    ) as execute:
+        execute.return_value.mappings.return_value.first.return_value = None
+        RoleRepository().update_row(
+            entity_id=1,
+            entity={"role_name": "owner"},
+            versions=[1],
+            previous=["role_name"],
+        )
+
+    (statement,), _ = execute.call_args
+    sql: str = " ".join(
+        str(statement.compile(dialect=postgresql.dialect())).split()
+    )
+
+    assert execute.call_count == 1
+    assert sql.startswith("WITH previous AS (SELECT role.id")
+    assert "FOR UPDATE) UPDATE role SET role_name=" in sql
+    assert "FROM previous WHERE role.id = previous.id" in sql
+    assert sql.endswith("previous.role_name AS previous_role_name")
+
+
+def updated_role(role_name, previous_role_name) -> dict:
+    """
+    Updated Role
+
+    Description:
+        - This is used to build a role row returned by an update.
+
+    """
+
+    return {
+        "id": 1,
+        "version": 2,
+        "created_at": None,
+        "updated_at": None,
+        "role_name": role_name,
+        "role_description": None,
+        "previous_role_name": previous_role_name,
+    }
+
+
+def put_role(client, headers, row):
+    """
+    Put Role
+
+    Description:
+        - This is used to update a role, with the update statement replaced
+        by the given row.
+
+    """
+
+    with (
+        mock.patch(
+            "flask_boilerplate.apis.role.RoleService.update_row",
+            return_value=row,
+        ) as update_row,
+        mock.patch(
+            "flask_boilerplate.apis.role.permission_cache"
+        ) as permission_cache,
+    ):
+        response = client.put(
+            "/role/1", json={"role_name": row["role_name"]}, headers=headers
+        )
+
+    assert update_row.call_args.kwargs["previous"] == ["role_name"]
+
+    return response, permission_cache
+
+
+def test_rename_invalidates_both_names(client, headers):
+    response, permission_cache = put_role(
+        client, headers, updated_role("owner", "admin")
+    )
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    assert "previous_role_name" not in response.json["data"]
+    permission_cache.delete_many.assert_called_once_with(["admin", "owner"])
+
+
+def test_update_keeping_name_invalidates_nothing(client, headers):
+    response, permission_cache = put_role(
+        client, headers, updated_role("admin", "admin")
+    )
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    permission_cache.delete_many.assert_not_called()
@@ -0,0 +1,105 @@
+"""
+Token Cache Tests
+
+Description:
+    - This module tests that verified token claims are cached until the
+    token's `exp` claim.
+
+"""
+
+from unittest import mock
+
+import pytest
+
+from flask_boilerplate.core.cache import TTLCache
+from flask_boilerplate.decorator.authorization import (
+    decode_jwt_token,
+    token_cache,
+)
+
+NOW: float = 1_700_000_000.0
+CLAIMS: dict = {"sub": "1", "exp": NOW + 60}
+
+
+@pytest.fixture
+def key_ring():
+    """
+    Key Ring
+
+    Description:
+        - This is used to count signature checks, starting with an empty
+        token cache.
+
+    """
+
+    token_cache.clear()
+    with mock.patch(
+        "flask_boilerplate.decorator.authorization.key_ring"
+    ) as key_ring:
+        key_ring.decode.side_effect = lambda token: dict(CLAIMS)
+        yield key_ring
+    token_cache.clear()
+
+
+@pytest.fixture
+def clock():
+    """
+    Clock
+
+    Description:
+        - This is used to set the time seen by the cache.
+
+    """
+
+    with mock.patch("flask_boilerplate.core.cache.time") as time:
+        time.return_value = NOW
+        yield time
+
+
+def test_token_is_verified_once(key_ring, clock):
+    assert decode_jwt_token("token") == CLAIMS
+    assert decode_jwt_token("token") == CLAIMS
+
+    key_ring.decode.assert_called_once_with("token")
+
+
+def test_token_is_verified_again_at_exp(key_ring, clock):
+    decode_jwt_token("token")
+
+    clock.return_value = CLAIMS["exp"] - 1
+    decode_jwt_token("token")
+    assert key_ring.decode.call_count == 1
+
+    clock.return_value = CLAIMS["exp"]
+    decode_jwt_token("token")
+    assert key_ring.decode.call_count == 2
+
+
+def test_tokens_are_cached_separately(key_ring, clock):
+    decode_jwt_token("first")
+    decode_jwt_token("second")
+
+    assert key_ring.decode.call_count == 2
+
+
+def test_invalid_token_is_not_cached(key_ring, clock):
+    key_ring.decode.side_effect = ValueError("Invalid Token")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            decode_jwt_token("token")
+
+    assert key_ring.decode.call_count == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_size=2)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+
+    cache.set("third", 3)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
@@ -0,0 +1,158 @@
+"""
+Unit of Work Tests
+
+Description:
+    - This module tests that nested units of work commit once and run their
+    after-commit callbacks only when the outermost unit commits.
+
+"""
+
+from unittest import mock
+
+import pytest
+
+from flask_boilerplate.database.base import db
+from flask_boilerplate.database.unit_of_work import (
+    UnitOfWork,
+    after_commit,
+    commit,
+    in_unit_of_work,
+)
+from flask_boilerplate.models.role import RoleTable
+
+
+@pytest.fixture
+def session(app):
+    """
+    Session
+
+    Description:
+        - This is used to run a test in a fresh application context, with
+        commits counted.
+
+    """
+
+    with (
+        app.app_context(),
+        mock.patch.object(
+            db.session, "commit", wraps=db.session.commit
+        ) as session_commit,
+    ):
+        yield session_commit
+        db.session.rollback()
+
+
+def add_role(role_name) -> None:
+    """
+    Add Role
+
+    Description:
+        - This is used to write a role the way repositories do.
+
+    """
+
+    db.session.add(RoleTable(role_name=role_name))
+    commit()
+
+
+def role_exists(role_name) -> bool:
+    """
+    Role Exists
+
+    Description:
+        - This is used to check whether a role was committed.
+
+    """
+
+    return (
+        db.session.query(RoleTable).filter_by(role_name=role_name).first()
+        is not None
+    )
+
+
+def test_nested_units_commit_once_at_outermost_exit(session):
+    with UnitOfWork():
+        add_role("unit outer")
+        with UnitOfWork():
+            add_role("unit inner")
+            assert in_unit_of_work()
+        assert session.call_count == 0
+
+    assert session.call_count == 1
+    assert not in_unit_of_work()
+    assert role_exists("unit outer") and role_exists("unit inner")
+
+
+def test_callbacks_run_in_order_after_commit(session):
+    calls: list[str] = []
+
+    def callback(name) -> None:
+        assert session.call_count == 1
+        calls.append(name)
+
+    with UnitOfWork():
+        after_commit(callback, "outer")
+        with UnitOfWork():
+            after_commit(callback, name="inner")
+        assert calls == []
+
+    assert calls == ["outer", "inner"]
+
+
+def test_exception_rolls_back_and_drops_callbacks(session):
+    callback = mock.Mock()
+
+    with pytest.raises(ValueError), UnitOfWork():
+        add_role("unit rolled back")
+        after_commit(callback)
+        with UnitOfWork():
+            raise ValueError("failed")
+
+    callback.assert_not_called()
+    assert session.call_count == 0
+    assert not role_exists("unit rolled back")
+    assert not in_unit_of_work()
+
+
+def test_failed_commit_drops_callbacks(session):
+    callback = mock.Mock()
+    session.side_effect = RuntimeError("commit failed")
+
+    with pytest.raises(RuntimeError), UnitOfWork():
+        after_commit(callback)
+
+    callback.assert_not_called()
+
+
+def test_failing_callback_is_logged_and_others_still_run(session):
+    callback = mock.Mock()
+
+    with (
+        mock.patch("flask_boilerplate.database.unit_of_work.logger") as logger,
+        UnitOfWork(),
+    ):
+        after_commit(mock.Mock(side_effect=RuntimeError("cache down")))
+        after_commit(callback, "next")
+
+    callback.assert_called_once_with("next")
+    logger.error.assert_called_once()
+
+
+def test_callback_outside_unit_runs_right_away(session):
+    callback = mock.Mock()
+
+    after_commit(callback, 1, key="value")
+
+    callback.assert_called_once_with(1, key="value")
+
+
+def test_unit_works_as_decorator(session):
+    @UnitOfWork()
+    def write() -> None:
+        add_role("unit decorated")
+        assert session.call_count == 0
+
+    write()
+
+    assert session.call_count == 1
+    assert role_exists("unit decorated")